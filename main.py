@@ -79,6 +79,9 @@ def load_config(config_path: str = None, args=None, project_root: str = None) ->
     if args:
         if args.dry_run:
             config.dry_run_mode = True
+        if getattr(args, "dry_run_patch", None):
+            config.dry_run_mode = True
+            config.dry_run_patch_file = args.dry_run_patch
         if args.quiet:
             config.log_level = "ERROR"
             config.colored_output = False
@@ -368,6 +371,12 @@ Examples:
         action="store_true",
         help="Enable dry run mode (preview changes without modifying files)",
     )
+    parser.add_argument(
+        "--dry-run-patch",
+        metavar="PATCH_FILE",
+        help="Dry run that writes all planned changes to PATCH_FILE as a unified diff "
+        "(apply later with 'git apply PATCH_FILE' from the project root)",
+    )
     parser.add_argument("--quiet", action="store_true", help="Suppress non-error output")
     parser.add_argument("--log-file", help="Log to file (in addition to console)")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
@@ -27,7 +27,7 @@ __author__ = "LinkWatcher Team"
 
 from .database import LinkDatabase, LinkDatabaseInterface  # noqa: E402
 from .logging import LogLevel, LogTimer, get_logger, setup_logging, with_context  # noqa: E402
-from .models import FileOperation, LinkReference  # noqa: E402
+from .models import FileOperation, LinkReference, PlannedEdit  # noqa: E402
 from .parser import LinkParser  # noqa: E402
 from .path_resolver import PathResolver  # noqa: E402
 from .service import LinkWatcherService  # noqa: E402
@@ -43,6 +43,7 @@ __all__ = [
     "PathResolver",
     "LinkReference",
     "FileOperation",
+    "PlannedEdit",
     # Validation
     "LinkValidator",
     # Logging
@@ -52,18 +52,21 @@ class LinkWatcherConfig:
 
     Configuration groups:
         - **File monitoring**: ``monitored_extensions``, ``ignored_directories``
-        - **Parsers**: ``enable_<format>_parser`` flags
-        - **Update behavior**: ``create_backups``, ``dry_run_mode``, ``atomic_updates``
+        - **Parsers**: ``enable_<format>_parser`` flags, ``python_parser_engine``
+        - **Update behavior**: ``create_backups``, ``dry_run_mode``,
+          ``dry_run_patch_file``, ``atomic_updates``, ``update_durability``,
+          ``update_group_commit``, ``update_journal_file``
         - **Performance**: ``max_file_size_mb``, ``initial_scan_enabled``,
-          ``scan_progress_interval``
+          ``scan_progress_interval``, ``update_worker_threads``
         - **Logging**: ``log_level``, ``colored_output``, ``log_file``,
           ``json_logs``, etc.
         - **Validation**: ``validation_extensions``,
           ``validation_extra_ignored_dirs``,
           ``validation_ignored_patterns``, ``validation_ignore_file``,
           ``validation_output_dir``, ``path_resolution_overrides``
-        - **Move detection timing**: ``move_detect_delay``,
-          ``dir_move_max_timeout``, ``dir_move_settle_delay``
+        - **Move detection**: ``move_detect_delay``, ``move_detect_min_delay``,
+          ``dir_move_max_timeout``, ``dir_move_settle_delay``,
+          ``dir_move_worker_threads``, ``move_detect_fingerprints``
     """
 
     # File monitoring settings
@@ -146,16 +149,34 @@ class LinkWatcherConfig:
     enable_python_parser: bool = True
     enable_powershell_parser: bool = True
     enable_generic_parser: bool = True
+    # Python parser engine: "regex" (line scanner) or "tokenize" (stdlib
+    # tokenizer, exact string/comment/import positions; slower on < 3.12).
+    python_parser_engine: str = "regex"
 
     # Update behavior
     create_backups: bool = False
     dry_run_mode: bool = False
+    # In dry-run mode, stream planned rewrites to this unified-diff file
+    # (relative to the project root) for a later `git apply`.  None = log only.
+    dry_run_patch_file: Optional[str] = None
     atomic_updates: bool = True
+    # fast = temp write + rename; safe = fsync file before rename;
+    # strict = also fsync the parent directory after rename.
+    update_durability: str = "fast"
+    # Stage all temp files of one update batch, then rename them together.
+    update_group_commit: bool = False
+    # Transaction journal for multi-file updates (relative to the project
+    # root); replaces per-file .bak copies.  None = disabled.
+    update_journal_file: Optional[str] = None
 
     # Performance settings
     max_file_size_mb: int = 10
     initial_scan_enabled: bool = True
     scan_progress_interval: int = 50
+    # Upper bound on worker threads for independent per-file rewrites
+    # (outward-link updates inside files of a moved directory, and
+    # referring files rewritten by LinkUpdater).  1 = serial processing.
+    update_worker_threads: int = 4
 
     # Logging settings
     log_level: str = "INFO"
@@ -242,8 +263,19 @@ class LinkWatcherConfig:
 
     # Move detection timing
     move_detect_delay: float = 10.0
+    # Floor for the adaptive move-detection window: MoveDetector shrinks its
+    # window from move_detect_delay towards the observed delete->create
+    # latency (high percentile), never below this.  Values >= the delay
+    # (clamped to it) disable adaptation.
+    move_detect_min_delay: float = 2.0
     dir_move_max_timeout: float = 300.0
     dir_move_settle_delay: float = 5.0
+    # Size of DirectoryMoveDetector's pool for confirmed directory moves
+    dir_move_worker_threads: int = 4
+    # Keep a size + head/tail-hash fingerprint per monitored/known-target
+    # file so a delete+create pair with *different* names (a rename) is
+    # still correlated as a move.
+    move_detect_fingerprints: bool = True
 
     @classmethod
     def from_file(cls, config_path: str) -> "LinkWatcherConfig":
@@ -436,12 +468,30 @@ class LinkWatcherConfig:
         if self.scan_progress_interval <= 0:
             issues.append("scan_progress_interval must be positive")
 
+        # Check write durability mode
+        valid_durability_modes = ["fast", "safe", "strict"]
+        if self.update_durability not in valid_durability_modes:
+            issues.append(f"update_durability must be one of: {valid_durability_modes}")
+
+        # Check Python parser engine
+        valid_python_engines = ["regex", "tokenize"]
+        if self.python_parser_engine not in valid_python_engines:
+            issues.append(f"python_parser_engine must be one of: {valid_python_engines}")
+
+        # Check worker pool size
+        if self.update_worker_threads <= 0:
+            issues.append("update_worker_threads must be positive")
+
         # Check move detection timing
         if self.move_detect_delay <= 0:
             issues.append("move_detect_delay must be positive")
+        if self.move_detect_min_delay <= 0:
+            issues.append("move_detect_min_delay must be positive")
         if self.dir_move_max_timeout <= 0:
             issues.append("dir_move_max_timeout must be positive")
         if self.dir_move_settle_delay <= 0:
             issues.append("dir_move_settle_delay must be positive")
+        if self.dir_move_worker_threads <= 0:
+            issues.append("dir_move_worker_threads must be positive")
 
         return issues
@@ -65,6 +65,13 @@ Five data structures store link state. All are guarded by ``self._lock``.
     Mutated by: ``add_link``/``add_links_batch``, ``_remove_key_from_indexes``,
     ``_add_key_to_indexes``, ``clear``.
 
+``_source_signatures`` — ``Dict[str, Tuple[int, int]]``
+    Parse-time ``(mtime_ns, size)`` per normalized source path.  Lets
+    ``ReferenceLookup.refresh_changed_sources()`` re-parse only sources
+    edited since they were indexed, before the updater touches them.
+    Mutated by: ``set_source_signature``, ``remove_file_links``,
+    ``update_source_path``, ``clear``.
+
 ``_sorted_link_keys`` — ``List[str]``
     Sorted list of keys in ``links``. Enables O(log n + m) prefix queries
     in ``get_references_to_directory()`` via ``bisect`` (TD203).
@@ -83,7 +90,7 @@ import bisect
 import os
 import threading
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 from .logging import get_logger
 from .models import LinkReference
@@ -171,6 +178,16 @@ class LinkDatabaseInterface(ABC):
         """
         ...
 
+    @abstractmethod
+    def set_source_signature(self, file_path: str, signature: Optional[Tuple[int, int]]):
+        """Record the ``(mtime_ns, size)`` a source file had when it was parsed."""
+        ...
+
+    @abstractmethod
+    def get_source_signature(self, file_path: str) -> Optional[Tuple[int, int]]:
+        """Return the recorded parse-time signature of a source file, or None."""
+        ...
+
     @abstractmethod
     def clear(self):
         """Clear all data from the database."""
@@ -216,6 +233,9 @@ class LinkDatabase(LinkDatabaseInterface):
         # get_references_to_directory() (TD203).
         self._sorted_link_keys: List[str] = []
         self._sorted_resolved_keys: List[str] = []
+        # Parse-time (mtime_ns, size) per normalized source path, so callers
+        # can spot sources edited since they were indexed without reading them.
+        self._source_signatures: Dict[str, Tuple[int, int]] = {}
         self._parser_type_extensions: Dict[str, str] = (
             parser_type_extensions
             if parser_type_extensions is not None
@@ -341,6 +361,8 @@ class LinkDatabase(LinkDatabaseInterface):
             self.files_with_links.discard(file_path)
             self.files_with_links.discard(normalized_file_path)
 
+            self._source_signatures.pop(normalized_file_path, None)
+
             # Use reverse index to find only the targets referenced by this source
             target_keys = self._source_to_targets.pop(normalized_file_path, set())
 
@@ -597,6 +619,9 @@ class LinkDatabase(LinkDatabaseInterface):
                 if new_normalized not in self._source_to_targets:
                     self._source_to_targets[new_normalized] = set()
                 self._source_to_targets[new_normalized].update(targets)
+                signature = self._source_signatures.pop(old_normalized, None)
+                if signature is not None:
+                    self._source_signatures[new_normalized] = signature
                 # Update files_with_links tracking set
                 self.files_with_links.discard(old_path)
                 self.files_with_links.discard(old_normalized)
@@ -731,8 +756,26 @@ class LinkDatabase(LinkDatabaseInterface):
             self._basename_to_keys.clear()
             self._sorted_link_keys.clear()
             self._sorted_resolved_keys.clear()
+            self._source_signatures.clear()
             self.last_scan = None
 
+    def set_source_signature(self, file_path: str, signature: Optional[Tuple[int, int]]):
+        """Record the ``(mtime_ns, size)`` a source file had when it was parsed.
+
+        ``None`` (file could not be stat'd) forgets the signature.
+        """
+        with self._lock:
+            normalized = normalize_path(file_path)
+            if signature is None:
+                self._source_signatures.pop(normalized, None)
+            else:
+                self._source_signatures[normalized] = signature
+
+    def get_source_signature(self, file_path: str) -> Optional[Tuple[int, int]]:
+        """Return the recorded parse-time signature of a source file, or None."""
+        with self._lock:
+            return self._source_signatures.get(normalize_path(file_path))
+
     def get_stats(self) -> Dict[str, int]:
         """Get database statistics."""
         with self._lock:
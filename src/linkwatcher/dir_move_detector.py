@@ -6,18 +6,37 @@ event followed by individual file_created events (instead of a single
 DirMovedEvent). This module implements a 3-phase batch detection algorithm:
 
 Phase 1 (Buffer): On directory deletion, snapshot all known files under
-    the directory and start a max timeout timer.
+    the directory and schedule a max timeout deadline.
 Phase 2 (Match): As file_created events arrive, correlate them with the
     buffered directory. Infer the new directory from the first match,
-    then verify subsequent files by prefix. Reset a settle timer on
-    each match.
-Phase 3 (Process): When all files match (or a settle/max timer fires),
+    then verify subsequent files by prefix. Push back the settle
+    deadline on each match.
+Phase 3 (Process): When all files match (or a settle/max deadline passes),
     confirm the directory move via callback and process unmatched files.
+
+AI Context
+----------
+- **Threading model**: one daemon scheduler thread owns every pending
+  deadline (``self._schedule``, a heapq of ``(due, seq, kind, deleted_dir)``)
+  and sleeps on ``self._wake`` until the earliest one.  Phase 3 work runs
+  on a bounded ``ThreadPoolExecutor`` (``max_workers``), so N concurrent
+  pending directories cost one thread plus the pool instead of 2N timers
+  and N processing threads.
+- **Lazy deadlines**: ``_PendingDirMove.settle_deadline`` and
+  ``max_deadline`` are the source of truth.  Resetting the settle window
+  only moves ``settle_deadline`` forward; when the scheduler pops the
+  older heap entry it re-queues it at the new deadline.  Entries whose
+  pending was already processed (or replaced) are skipped.
+- **Common tasks**: ``stop()`` ends the scheduler and shuts the pool
+  down; ``self._lock`` guards ``pending_dir_moves`` and ``_schedule``.
 """
 
+import heapq
+import itertools
 import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
 
 from .logging import get_logger
@@ -42,8 +61,8 @@ class _PendingDirMove:
         "matched_count",
         "unmatched",
         "timestamp",
-        "max_timer",
-        "settle_timer",
+        "max_deadline",
+        "settle_deadline",
     )
 
     def __init__(self, deleted_dir, known_files):
@@ -55,8 +74,8 @@ class _PendingDirMove:
         self.matched_count = 0
         self.unmatched = set(known_files)
         self.timestamp = time.time()
-        self.max_timer = None
-        self.settle_timer = None
+        self.max_deadline = None
+        self.settle_deadline = None
 
 
 class DirectoryMoveDetector:
@@ -69,6 +88,7 @@ class DirectoryMoveDetector:
         on_true_file_delete: Callback(file_path) for confirmed file deletions.
         max_timeout: Max seconds to wait for all files to appear.
         settle_delay: Seconds to wait after last matched file before processing.
+        max_workers: Size of the worker pool that runs Phase 3 processing.
     """
 
     def __init__(
@@ -79,6 +99,7 @@ class DirectoryMoveDetector:
         on_true_file_delete: Callable[[str], None],
         max_timeout: float = 300.0,
         settle_delay: float = 5.0,
+        max_workers: int = 4,
     ):
         self._link_db = link_db
         self._project_root = project_root
@@ -91,11 +112,30 @@ class DirectoryMoveDetector:
         self._max_timeout = max_timeout
         self._settle_delay = settle_delay
 
+        self._schedule = []  # min-heap of (due, seq, kind, deleted_dir)
+        self._seq = itertools.count()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="dir-move"
+        )
+        self._scheduler = threading.Thread(target=self._scheduler_loop, daemon=True)
+        self._scheduler.start()
+
+    def stop(self):
+        """Stop the scheduler thread and release the worker pool.
+
+        Pending directory moves are dropped without processing.
+        """
+        self._stopped = True
+        self._wake.set()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
     def handle_directory_deleted(self, deleted_dir):
         """Buffer a directory deletion for batch move detection (Phase 1).
 
-        Snapshots all known files under the directory and starts a max
-        timeout timer. Returns True if files were found and buffered.
+        Snapshots all known files under the directory and schedules the
+        max timeout deadline. Returns True if files were found and buffered.
         """
         known_files = self.get_files_under_directory(deleted_dir)
 
@@ -104,14 +144,8 @@ class DirectoryMoveDetector:
 
             with self._lock:
                 self.pending_dir_moves[deleted_dir] = pending
-
-            pending.max_timer = threading.Timer(
-                self._max_timeout,
-                self._process_timeout,
-                [deleted_dir],
-            )
-            pending.max_timer.daemon = True
-            pending.max_timer.start()
+                pending.max_deadline = pending.timestamp + self._max_timeout
+                self._schedule_deadline(pending.max_deadline, "max", deleted_dir)
 
             self._logger.info(
                 "dir_move_buffered",
@@ -151,10 +185,7 @@ class DirectoryMoveDetector:
                 # entry is stale — remove it and skip matching.
                 old_dir_abs = os.path.join(self._project_root, deleted_dir)
                 if os.path.isdir(old_dir_abs):
-                    if pending.settle_timer is not None:
-                        pending.settle_timer.cancel()
-                    if pending.max_timer is not None:
-                        pending.max_timer.cancel()
+                    # Queued deadlines for this entry become no-ops.
                     del self.pending_dir_moves[deleted_dir]
                     continue
 
@@ -288,56 +319,111 @@ class DirectoryMoveDetector:
 
         return known_files
 
-    # --- Internal timer and processing methods ---
+    # --- Internal scheduling and processing methods ---
+
+    def _schedule_deadline(self, due, kind, deleted_dir):
+        """Queue a deadline for the scheduler thread.
+
+        Must be called with self._lock held.
+        """
+        heapq.heappush(self._schedule, (due, next(self._seq), kind, deleted_dir))
+        if self._schedule[0][0] == due:
+            self._wake.set()
 
     def _reset_settle_timer(self, deleted_dir, pending):
-        """Reset the settle timer for a directory move."""
-        if pending.settle_timer is not None:
-            pending.settle_timer.cancel()
-        pending.settle_timer = threading.Timer(
-            self._settle_delay,
-            self._process_settled,
-            [deleted_dir],
-        )
-        pending.settle_timer.daemon = True
-        pending.settle_timer.start()
+        """Push back the settle deadline for a directory move.
+
+        Must be called with self._lock held.  Only the first reset queues
+        a heap entry; later resets just move ``settle_deadline`` and the
+        scheduler re-queues the entry when the old due time passes.
+        """
+        first = pending.settle_deadline is None
+        pending.settle_deadline = time.time() + self._settle_delay
+        if first:
+            self._schedule_deadline(pending.settle_deadline, "settle", deleted_dir)
 
     def _trigger_processing(self, deleted_dir, pending):
-        """Cancel timers and schedule directory move processing.
+        """Drop the pending entry and schedule directory move processing.
 
-        Must be called with self._lock held.
+        Must be called with self._lock held.  Queued deadlines for the
+        entry are discarded lazily by the scheduler.
         """
-        if pending.settle_timer is not None:
-            pending.settle_timer.cancel()
-        if pending.max_timer is not None:
-            pending.max_timer.cancel()
-
-        if deleted_dir in self.pending_dir_moves:
+        if self.pending_dir_moves.get(deleted_dir) is pending:
             del self.pending_dir_moves[deleted_dir]
 
-        # Process on a separate thread to not block the watchdog event thread
-        t = threading.Thread(
-            target=self._process_dir_move,
-            args=(pending,),
-            daemon=True,
-        )
-        t.start()
+        # Process on the worker pool to not block the watchdog event thread
+        self._submit(self._process_dir_move, pending)
 
-    def _process_settled(self, deleted_dir):
-        """Called when settle timer fires — process with whatever we have."""
-        with self._lock:
-            pending = self.pending_dir_moves.get(deleted_dir)
-            if pending is None:
-                return  # Already processed
+    def _submit(self, fn, pending):
+        """Run Phase 3 work for *pending* on the bounded worker pool."""
 
-            if pending.max_timer is not None:
-                pending.max_timer.cancel()
+        def run():
+            try:
+                fn(pending)
+            except Exception as e:
+                self._logger.error(
+                    "dir_move_processing_failed",
+                    deleted_dir=pending.deleted_dir,
+                    error=str(e),
+                )
 
-            del self.pending_dir_moves[deleted_dir]
+        try:
+            self._pool.submit(run)
+        except RuntimeError:
+            # Pool already shut down (service stopping)
+            pass
+
+    def _scheduler_loop(self):
+        """Single scheduler thread that fires settle and max deadlines.
+
+        Sleeps until the earliest queued deadline.  Stale heap entries
+        (pending already processed or replaced, deadline moved) are
+        skipped or re-queued under the lock; due entries are handed to
+        the worker pool.
+        """
+        while not self._stopped:
+            self._wake.clear()
+            due_entries = []
+            wait_time = None
+
+            with self._lock:
+                now = time.time()
+                while self._schedule:
+                    due, _, kind, deleted_dir = self._schedule[0]
+                    if due > now:
+                        wait_time = due - now
+                        break
+                    heapq.heappop(self._schedule)
+
+                    pending = self.pending_dir_moves.get(deleted_dir)
+                    if pending is None:
+                        continue  # Already processed
+                    if kind == "settle":
+                        if pending.settle_deadline is None:
+                            continue  # Entry belongs to a replaced pending
+                        if pending.settle_deadline > now:
+                            # Settle window was pushed back by a later match
+                            self._schedule_deadline(pending.settle_deadline, kind, deleted_dir)
+                            continue
+                    elif pending.max_deadline != due:
+                        continue  # Entry belongs to a replaced pending
+
+                    del self.pending_dir_moves[deleted_dir]
+                    due_entries.append((kind, pending))
 
+            for kind, pending in due_entries:
+                if kind == "settle":
+                    self._submit(self._process_settled, pending)
+                else:
+                    self._submit(self._process_timeout, pending)
+
+            self._wake.wait(timeout=wait_time if wait_time is not None else 1.0)
+
+    def _process_settled(self, pending):
+        """Called when the settle deadline passes — process with whatever we have."""
         self._logger.info(
             "dir_move_settle_timer_fired",
-            old_dir=deleted_dir,
+            old_dir=pending.deleted_dir,
             new_dir=pending.new_dir,
             matched=pending.matched_count,
             unmatched=len(pending.unmatched),
@@ -352,18 +438,9 @@ class DirectoryMoveDetector:
         )
         self._process_dir_move(pending)
 
-    def _process_timeout(self, deleted_dir):
-        """Called when max timer fires — process or treat as true delete."""
-        with self._lock:
-            pending = self.pending_dir_moves.get(deleted_dir)
-            if pending is None:
-                return  # Already processed
-
-            if pending.settle_timer is not None:
-                pending.settle_timer.cancel()
-
-            del self.pending_dir_moves[deleted_dir]
-
+    def _process_timeout(self, pending):
+        """Called when the max deadline passes — process or treat as true delete."""
+        deleted_dir = pending.deleted_dir
         if pending.new_dir is not None:
             # At least one match — process as partial directory move
             self._logger.warning(
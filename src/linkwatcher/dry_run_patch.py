@@ -0,0 +1,338 @@
+"""
+Streaming unified-diff output for dry-run mode.
+
+In dry-run mode ``LinkUpdater`` normally only logs which files it would
+touch.  With a ``DryRunPatch`` attached, every rewrite that would have
+been written is instead appended to one patch file as a git-style
+unified diff, file by file, so a large reorganization can be reviewed
+and later applied in one step with ``git apply`` from the project root.
+
+AI Context
+----------
+- **Entry point**: ``DryRunPatch`` -- created by the service from
+  ``dry_run_patch_file`` (CLI ``--dry-run-patch``) or
+  ``LinkWatcherService.set_dry_run(True, patch_file=...)``, and handed to
+  ``LinkUpdater.set_dry_run_patch()``.
+- **On-disk fidelity**: the updater works on decoded text with ``"\\n"``
+  line endings.  Hunks are rendered back to the file's bytes: the first
+  rewrite of a path reads it from disk and keeps its per-line endings
+  (CRLF, CR) and encoding, so ``git apply`` matches the real file.
+  Encodings whose newline is not the byte ``\\n`` (UTF-16/32) are
+  written as ``GIT binary patch`` literals.
+- **Repeated rewrites**: the planned bytes of a rewritten path are
+  spilled to a file in a private temp directory; memory keeps only its
+  encoding, spill path and a SHA-1 digest.  A later move that rewrites
+  the same file (its *original* is still the on-disk text) is merged
+  onto the spilled text and appended as a second diff against it;
+  ``git apply`` applies consecutive diffs of one path in order.  Changes
+  that overlap on the same characters are logged as
+  ``dry_run_patch_conflict`` and the later one is dropped.
+- **Streaming**: each diff is computed against the on-disk (or spilled)
+  bytes, appended and flushed immediately; no file text of the plan is
+  held in memory between writes.  ``close()`` removes the spill directory.
+- **Format**: ``diff --git a/<path> b/<path>`` headers with project-relative
+  forward-slash paths, ``difflib`` hunks, and the ``\\ No newline at end of
+  file`` marker where needed.
+- **Threading**: ``self._lock`` serializes merging, diffing and appends,
+  so concurrent updater workers never interleave hunks or lose a merge.
+"""
+
+import base64
+import difflib
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from .logging import get_logger
+
+_NO_NEWLINE_MARKER = b"\\ No newline at end of file\n"
+_LINE_ENDING_PATTERN = re.compile(r"\r\n|\r|\n")
+# Bytes per line of a git binary-patch literal.
+_BINARY_LINE_BYTES = 52
+
+
+def patch_path(patch_file: Optional[str], project_root: str) -> Optional[str]:
+    """Resolve ``dry_run_patch_file`` against the project root.
+
+    Returns None when no patch file is configured.
+    """
+    if not patch_file:
+        return None
+    if os.path.isabs(patch_file):
+        return patch_file
+    return os.path.join(str(project_root), patch_file)
+
+
+class _PlannedFile:
+    """Bounded marker for one rewritten file: where its planned bytes are spilled."""
+
+    __slots__ = ("encoding", "spill_path", "digest")
+
+    def __init__(self, encoding: str, spill_path: str):
+        self.encoding = encoding
+        self.spill_path = spill_path
+        self.digest = ""
+
+
+def _render(text: str, layout: str, encoding: str) -> bytes:
+    """Encode LF *text* with the line endings of *layout* and *encoding*."""
+    newlines = _line_endings(layout)
+    default_newline = max(("\n", "\r\n", "\r"), key=lambda ending: newlines.count(ending))
+    parts = text.split("\n")
+    out = [parts[0]]
+    for i, part in enumerate(parts[1:]):
+        out.append(newlines[i] if i < len(newlines) else default_newline)
+        out.append(part)
+    return "".join(out).encode(encoding)
+
+
+class DryRunPatch:
+    """Append-only unified-diff writer for dry-run updates.
+
+    The file is truncated when the writer is created, so each dry-run
+    session produces one self-contained patch.
+
+    Args:
+        path: Absolute path of the patch file.
+        project_root: Root that diff paths are made relative to.
+    """
+
+    def __init__(self, path: str, project_root: str):
+        self.path = path
+        self.project_root = str(project_root)
+        self.files_written = 0
+        self._lock = threading.Lock()
+        self._planned: Dict[str, _PlannedFile] = {}
+        self._spill_dir: Optional[str] = None
+        self._file = open(path, "wb")
+        self.logger = get_logger()
+
+    def write(self, abs_path: str, original: str, new: str, encoding: str = "utf-8"):
+        """Append the diff for rewriting *abs_path* from *original* to *new*.
+
+        *original* and *new* are decoded ``"\\n"`` text; *encoding* is the
+        file's detected encoding (``safe_file_read_with_encoding()``).
+        """
+        rel_path = os.path.relpath(abs_path, self.project_root).replace(os.sep, "/")
+        with self._lock:
+            if self._file.closed:
+                return
+            planned = self._planned.get(abs_path)
+            if planned is None:
+                current = self._load(abs_path, original, encoding)
+            else:
+                encoding = planned.encoding
+                current = self._load_spill(planned)
+            if current is None:
+                return
+            current_text = current.decode(encoding)
+
+            merged = _merge(original, _normalize_newlines(current_text), new)
+            if merged is None:
+                self.logger.warning(
+                    "dry_run_patch_conflict", file_path=rel_path, patch_file=self.path
+                )
+                return
+            merged_bytes = _render(merged, current_text, encoding)
+            diff = _git_diff(current, merged_bytes, rel_path, encoding)
+            if not diff:
+                return
+            if not self._spill(abs_path, planned, merged_bytes, encoding):
+                return
+            self._file.write(diff)
+            self._file.flush()
+            self.files_written += 1
+        self.logger.debug("dry_run_patch_written", file_path=rel_path, patch_file=self.path)
+
+    def close(self):
+        """Flush and close the patch file."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+            self._planned.clear()
+            if self._spill_dir is not None:
+                shutil.rmtree(self._spill_dir, ignore_errors=True)
+                self._spill_dir = None
+
+    def _load(self, abs_path: str, original: str, encoding: str) -> Optional[bytes]:
+        """Read *abs_path* as it is on disk; None if it no longer matches *original*."""
+        try:
+            with open(abs_path, "rb") as f:
+                raw = f.read()
+            text = _normalize_newlines(raw.decode(encoding))
+        except (OSError, UnicodeDecodeError, LookupError) as e:
+            self.logger.warning("dry_run_patch_read_failed", file_path=abs_path, error=str(e))
+            return None
+        if text != original:
+            # The file changed after the update was computed; a diff
+            # against either version would not apply.
+            self.logger.warning("dry_run_patch_stale", file_path=abs_path)
+            return None
+        return raw
+
+    def _load_spill(self, planned: _PlannedFile) -> Optional[bytes]:
+        """Read the planned bytes spilled for an earlier rewrite of the same file."""
+        try:
+            with open(planned.spill_path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            self.logger.warning(
+                "dry_run_patch_spill_failed", spill_path=planned.spill_path, error=str(e)
+            )
+            return None
+        if hashlib.sha1(data).hexdigest() != planned.digest:
+            self.logger.warning("dry_run_patch_spill_failed", spill_path=planned.spill_path)
+            return None
+        return data
+
+    def _spill(
+        self, abs_path: str, planned: Optional[_PlannedFile], data: bytes, encoding: str
+    ) -> bool:
+        """Store *data* as the planned bytes of *abs_path* for later rewrites."""
+        try:
+            if planned is None:
+                if self._spill_dir is None:
+                    self._spill_dir = tempfile.mkdtemp(prefix="linkwatcher-dry-run-")
+                name = hashlib.sha1(abs_path.encode("utf-8", "surrogatepass")).hexdigest()
+                planned = _PlannedFile(encoding, os.path.join(self._spill_dir, name))
+            with open(planned.spill_path, "wb") as f:
+                f.write(data)
+        except OSError as e:
+            # Without the spill a later rewrite could not be diffed against
+            # this one, so the diff is not written either.
+            self.logger.warning("dry_run_patch_spill_failed", file_path=abs_path, error=str(e))
+            return False
+        planned.digest = hashlib.sha1(data).hexdigest()
+        self._planned[abs_path] = planned
+        return True
+
+
+def _normalize_newlines(text: str) -> str:
+    if "\r" not in text:
+        return text
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _line_endings(raw_text: str) -> List[str]:
+    """Return the ending of every line in *raw_text* that has one, in order."""
+    return _LINE_ENDING_PATTERN.findall(raw_text)
+
+
+def _merge(base: str, ours: str, theirs: str) -> Optional[str]:
+    """Apply the change *base* -> *theirs* on top of *ours* (also derived from *base*).
+
+    Link rewrites keep the line count, so lines are merged one by one and a
+    line changed on both sides is merged by character ranges.  Returns None
+    when both sides change the same text.
+    """
+    if ours == base:
+        return theirs
+    if theirs == base or theirs == ours:
+        return ours
+    base_lines, our_lines, their_lines = base.split("\n"), ours.split("\n"), theirs.split("\n")
+    if not len(base_lines) == len(our_lines) == len(their_lines):
+        return None
+    merged = []
+    for base_line, our_line, their_line in zip(base_lines, our_lines, their_lines):
+        if our_line == base_line or our_line == their_line:
+            merged.append(their_line)
+        elif their_line == base_line:
+            merged.append(our_line)
+        else:
+            line = _merge_line(base_line, our_line, their_line)
+            if line is None:
+                return None
+            merged.append(line)
+    return "\n".join(merged)
+
+
+def _merge_line(base: str, ours: str, theirs: str) -> Optional[str]:
+    """Merge two edits of one line whose changed character ranges do not overlap."""
+    edits: List[Tuple[int, int, str]] = []
+    for side in (ours, theirs):
+        matcher = difflib.SequenceMatcher(None, base, side, autojunk=False)
+        edits.extend(
+            (i1, i2, side[j1:j2]) for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != "equal"
+        )
+    edits.sort()
+    for (start, end, _), (next_start, _, _) in zip(edits, edits[1:]):
+        if next_start < end or next_start == start:
+            return None
+    out = []
+    position = 0
+    for start, end, replacement in edits:
+        out.append(base[position:start])
+        out.append(replacement)
+        position = end
+    out.append(base[position:])
+    return "".join(out)
+
+
+def _git_diff(original: bytes, new: bytes, rel_path: str, encoding: str) -> bytes:
+    """Return a git-apply compatible diff of one file (b"" if unchanged)."""
+    if original == new:
+        return b""
+    header = f"diff --git a/{rel_path} b/{rel_path}\n".encode("utf-8")
+    if "\n".encode(encoding) != b"\n":
+        # git sees UTF-16/32 text as binary; only a binary patch applies.
+        return header + _binary_patch(original, new)
+
+    hunks = difflib.diff_bytes(
+        difflib.unified_diff,
+        _split_lines(original),
+        _split_lines(new),
+        fromfile=f"a/{rel_path}".encode("utf-8"),
+        tofile=f"b/{rel_path}".encode("utf-8"),
+        lineterm=b"\n",
+    )
+    out = [header]
+    for line in hunks:
+        if line.endswith(b"\n"):
+            out.append(line)
+        else:
+            out.append(line + b"\n" + _NO_NEWLINE_MARKER)
+    return b"".join(out)
+
+
+def _split_lines(data: bytes) -> List[bytes]:
+    """Split *data* after every ``\\n`` (git's line terminator; CR stays in the line)."""
+    lines = data.split(b"\n")
+    last = lines.pop()
+    lines = [line + b"\n" for line in lines]
+    if last:
+        lines.append(last)
+    return lines
+
+
+def _binary_patch(original: bytes, new: bytes) -> bytes:
+    """Return the ``index`` line and forward/reverse ``GIT binary patch`` literals."""
+    return (
+        f"index {_git_blob_id(original)}..{_git_blob_id(new)}\n".encode("ascii")
+        + b"GIT binary patch\n"
+        + _binary_literal(new)
+        + _binary_literal(original)
+    )
+
+
+def _binary_literal(data: bytes) -> bytes:
+    """Encode *data* as a git ``literal`` block (zlib + base85 lines)."""
+    compressed = zlib.compress(data, 9)
+    out = [f"literal {len(data)}\n".encode("ascii")]
+    for i in range(0, len(compressed), _BINARY_LINE_BYTES):
+        chunk = compressed[i : i + _BINARY_LINE_BYTES]
+        # Line length prefix: A-Z for 1-26 bytes, a-z for 27-52.
+        size = len(chunk)
+        prefix = chr(ord("A") + size - 1) if size <= 26 else chr(ord("a") + size - 27)
+        out.append(prefix.encode("ascii") + base64.b85encode(chunk, pad=True) + b"\n")
+    out.append(b"\n")
+    return b"".join(out)
+
+
+def _git_blob_id(data: bytes) -> str:
+    """Return the object id git assigns to a blob with *data*."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
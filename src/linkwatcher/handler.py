@@ -39,7 +39,8 @@ The three entry points are called by the watchdog observer thread:
   on_modified(event)
     └─ file (monitored, exists, not in ignored dir)
          → rescan_file_links — re-index links written into an
-           existing file by external tools (PD-BUG-102).
+           existing file by external tools (PD-BUG-102).  Incremental:
+           only the lines changed since the last save are re-parsed.
 
 Move Detection Strategies
 -------------------------
@@ -86,6 +87,7 @@ AI Context
 
 import os
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from watchdog.events import (
@@ -98,16 +100,17 @@ from watchdog.events import (
 from .config.defaults import DEFAULT_CONFIG
 from .database import LinkDatabaseInterface
 from .dir_move_detector import DirectoryMoveDetector
+from .dry_run_patch import patch_path
 from .logging import get_logger, with_context
 from .move_detector import MoveDetector
 from .parser import LinkParser
 from .reference_lookup import ReferenceLookup
+from .update_journal import journal_path
 from .updater import LinkUpdater
 from .utils import (
     compute_own_output_exclusions,
     get_relative_path,
     is_own_output,
-    normalize_path,
     should_monitor_file,
 )
 
@@ -171,7 +174,12 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
         # index or react to files it writes itself (log + colocated
         # outputs), or every log write feeds the on_modified rescan loop.
         self._own_output_exclusions = compute_own_output_exclusions(
-            config.log_file if config else None, str(self.project_root)
+            config.log_file if config else None,
+            str(self.project_root),
+            extra_files=[
+                journal_path(config.update_journal_file if config else None, self.project_root),
+                patch_path(config.dry_run_patch_file if config else None, self.project_root),
+            ],
         )
         if self._own_output_exclusions["dirs"] or self._own_output_exclusions["file_stems"]:
             self.logger.info(
@@ -184,18 +192,34 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
 
         # Move detection timing from config or defaults
         move_delay = config.move_detect_delay if config else DEFAULT_CONFIG.move_detect_delay
+        move_min_delay = (
+            config.move_detect_min_delay if config else DEFAULT_CONFIG.move_detect_min_delay
+        )
         dir_max_timeout = (
             config.dir_move_max_timeout if config else DEFAULT_CONFIG.dir_move_max_timeout
         )
         dir_settle = (
             config.dir_move_settle_delay if config else DEFAULT_CONFIG.dir_move_settle_delay
         )
+        dir_workers = (
+            config.dir_move_worker_threads if config else DEFAULT_CONFIG.dir_move_worker_threads
+        )
+        # Bound for the Phase 1.5 worker pool (independent per-file rewrites)
+        self._update_worker_threads = (
+            config.update_worker_threads if config else DEFAULT_CONFIG.update_worker_threads
+        )
 
         # Per-file move detection (delete+create correlation)
         self._move_detector = MoveDetector(
             on_move_detected=self._handle_detected_move,
             on_true_delete=self._process_true_file_delete,
             delay=move_delay,
+            min_delay=move_min_delay,
+            fingerprints=(
+                config.move_detect_fingerprints
+                if config
+                else DEFAULT_CONFIG.move_detect_fingerprints
+            ),
         )
 
         # Directory move detection (batch, for directory moves on Windows)
@@ -206,6 +230,7 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
             on_true_file_delete=self._process_true_file_delete,
             max_timeout=dir_max_timeout,
             settle_delay=dir_settle,
+            max_workers=dir_workers,
         )
 
         # Reference lookup, DB management, and link updates (TD022/TD035 extractions)
@@ -271,6 +296,14 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
             for method_name, event in deferred:
                 getattr(self, method_name)(event)
 
+    def stop(self):
+        """Shut down the directory move detector's scheduler and worker pool.
+
+        Called by ``LinkWatcherService.stop()`` after the observer has been
+        joined, so no further events reach the detector.
+        """
+        self._dir_move_detector.stop()
+
     def on_moved(self, event):
         """Handle file/directory move events."""
         if not self._scan_complete.is_set():
@@ -296,7 +329,7 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
                 return
             if event.is_directory:
                 self._handle_directory_moved(event)
-            elif self._should_monitor_file(event.dest_path) or self._is_known_reference_target(
+            elif self._should_monitor_file(event.dest_path) or self.is_known_reference_target(
                 event.src_path
             ):
                 # PD-BUG-046: Also process moves for non-monitored files that
@@ -335,7 +368,7 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
                 known_files = self._dir_move_detector.get_files_under_directory(deleted_path)
                 if known_files:
                     self._handle_directory_deleted(event)
-                elif self._should_monitor_file(event.src_path) or self._is_known_reference_target(
+                elif self._should_monitor_file(event.src_path) or self.is_known_reference_target(
                     event.src_path
                 ):
                     # PD-BUG-046: Also buffer deletes for non-monitored files
@@ -412,7 +445,8 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
             # Modify events can trail deletes/moves; skip vanished files.
             if not os.path.exists(event.src_path):
                 return
-            self._ref_lookup.rescan_file_links(event.src_path)
+            self._ref_lookup.rescan_file_links(event.src_path, incremental=True)
+            self.remember_file_fingerprint(event.src_path)
         except Exception as e:
             self.logger.error(
                 "on_modified_unhandled_error",
@@ -443,6 +477,9 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
         self.logger.file_moved(old_path, new_path)
 
         try:
+            # Keep the rename-detection fingerprint attached to the file.
+            self._move_detector.rename_fingerprint(old_path, new_path)
+
             # PD-BUG-114: record the move up front so link recalculation —
             # including this file's own outgoing links — can repair references
             # to paths vacated by this or a concurrent same-operation move.
@@ -450,6 +487,12 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
 
             # Get all references to the old file using all path format variations
             references = self._ref_lookup.find_references(old_path)
+            if references:
+                # Re-parse referring files edited since they were indexed
+                refreshed = self._ref_lookup.refresh_changed_sources(
+                    [(references, old_path, new_path)]
+                )
+                references = refreshed[0][0] if refreshed else []
 
             if references:
                 self.logger.info(
@@ -560,6 +603,7 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
             for old_file_path, new_file_path in moved_files:
                 self.link_db.update_source_path(old_file_path, new_file_path)
                 self._ref_lookup.record_move(old_file_path, new_file_path)
+                self._move_detector.rename_fingerprint(old_file_path, new_file_path)
             self._ref_lookup.record_move(old_dir, new_dir)
 
             # Phase 1: Collect all references across moved files (TD129).
@@ -594,12 +638,7 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
             # within moved files, just like individual file moves do)
             # PD-BUG-091: propagate the per-file update count into the total
             # so directory_move_completed accurately reports all work done.
-            phase_1_5_refs_updated = 0
-            for old_file_path, new_file_path in moved_files:
-                abs_new_path = os.path.join(str(self.project_root), new_file_path)
-                phase_1_5_refs_updated += self._update_links_within_moved_file(
-                    old_file_path, new_file_path, abs_new_path
-                )
+            phase_1_5_refs_updated = self._update_links_within_moved_files(moved_files)
             total_references_updated += phase_1_5_refs_updated
 
             # Phase 1.6 (PD-BUG-114): repair links in files moved by earlier
@@ -642,8 +681,9 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
         """Phase 1b: Batch-update all referring files in one pass (TD129).
 
         Performs a single batched updater pass so each referring file is opened
-        and written at most once.  If any files are flagged stale, rescans them
-        and retries once.
+        and written at most once.  Referring files whose ``(mtime_ns, size)``
+        changed since they were indexed are re-parsed first; any files the
+        updater still flags stale are rescanned and retried once.
 
         Returns the total number of references updated.
         """
@@ -651,6 +691,9 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
         if not move_groups:
             return total_references_updated
 
+        # Re-parse referring files edited since they were indexed, so the
+        # stale retry below is only a fallback.
+        move_groups = self._ref_lookup.refresh_changed_sources(move_groups)
         batch_stats = self.updater.update_references_batch(move_groups)
         total_references_updated += batch_stats["references_updated"]
         self._update_stat("errors", batch_stats["errors"])
@@ -742,38 +785,13 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
         if not dir_refs:
             return dir_refs_updated
 
-        old_dir_norm = normalize_path(old_dir)
-        old_dir_prefix = old_dir_norm.rstrip("/") + "/"
-        new_dir_norm = normalize_path(new_dir)
-
         # Group references by their link_target
         refs_by_target = {}
         for ref in dir_refs:
             refs_by_target.setdefault(ref.link_target, []).append(ref)
 
         for target, target_refs in refs_by_target.items():
-            target_norm = normalize_path(target)
-            if target_norm == old_dir_norm:
-                # Exact directory match — use old_dir / new_dir directly
-                ref_old = old_dir
-                ref_new = new_dir
-            elif target_norm.startswith(old_dir_prefix):
-                # Subdirectory match — replace the prefix
-                suffix = target_norm[len(old_dir_prefix) :]
-                ref_old = target
-                ref_new = new_dir_norm + "/" + suffix
-            else:
-                # Fallback (e.g., backslash variant) — simple string replace
-                ref_old = target
-                ref_new = (
-                    target.replace(
-                        old_dir.replace("/", "\\"),
-                        new_dir.replace("/", "\\"),
-                    )
-                    if "\\" in target
-                    else target.replace(old_dir, new_dir)
-                )
-
+            ref_old, ref_new = self._ref_lookup.directory_target_move(target, old_dir, new_dir)
             stats = self.updater.update_references(target_refs, ref_old, ref_new)
             dir_refs_updated += stats["references_updated"]
             self._update_stat("errors", stats["errors"])
@@ -820,6 +838,7 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
                 "move_detected", source=potential_move_source, destination=created_path
             )
             self._handle_detected_move(potential_move_source, created_path)
+            self.remember_file_fingerprint(event.src_path)
         else:
             # Handle as regular file creation
             self.logger.file_created(created_path)
@@ -827,6 +846,8 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
                 # Scan the new file for links
                 self._ref_lookup.rescan_file_links(event.src_path)
                 self._update_stat("files_created")
+                if self._should_monitor_file(event.src_path):
+                    self.remember_file_fingerprint(event.src_path)
             except Exception as e:
                 self.logger.error(
                     "file_creation_error",
@@ -917,13 +938,82 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
             )
             self._update_stat("errors")
 
+    def _update_links_within_moved_files(self, moved_files) -> int:
+        """Run Phase 1.5 for every file of a directory move.
+
+        Each moved file's outward links depend only on its own content and
+        on-disk state, so the rewrites are independent and run on a bounded
+        thread pool (``update_worker_threads``).  A failure in one file is
+        logged and counted as an error without aborting the others.
+
+        Returns the total number of links updated across all files.
+        """
+        if not moved_files:
+            return 0
+
+        # One staged batch for all rewrites: group commit / journal cover
+        # Phase 1.5 like the reference updates.
+        batch = self.updater.begin_write_batch()
+
+        def _rewrite(file_pair):
+            old_file_path, new_file_path = file_pair
+            abs_new_path = os.path.join(str(self.project_root), new_file_path)
+            return self._update_links_within_moved_file(
+                old_file_path, new_file_path, abs_new_path, write_batch=batch
+            )
+
+        workers = min(self._update_worker_threads, len(moved_files))
+        if workers <= 1:
+            outcomes = []
+            for file_pair in moved_files:
+                try:
+                    outcomes.append((file_pair, _rewrite(file_pair), None))
+                except Exception as e:
+                    outcomes.append((file_pair, 0, e))
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="linkwatcher-rewrite"
+            ) as pool:
+                futures = [
+                    (file_pair, pool.submit(_rewrite, file_pair)) for file_pair in moved_files
+                ]
+                outcomes = []
+                for file_pair, future in futures:
+                    try:
+                        outcomes.append((file_pair, future.result(), None))
+                    except Exception as e:
+                        outcomes.append((file_pair, 0, e))
+
+        failed = self.updater.commit_write_batch(batch)
+        refs_updated = 0
+        for (old_file_path, new_file_path), count, error in outcomes:
+            abs_new_path = os.path.join(str(self.project_root), new_file_path)
+            if error is None and count and abs_new_path in failed:
+                # The index was built from the staged content; re-read disk.
+                error = OSError("staged rewrite was not committed")
+                self._update_stat("links_updated", -count)
+                self._ref_lookup.rescan_file_links(abs_new_path)
+            if error is not None:
+                self.logger.error(
+                    "moved_file_rewrite_failed",
+                    old_path=old_file_path,
+                    new_path=new_file_path,
+                    error=str(error),
+                    error_type=type(error).__name__,
+                )
+                self._update_stat("errors")
+                continue
+            refs_updated += count
+        return refs_updated
+
     def _update_links_within_moved_file(
-        self, old_file_path: str, new_file_path: str, abs_new_path: str
+        self, old_file_path: str, new_file_path: str, abs_new_path: str, write_batch=None
     ) -> int:
         """Update relative links within a moved file to reflect its new location.
 
         Delegates to ReferenceLookup.update_links_within_moved_file() and
-        updates handler statistics based on the result.
+        updates handler statistics based on the result.  *write_batch* is
+        an open ``LinkUpdater.begin_write_batch()`` batch, if any.
 
         Returns the number of links updated (0 if none or on error).
         """
@@ -931,7 +1021,7 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
             old_file_path,
             new_file_path,
             abs_new_path,
-            backup_enabled=self.updater.backup_enabled,
+            write_batch=write_batch,
         )
         if links_updated:
             self._update_stat("links_updated", links_updated)
@@ -985,6 +1075,17 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
             )
             self._update_stat("errors")
 
+    def remember_file_fingerprint(self, abs_path: str):
+        """Register a file's content fingerprint for rename detection.
+
+        Called for monitored and known-target files (initial scan, create,
+        modify, move) so that a later delete can be matched to a create
+        under a different basename.
+        """
+        rel_path = self._get_relative_path(abs_path)
+        if rel_path:
+            self._move_detector.remember_fingerprint(rel_path, abs_path)
+
     def add_monitored_extension(self, extension: str):
         """Add a file extension to the set of monitored extensions."""
         self.monitored_extensions.add(extension.lower())
@@ -995,7 +1096,15 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
             file_path, self.monitored_extensions, self.ignored_dirs, str(self.project_root)
         )
 
-    def _is_known_reference_target(self, abs_path: str) -> bool:
+    def plan_moves(self, moves) -> list:
+        """Return the link edits the given moves would make, without moving.
+
+        Delegates to ``ReferenceLookup.plan_moves()``; *moves* are
+        project-relative ``(old_path, new_path)`` pairs.
+        """
+        return self._ref_lookup.plan_moves(moves)
+
+    def is_known_reference_target(self, abs_path: str) -> bool:
         """Check if a file is a known reference target in the link database.
 
         PD-BUG-046: Files that are referenced by monitored files should have
@@ -1052,6 +1161,10 @@ class LinkMaintenanceHandler(FileSystemEventHandler):
         with self._stats_lock:
             return self.stats.copy()
 
+    def get_move_detection_stats(self) -> dict:
+        """Get per-file move detection stats (adaptive window, hit rates)."""
+        return self._move_detector.get_stats()
+
     def reset_stats(self):
         """Reset statistics counters."""
         with self._stats_lock:
@@ -11,6 +11,8 @@ AI Context
   6 modules.
 - ``FileOperation`` is used only by handler/service for move/delete/create
   event representation.
+- ``PlannedEdit`` is the in-memory result of ``LinkWatcherService.plan_move()``
+  (what-if move simulation via ``ReferenceLookup.plan_moves()``).
 - **Common tasks**:
   - Adding a field to ``LinkReference``: update the dataclass here, then
     grep for ``LinkReference(`` across all parsers to add the new argument
@@ -19,7 +21,7 @@ AI Context
     canonical ``LinkType`` enum (37 members across 7 parser families).
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
@@ -54,6 +56,15 @@ class LinkReference:
         ``link_types.py`` (7 families: markdown, python, yaml, json,
         dart, powershell, generic).  The updater uses this to choose
         the correct replacement strategy for each pattern.
+    offset : Optional[int]
+        0-based character offset of ``column_start`` within the decoded
+        file content.  Stamped by ``BaseParser.parse_file()``; ``None``
+        when the reference was built from content without a file read.
+    content_hash : Optional[str]
+        Digest of the content the reference was parsed from (see
+        ``utils.content_digest()``).  The updater only trusts ``offset``
+        while the file still has this digest.  Neither field takes part
+        in equality.
     """
 
     file_path: str
@@ -63,6 +74,27 @@ class LinkReference:
     link_text: str
     link_target: str
     link_type: str  # see LinkType enum in link_types.py
+    offset: Optional[int] = field(default=None, compare=False, repr=False)
+    content_hash: Optional[str] = field(default=None, compare=False, repr=False)
+
+
+@dataclass
+class PlannedEdit:
+    """One link rewrite that a hypothetical move would make.
+
+    Produced by ``LinkWatcherService.plan_move()`` / ``plan_moves()``
+    without touching any file.  Positions refer to the referring file as
+    it was last indexed.
+    """
+
+    file_path: str  # referring source file, project-relative
+    line_number: int
+    column_start: int
+    column_end: int
+    old_target: str
+    new_target: str
+    link_type: str
+    moved_path: str  # old path of the moved file, module or directory
 
 
 @dataclass
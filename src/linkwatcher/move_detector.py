@@ -13,32 +13,110 @@ AI Context
   ``buffer_delete(rel_path)`` stores a pending delete;
   ``match_created_file(rel_path)`` attempts to pair it with a create.
 - **Key mechanism**: deletes are stored in ``self._pending`` (dict keyed
-  by rel_path).  A single worker thread sleeps until the earliest
-  expiry in a priority queue (heapq); expired, unmatched deletes are
-  confirmed via ``on_true_delete`` callback.  Matched pairs fire
-  ``on_move_detected(old_path, new_path)``.
+  by rel_path) and indexed by basename and size in ``self._by_name``, so
+  ``match_created_file()`` inspects only same-name candidates (O(1)
+  average) instead of every pending delete.  A single worker thread
+  sleeps until the earliest expiry in a priority queue (heapq); expired,
+  unmatched deletes are confirmed via ``on_true_delete`` callback.
+  Matched pairs fire ``on_move_detected(old_path, new_path)``.
+- **Rename detection**: the handler registers a compact content
+  fingerprint (size + hash of the first and last few KB, see
+  ``file_fingerprint()``) for monitored and known-target files via
+  ``remember_fingerprint()``.  A buffered delete carries its file's
+  fingerprint, so a create with a *different* basename (``guide.md`` ->
+  ``user-guide.md``) is matched by an O(1) lookup in
+  ``self._by_fingerprint`` when the basename index finds nothing.
+  Fingerprints shared by several known files are ambiguous and never
+  used for matching.
+- **Adaptive expiry**: every match records its delete->create latency.
+  Once enough samples exist, the expiry window used for new deletes
+  tracks a high percentile of that distribution (with headroom), bounded
+  by ``min_delay`` and the configured ``delay`` (the maximum), so true
+  deletions are confirmed sooner on platforms where move pairs arrive
+  within milliseconds.  Each pending entry keeps its own expiry.
+  Matches only ever land inside the current window, so the samples
+  cannot show that it is too short; deletes that expired before the
+  configured ``delay`` are therefore remembered (``self._expired``), and
+  a create that would have matched one within ``delay`` is a *late
+  match*: the window grows at once (``_grow_delay()``) and the latency
+  history restarts from that sample, so it takes
+  ``ADAPTIVE_MIN_SAMPLES`` new matches before it can shrink again.
+  ``get_stats()`` exposes the current window and hit rates.
 - **Threading model**: one daemon worker thread + one lock.  The worker
   sleeps on ``self._wake`` (a ``threading.Event``) and re-checks the
   queue after each wake-up.  ``buffer_delete`` and ``match_created_file``
   signal ``_wake`` when they modify the queue.
 - **Common tasks**:
-  - Tuning timing: adjust ``delay`` parameter (default 10s).  Too short
-    misses slow moves; too long delays true-delete processing.
+  - Tuning timing: ``delay`` (default 10s) is the upper bound and the
+    starting window; ``min_delay`` is the floor the adaptive window may
+    shrink to.  Set both equal to disable adaptation.
   - Debugging missed matches: check basename matching logic and file
-    size comparison in ``match_created_file()``.
-  - Understanding thread safety: ``self._lock`` guards ``_pending``
-    and ``_queue``; the worker thread acquires the lock before
-    processing expired entries.
+    size comparison in ``match_created_file()``; for renames, check that
+    the deleted path had a fingerprint (``move_detect_fingerprints``).
+  - Understanding thread safety: ``self._lock`` guards ``_pending``,
+    ``_by_name`` and ``_queue``; the worker thread acquires the lock
+    before processing expired entries.  ``_pending`` and ``_by_name``
+    are always updated together via ``_add_pending`` /
+    ``_remove_pending``.
 """
 
+import hashlib
 import heapq
+import math
 import os
 import threading
 import time
-from typing import Callable
+from collections import OrderedDict, deque
+from typing import Callable, Optional, Tuple
 
 from .logging import get_logger
 
+# Bytes hashed from each end of a file for its rename fingerprint.
+FINGERPRINT_EDGE_BYTES = 4096
+
+# Adaptive expiry: the window follows the ADAPTIVE_PERCENTILE of the last
+# ADAPTIVE_WINDOW match latencies times ADAPTIVE_HEADROOM, once at least
+# ADAPTIVE_MIN_SAMPLES matches have been observed.
+ADAPTIVE_MIN_SAMPLES = 20
+ADAPTIVE_WINDOW = 512
+ADAPTIVE_PERCENTILE = 0.99
+ADAPTIVE_HEADROOM = 2.0
+# Expired deletes remembered for late-match detection (oldest dropped first).
+LATE_MATCH_MEMORY = 1024
+
+
+def file_fingerprint(abs_path) -> Optional[Tuple[int, bytes]]:
+    """Return a compact content fingerprint ``(size, digest)`` for a file.
+
+    The digest covers the first and last ``FINGERPRINT_EDGE_BYTES`` bytes
+    (the whole file when it is smaller), so the cost is bounded regardless
+    of file size.  Returns None for empty or unreadable files -- an empty
+    file carries no identity worth matching on.
+    """
+    try:
+        with open(abs_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return None
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(f.read(FINGERPRINT_EDGE_BYTES))
+            if size > 2 * FINGERPRINT_EDGE_BYTES:
+                f.seek(-FINGERPRINT_EDGE_BYTES, os.SEEK_END)
+                digest.update(f.read())
+            elif size > FINGERPRINT_EDGE_BYTES:
+                digest.update(f.read())
+    except OSError:
+        return None
+    return size, digest.digest()
+
+
+def _percentile_ms(sorted_latencies, fraction):
+    """Nearest-rank percentile of latencies in seconds, returned in ms."""
+    if not sorted_latencies:
+        return None
+    rank = max(1, math.ceil(fraction * len(sorted_latencies)))
+    return round(sorted_latencies[rank - 1] * 1000, 2)
+
 
 class MoveDetector:
     """Detects per-file moves by correlating delete+create event pairs.
@@ -48,6 +126,9 @@ class MoveDetector:
     window, the pair is treated as a move. Otherwise, after the delay
     expires, the delete is confirmed as a true deletion via callback.
 
+    If no same-name candidate exists, a delete whose content fingerprint
+    equals the created file's is treated as a rename.
+
     Uses a single worker thread with a priority queue instead of
     per-delete timer threads, keeping thread count at O(1) regardless
     of how many deletes are pending.
@@ -55,7 +136,12 @@ class MoveDetector:
     Args:
         on_move_detected: Callback(old_rel_path, new_rel_path) for confirmed moves.
         on_true_delete: Callback(rel_path) for confirmed true deletions.
-        delay: Seconds to wait for a matching create after a delete.
+        delay: Seconds to wait for a matching create after a delete; the
+            upper bound (and starting value) of the adaptive window.
+        min_delay: Lower bound of the adaptive window.  Defaults to
+            ``delay``, which disables adaptation.
+        fingerprints: Whether to keep the content fingerprint index used
+            for rename (different basename) detection.
     """
 
     def __init__(
@@ -63,12 +149,36 @@ class MoveDetector:
         on_move_detected: Callable[[str, str], None],
         on_true_delete: Callable[[str], None],
         delay: float = 10.0,
+        min_delay: Optional[float] = None,
+        fingerprints: bool = True,
     ):
         self._on_move = on_move_detected
         self._on_delete = on_true_delete
-        self._pending = {}  # {rel_path: (timestamp, file_size, abs_path)}
+        # {rel_path: (timestamp, file_size, abs_path, fingerprint, expiry)}
+        self._pending = {}
+        # Match index: {basename: {file_size: {rel_path: None}}}.  Inner dicts
+        # keep insertion order so the oldest candidate is tried first.
+        self._by_name = {}
+        # Rename detection: fingerprints of known files, a per-fingerprint
+        # count (to spot duplicate content), and pending deletes by fingerprint.
+        self._fingerprints_enabled = fingerprints
+        self._fingerprints = {}  # {rel_path: (size, digest)}
+        self._fingerprint_counts = {}  # {(size, digest): known file count}
+        self._by_fingerprint = {}  # {(size, digest): {rel_path: None}}
         self._queue = []  # min-heap of (expiry_time, rel_path)
-        self._delay = delay
+        self._delay = delay  # current (adaptive) window
+        self._max_delay = delay
+        self._min_delay = delay if min_delay is None else min(min_delay, delay)
+        self._latencies = deque(maxlen=ADAPTIVE_WINDOW)  # seconds, most recent matches
+        # Deletes confirmed before the configured delay ran out, for late
+        # matches: {rel_path: (timestamp, file_size, fingerprint)}
+        self._expired = OrderedDict()
+        self._counts = {
+            "name_matches": 0,
+            "fingerprint_matches": 0,
+            "late_matches": 0,
+            "true_deletes": 0,
+        }
         self._lock = threading.Lock()
         self._wake = threading.Event()
         self._stopped = False
@@ -94,8 +204,10 @@ class MoveDetector:
 
         now = time.time()
         with self._lock:
-            self._pending[rel_path] = (now, file_size, abs_path)
-            heapq.heappush(self._queue, (now + self._delay, rel_path))
+            fingerprint = self._discard_fingerprint(rel_path)
+            expiry = now + self._delay
+            self._add_pending(rel_path, (now, file_size, abs_path, fingerprint, expiry))
+            heapq.heappush(self._queue, (expiry, rel_path))
             pending_count = len(self._pending)
 
             self.logger.debug(
@@ -118,12 +230,19 @@ class MoveDetector:
         """Try to match a created file with a pending delete.
 
         Checks if any buffered deletion has the same filename and
-        compatible file size. Returns the old path if a match is
+        compatible file size, then falls back to an identical content
+        fingerprint (rename). Returns the old path if a match is
         found (indicating a move), or None if no match.
         """
         timer_id = self.logger.performance.start_timer("move_detect_match")
+        # Hash outside the lock; only needed when a rename candidate exists.
+        created_fingerprint = (
+            file_fingerprint(abs_path) if self._by_fingerprint or self._expired else None
+        )
         with self._lock:
             if not self._pending:
+                if self._expired:
+                    self._check_late_match(rel_path, abs_path, created_fingerprint)
                 self.logger.performance.end_timer(
                     timer_id,
                     "move_detect_match",
@@ -144,48 +263,41 @@ class MoveDetector:
             created_filename = os.path.basename(rel_path)
             current_time = time.time()
 
-            for deleted_path, (delete_time, delete_size, deleted_abs) in list(
-                self._pending.items()
-            ):
-                if current_time - delete_time > self._delay:
-                    continue
-
-                if os.path.basename(deleted_path) == created_filename:
-                    if delete_size == 0 or created_size == delete_size:
-                        # PD-BUG-042: If the old file has been re-created at
-                        # its original location (e.g., by a bulk copy after
-                        # cleanup), this pending delete is stale -- discard it
-                        # instead of matching it with an unrelated create.
-                        if os.path.exists(deleted_abs):
-                            del self._pending[deleted_path]
-                            self.logger.debug(
-                                "move_detect_stale_discard",
-                                deleted_path=deleted_path,
-                                reason="original file re-created at old location",
-                            )
-                            continue
-
-                        del self._pending[deleted_path]
-                        latency_ms = (current_time - delete_time) * 1000
-                        self.logger.debug(
-                            "move_detect_match_found",
-                            old_path=deleted_path,
-                            new_path=rel_path,
-                        )
-                        self.logger.performance.end_timer(
-                            timer_id,
-                            "move_detect_match",
-                            result="matched",
-                        )
-                        self.logger.performance.log_metric(
-                            "move_detect_match_latency",
-                            round(latency_ms, 2),
-                            unit="ms",
-                            old_path=deleted_path,
-                            new_path=rel_path,
-                        )
+            # Exact-size candidates first, then deletes whose size was
+            # unknown at buffer time (size 0 acts as a wildcard).
+            sizes = self._by_name.get(created_filename, {})
+            candidate_sizes = (created_size,) if created_size == 0 else (created_size, 0)
+            for size in candidate_sizes:
+                for deleted_path in list(sizes.get(size, ())):
+                    entry = self._pending.get(deleted_path)
+                    if entry is None:
+                        continue
+                    if self._claim_pending(deleted_path, entry, current_time):
+                        self._log_match(timer_id, deleted_path, rel_path, entry, current_time)
                         return deleted_path
 
+            # Rename: a different basename but identical content.  Only a
+            # unique fingerprint is trusted -- duplicate content among known
+            # files or several pending deletes make the pairing ambiguous.
+            candidates = (
+                self._by_fingerprint.get(created_fingerprint) if created_fingerprint else None
+            )
+            if (
+                candidates
+                and len(candidates) == 1
+                and not self._fingerprint_counts.get(created_fingerprint)
+            ):
+                deleted_path = next(iter(candidates))
+                entry = self._pending[deleted_path]
+                if self._claim_pending(deleted_path, entry, current_time):
+                    self._log_match(
+                        timer_id, deleted_path, rel_path, entry, current_time, "fingerprint"
+                    )
+                    return deleted_path
+
+            if self._expired:
+                self._check_late_match(rel_path, abs_path, created_fingerprint)
+
         self.logger.performance.end_timer(
             timer_id,
             "move_detect_match",
@@ -198,6 +310,254 @@ class MoveDetector:
         """Whether there are any pending deletions being tracked."""
         return bool(self._pending)
 
+    def get_stats(self) -> dict:
+        """Return the current expiry window, match/true-delete counts and hit rate.
+
+        ``hit_rate`` is the share of resolved pending deletes that turned
+        out to be moves (None until something has been resolved).
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+            matches = self._counts["name_matches"] + self._counts["fingerprint_matches"]
+            resolved = matches + self._counts["true_deletes"]
+            return {
+                "current_delay": round(self._delay, 3),
+                "min_delay": self._min_delay,
+                "max_delay": self._max_delay,
+                "pending": len(self._pending),
+                "matches": matches,
+                **self._counts,
+                "hit_rate": round(matches / resolved, 3) if resolved else None,
+                "latency_samples": len(latencies),
+                "latency_p50_ms": _percentile_ms(latencies, 0.5),
+                "latency_p99_ms": _percentile_ms(latencies, ADAPTIVE_PERCENTILE),
+            }
+
+    def _adapt_delay(self):
+        """Retune the expiry window from the recorded latency distribution.
+
+        Applies to deletes buffered from now on.  Caller must hold
+        ``self._lock``.
+        """
+        if self._min_delay >= self._max_delay or len(self._latencies) < ADAPTIVE_MIN_SAMPLES:
+            return
+        target = _percentile_ms(sorted(self._latencies), ADAPTIVE_PERCENTILE) / 1000
+        new_delay = min(self._max_delay, max(self._min_delay, target * ADAPTIVE_HEADROOM))
+        if abs(new_delay - self._delay) > 0.01 * self._delay:
+            self.logger.debug(
+                "move_detect_delay_adapted",
+                old_delay=round(self._delay, 3),
+                new_delay=round(new_delay, 3),
+                samples=len(self._latencies),
+            )
+            self._delay = new_delay
+            self.logger.performance.log_metric("move_detect_delay", round(new_delay, 3), unit="s")
+
+    def _check_late_match(self, rel_path, abs_path, created_fingerprint):
+        """Grow the window if *rel_path* pairs with a delete that expired too early.
+
+        A create with the basename and size (or the unique fingerprint) of
+        a remembered expired delete, within the configured ``delay`` of
+        it, is a move the adaptive window missed.  The delete was already
+        confirmed, so the pair is only counted.  Caller must hold
+        ``self._lock``.
+        """
+        now = time.time()
+        # Forget deletes the configured delay would have expired as well.
+        while self._expired:
+            oldest = next(iter(self._expired.values()))
+            if now - oldest[0] <= self._max_delay:
+                break
+            self._expired.popitem(last=False)
+
+        created_filename = os.path.basename(rel_path)
+        created_size = None
+        for deleted_path, (timestamp, file_size, fingerprint) in self._expired.items():
+            if os.path.basename(deleted_path) == created_filename:
+                if created_size is None:
+                    try:
+                        created_size = os.path.getsize(abs_path)
+                    except OSError:
+                        return
+                if file_size in (created_size, 0):
+                    break
+            if created_fingerprint is not None and fingerprint == created_fingerprint:
+                break
+        else:
+            return
+
+        del self._expired[deleted_path]
+        latency = now - timestamp
+        self._counts["late_matches"] += 1
+        self.logger.info(
+            "move_detect_late_match",
+            old_path=deleted_path,
+            new_path=rel_path,
+            latency_ms=round(latency * 1000, 2),
+            delay=round(self._delay, 3),
+        )
+        self._grow_delay(latency)
+
+    def _grow_delay(self, latency):
+        """Widen the expiry window after a late match of *latency* seconds.
+
+        The window at least doubles and covers the late latency with
+        headroom (capped at the configured delay).  The latency history
+        restarts from this sample, so ``_adapt_delay()`` keeps the window
+        this wide until ``ADAPTIVE_MIN_SAMPLES`` new matches say otherwise.
+        Caller must hold ``self._lock``.
+        """
+        new_delay = min(self._max_delay, max(self._delay * 2, latency * ADAPTIVE_HEADROOM))
+        self._latencies.clear()
+        self._latencies.append(latency)
+        if new_delay > self._delay:
+            self.logger.debug(
+                "move_detect_delay_adapted",
+                old_delay=round(self._delay, 3),
+                new_delay=round(new_delay, 3),
+                samples=len(self._latencies),
+            )
+            self._delay = new_delay
+            self.logger.performance.log_metric("move_detect_delay", round(new_delay, 3), unit="s")
+
+    def remember_fingerprint(self, rel_path, abs_path):
+        """Record (or refresh) the content fingerprint of a known file.
+
+        Called by the handler for monitored and known-target files on scan,
+        create, modify and move so a later delete can be matched to a
+        renamed create.  No-op when fingerprinting is disabled.
+        """
+        if not self._fingerprints_enabled:
+            return
+        fingerprint = file_fingerprint(abs_path)
+        with self._lock:
+            self._discard_fingerprint(rel_path)
+            if fingerprint is not None:
+                self._fingerprints[rel_path] = fingerprint
+                self._fingerprint_counts[fingerprint] = (
+                    self._fingerprint_counts.get(fingerprint, 0) + 1
+                )
+
+    def rename_fingerprint(self, old_rel_path, new_rel_path):
+        """Carry a known file's fingerprint over to its new path after a move."""
+        with self._lock:
+            fingerprint = self._fingerprints.pop(old_rel_path, None)
+            if fingerprint is not None:
+                # A file replaced at the destination no longer exists.
+                self._discard_fingerprint(new_rel_path)
+                self._fingerprints[new_rel_path] = fingerprint
+
+    def _discard_fingerprint(self, rel_path):
+        """Forget a known file's fingerprint and return it (or None).
+
+        Caller must hold ``self._lock``.
+        """
+        fingerprint = self._fingerprints.pop(rel_path, None)
+        if fingerprint is not None:
+            remaining = self._fingerprint_counts[fingerprint] - 1
+            if remaining:
+                self._fingerprint_counts[fingerprint] = remaining
+            else:
+                del self._fingerprint_counts[fingerprint]
+        return fingerprint
+
+    def _claim_pending(self, deleted_path, entry, current_time) -> bool:
+        """Remove a candidate pending delete; True if it is a valid match.
+
+        Expired candidates are left for the worker.  Caller must hold
+        ``self._lock``.
+        """
+        deleted_abs, expiry = entry[2], entry[4]
+        if current_time > expiry:
+            return False
+
+        self._remove_pending(deleted_path)
+        # PD-BUG-042: If the old file has been re-created at its original
+        # location (e.g., by a bulk copy after cleanup), this pending delete
+        # is stale -- discard it instead of matching it with an unrelated
+        # create.
+        if os.path.exists(deleted_abs):
+            self.logger.debug(
+                "move_detect_stale_discard",
+                deleted_path=deleted_path,
+                reason="original file re-created at old location",
+            )
+            return False
+        return True
+
+    def _log_match(self, timer_id, deleted_path, rel_path, entry, current_time, method="name"):
+        """Record a confirmed pair and emit its match event and latency metrics.
+
+        Caller must hold ``self._lock``.
+        """
+        latency = current_time - entry[0]
+        latency_ms = latency * 1000
+        self._counts[f"{method}_matches"] += 1
+        self._latencies.append(latency)
+        self._adapt_delay()
+        self.logger.debug(
+            "move_detect_match_found",
+            old_path=deleted_path,
+            new_path=rel_path,
+            method=method,
+        )
+        self.logger.performance.end_timer(
+            timer_id,
+            "move_detect_match",
+            result="matched",
+        )
+        self.logger.performance.log_metric(
+            "move_detect_match_latency",
+            round(latency_ms, 2),
+            unit="ms",
+            old_path=deleted_path,
+            new_path=rel_path,
+        )
+
+    def _add_pending(self, rel_path, entry):
+        """Record a pending delete in ``_pending`` and the match index.
+
+        Caller must hold ``self._lock``.  A re-buffered path replaces its
+        previous entry (the old heap item is skipped lazily by the worker).
+        """
+        if rel_path in self._pending:
+            self._remove_pending(rel_path)
+        self._pending[rel_path] = entry
+        sizes = self._by_name.setdefault(os.path.basename(rel_path), {})
+        sizes.setdefault(entry[1], {})[rel_path] = None
+        if entry[3] is not None:
+            self._by_fingerprint.setdefault(entry[3], {})[rel_path] = None
+
+    def _remove_pending(self, rel_path):
+        """Drop a pending delete from ``_pending`` and the match index.
+
+        Caller must hold ``self._lock``.
+        """
+        entry = self._pending.pop(rel_path)
+        basename = os.path.basename(rel_path)
+        sizes = self._by_name[basename]
+        paths = sizes[entry[1]]
+        del paths[rel_path]
+        if not paths:
+            del sizes[entry[1]]
+            if not sizes:
+                del self._by_name[basename]
+        if entry[3] is not None:
+            same_content = self._by_fingerprint[entry[3]]
+            del same_content[rel_path]
+            if not same_content:
+                del self._by_fingerprint[entry[3]]
+
+    def _remember_expired(self, rel_path, entry):
+        """Keep an early-expired delete for ``_check_late_match()``.
+
+        Caller must hold ``self._lock``.
+        """
+        self._expired.pop(rel_path, None)
+        self._expired[rel_path] = (entry[0], entry[1], entry[3])
+        if len(self._expired) > LATE_MATCH_MEMORY:
+            self._expired.popitem(last=False)
+
     def _expiry_worker(self):
         """Single worker thread that processes expired pending deletes.
 
@@ -222,10 +582,13 @@ class MoveDetector:
                         if earliest_path in self._pending:
                             # Verify this queue entry corresponds to the
                             # current pending entry (not a stale re-buffer)
-                            pending_time = self._pending[earliest_path][0]
-                            if abs((pending_time + self._delay) - earliest_expiry) < 0.001:
-                                del self._pending[earliest_path]
+                            entry = self._pending[earliest_path]
+                            if entry[4] == earliest_expiry:
+                                self._remove_pending(earliest_path)
+                                if entry[4] - entry[0] < self._max_delay:
+                                    self._remember_expired(earliest_path, entry)
                                 expired.append(earliest_path)
+                                self._counts["true_deletes"] += 1
                     else:
                         wait_time = earliest_expiry - now
                         break
@@ -6,7 +6,9 @@ specialized parsers based on file type.
 """
 
 import os
-from typing import List, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
 
 from .config.defaults import DEFAULT_CONFIG
 from .config.settings import LinkWatcherConfig
@@ -22,7 +24,12 @@ from .parsers import (
     PythonParser,
     YamlParser,
 )
-from .utils import is_file_size_within_limit
+from .parsers.base import LineSnapshot
+from .utils import BinaryFileError, classifier_cache_stats, is_file_size_within_limit
+
+# Files whose line snapshots ``reparse_file()`` keeps (least recently saved
+# evicted first).
+_REPARSE_CACHE_FILES = 256
 
 
 class LinkParser:
@@ -52,7 +59,9 @@ class LinkParser:
         if config is None or config.enable_dart_parser:
             self.parsers[".dart"] = DartParser()
         if config is None or config.enable_python_parser:
-            self.parsers[".py"] = PythonParser()
+            self.parsers[".py"] = PythonParser(
+                engine=config.python_parser_engine if config else "regex"
+            )
         if config is None or config.enable_powershell_parser:
             ps_parser = PowerShellParser()
             self.parsers[".ps1"] = ps_parser
@@ -62,6 +71,9 @@ class LinkParser:
             GenericParser() if (config is None or config.enable_generic_parser) else None
         )
 
+        self._snapshots: "OrderedDict[str, LineSnapshot]" = OrderedDict()
+        self._snapshots_lock = threading.Lock()
+
     def parse_file(self, file_path: str) -> List[LinkReference]:
         """Parse a file and extract all link references."""
         try:
@@ -72,6 +84,17 @@ class LinkParser:
                     size_mb = os.path.getsize(file_path) / (1024 * 1024)
                 except OSError:
                     size_mb = -1
+                parser = self.parsers.get(file_ext, self.generic_parser)
+                references = parser.parse_oversize_file(file_path) if parser else None
+                if references is not None:
+                    self.logger.info(
+                        "file_parsed_oversize",
+                        file_path=file_path,
+                        size_mb=round(size_mb, 2),
+                        limit_mb=self.max_file_size_mb,
+                        references=len(references),
+                    )
+                    return references
                 self.logger.warning(
                     "file_skipped_oversize",
                     file_path=file_path,
@@ -115,6 +138,54 @@ class LinkParser:
             )
             return []
 
+    def reparse_file(self, file_path: str) -> List[LinkReference]:
+        """Re-parse a file that was edited in place, re-using its last parse.
+
+        For parsers with ``incremental`` set, a line snapshot of each file
+        re-parsed here is kept (bounded by ``_REPARSE_CACHE_FILES``), and the
+        next call only parses the lines that changed since (see
+        ``BaseParser.reparse_content()``).  The first call for a file, oversize
+        files and all other parsers go through ``parse_file()``.
+        """
+        file_ext = os.path.splitext(file_path)[1].lower()
+        parser = self.parsers.get(file_ext, self.generic_parser)
+        with self._snapshots_lock:
+            previous = self._snapshots.pop(file_path, None)
+        if (
+            parser is None
+            or not parser.incremental
+            or not is_file_size_within_limit(file_path, self.max_file_size_mb)
+        ):
+            return self.parse_file(file_path)
+
+        try:
+            with LogTimer(
+                "file_reparsing",
+                self.logger,
+                enabled=self.performance_logging,
+                file_path=file_path,
+                file_ext=file_ext,
+            ):
+                content = parser._safe_read_file(file_path)
+                references, snapshot = parser.reparse_content(content, file_path, previous)
+        except BinaryFileError:
+            self.logger.debug("file_skipped_binary", file_path=file_path)
+            return []
+        except Exception as e:
+            self.logger.warning(
+                "file_parsing_failed",
+                file_path=file_path,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return []
+
+        with self._snapshots_lock:
+            self._snapshots[file_path] = snapshot
+            while len(self._snapshots) > _REPARSE_CACHE_FILES:
+                self._snapshots.popitem(last=False)
+        return references
+
     def parse_content(self, content: str, file_path: str) -> List[LinkReference]:
         """Parse already-read content for link references.
 
@@ -171,3 +242,40 @@ class LinkParser:
     def get_supported_extensions(self) -> List[str]:
         """Get list of supported file extensions."""
         return list(self.parsers.keys())
+
+    def get_prefilter_stats(self) -> Dict[str, Dict[str, int]]:
+        """Return line prefilter counts per parser class that used it.
+
+        See ``BaseParser._prefiltered_lines()``; parsers registered for
+        several extensions are counted once.
+        """
+        parsers = {id(p): p for p in [*self.parsers.values(), self.generic_parser] if p}
+        stats = {}
+        for parser in parsers.values():
+            counts = getattr(parser, "prefilter_stats", None)
+            if counts and counts["lines"]:
+                stats[type(parser).__name__] = dict(counts)
+        return stats
+
+    def log_prefilter_stats(self):
+        """Report the line prefilter skip ratio of each parser as a metric."""
+        for parser_name, counts in self.get_prefilter_stats().items():
+            self.logger.performance.log_metric(
+                "parser_prefilter_skip_ratio",
+                round(counts["skipped"] / counts["lines"], 3),
+                parser=parser_name,
+                lines=counts["lines"],
+                skipped=counts["skipped"],
+            )
+
+    def log_classifier_stats(self):
+        """Report the hit rate of each memoized path classifier as a metric."""
+        for classifier, counts in classifier_cache_stats().items():
+            lookups = counts["hits"] + counts["misses"]
+            if lookups:
+                self.logger.performance.log_metric(
+                    "path_classifier_hit_rate",
+                    round(counts["hits"] / lookups, 3),
+                    classifier=classifier,
+                    **counts,
+                )
@@ -4,20 +4,110 @@ Base parser interface for file type specific parsers.
 This module defines the common interface that all parsers must implement.
 """
 
+import dataclasses
 import os.path
 import re
+import threading
 from abc import ABC, abstractmethod
-from typing import Generator, List, Tuple
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Dict, Generator, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 from ..logging import get_logger
 from ..models import LinkReference
 from ..utils import (
+    BinaryFileError,
+    content_digest,
     find_line_number,
+    iter_text_chunks,
     looks_like_directory_path,
     looks_like_file_path,
     safe_file_read,
+    sniff_file_encodings,
 )
 
+# Characters decoded per window when an oversize file is parsed in windows.
+_WINDOW_CHARS = 1 << 20
+
+#: Line prefilter shared by the line-by-line parsers.  Every path pattern
+#: needs one of these: a path separator, a quote or backtick, a bracket
+#: (markdown links, HTML tags, PowerShell ``<#``/``#>``), or a dot followed
+#: by an extension character.  Lines without a match cannot yield a
+#: reference and never change parser state (docstring, fence, here-string
+#: and block-comment delimiters all contain a trigger).
+PATH_TRIGGER_PATTERN = re.compile(r"[/\\\"'`\[\]<>]|\.[A-Za-z0-9_]")
+
+
+def stamp_offsets(references: List[LinkReference], content: str) -> List[LinkReference]:
+    """Record each reference's absolute character offset in *content*.
+
+    Lets the updater patch a file at known positions instead of splitting
+    it into lines (see ``LinkUpdater._apply_span_patches()``).  References
+    whose line/column does not fall inside *content* are left unstamped.
+    """
+    if not references:
+        return references
+    lines = content.split("\n")
+    # Start of line i = characters of lines[:i] plus i newline characters.
+    prefix = list(accumulate(map(len, lines), initial=0))
+    digest = content_digest(content)
+    for ref in references:
+        index = ref.line_number - 1
+        if 0 <= index < len(lines) and 0 <= ref.column_start <= len(lines[index]):
+            ref.offset = prefix[index] + index + ref.column_start
+            ref.content_hash = digest
+    return references
+
+
+def _has_index_in(indices: List[int], start: int, end: int) -> bool:
+    """Return True if the sorted *indices* contain a value in ``[start, end)``."""
+    position = bisect_left(indices, start)
+    return position < len(indices) and indices[position] < end
+
+
+class LineIndex:
+    """Map offsets in a whole buffer to 1-based line numbers and columns.
+
+    Lets a parser run its patterns once over the full content with
+    ``finditer`` instead of splitting it into one string per line; only
+    the newline offsets are stored, and lookups are a ``bisect``.
+    """
+
+    def __init__(self, content: str):
+        self.content = content
+        self.line_starts = [0]
+        find = content.find
+        pos = find("\n")
+        while pos != -1:
+            self.line_starts.append(pos + 1)
+            pos = find("\n", pos + 1)
+
+    def locate(self, offset: int) -> Tuple[int, int]:
+        """Return ``(line_number, column)`` of *offset*."""
+        index = bisect_right(self.line_starts, offset) - 1
+        return index + 1, offset - self.line_starts[index]
+
+    def line(self, line_number: int) -> str:
+        """Return the text of *line_number* without its newline."""
+        start = self.line_starts[line_number - 1]
+        if line_number < len(self.line_starts):
+            return self.content[start : self.line_starts[line_number] - 1]
+        return self.content[start:]
+
+
+class LineSnapshot(NamedTuple):
+    """What ``BaseParser.reparse_content()`` keeps from one parse of a file.
+
+    ``line_hashes`` holds ``hash()`` of every line, ``delimiters`` the
+    0-based indices of block-delimiter lines, and ``references`` private
+    copies of the references found.
+    """
+
+    line_hashes: array
+    delimiters: List[int]
+    references: List[LinkReference]
+
 
 class BaseParser(ABC):
     """
@@ -29,6 +119,8 @@ class BaseParser(ABC):
 
     def __init__(self):
         self.logger = get_logger()
+        self.prefilter_stats: Dict[str, int] = {"lines": 0, "skipped": 0}
+        self._prefilter_lock = threading.Lock()
 
     def parse_file(self, file_path: str) -> List[LinkReference]:
         """
@@ -42,7 +134,12 @@ class BaseParser(ABC):
         """
         try:
             content = self._safe_read_file(file_path)
-            return self.parse_content(content, file_path)
+            references = self.parse_content(content, file_path)
+            stamp_offsets(references, content)
+            return references
+        except BinaryFileError:
+            self.logger.debug("file_skipped_binary", file_path=file_path)
+            return []
         except Exception as e:
             self.logger.warning(
                 "parse_error",
@@ -52,6 +149,277 @@ class BaseParser(ABC):
             )
             return []
 
+    #: True for parsers whose ``parse_content()`` only relates text on the
+    #: same or nearby lines, so an oversize file can be parsed window by
+    #: window (see ``parse_windows()``).  Block state that spans windows
+    #: must be carried by ``_window_block_state()``.
+    line_oriented = False
+
+    #: Lines of the previous window repeated before the next one as context.
+    #: References found in them were already reported and are dropped.
+    window_overlap_lines = 8
+
+    def parse_oversize_file(self, file_path: str) -> Optional[List[LinkReference]]:
+        """
+        Parse a file above ``max_file_size_mb`` without loading it whole.
+
+        Returns None when the parser has no bounded-memory strategy, in
+        which case ``LinkParser`` skips the file.  Line-oriented parsers
+        use ``parse_windows()``.  References returned here carry no
+        ``offset`` (there is no content to stamp against).
+        """
+        if not self.line_oriented:
+            return None
+        return self.parse_windows(file_path)
+
+    def parse_windows(
+        self, file_path: str, window_chars: int = _WINDOW_CHARS
+    ) -> List[LinkReference]:
+        """
+        Parse *file_path* in overlapping windows of whole lines.
+
+        Each window is about *window_chars* characters, cut at the last
+        newline, and is preceded by the last ``window_overlap_lines`` lines
+        of the previous one.  ``parse_content()`` runs on each window and
+        line numbers are shifted back to file coordinates, so memory stays
+        bounded by the window size whatever the file size.
+        """
+        try:
+            encodings = sniff_file_encodings(file_path)
+        except BinaryFileError:
+            self.logger.debug("file_skipped_binary", file_path=file_path)
+            return []
+        except OSError as e:
+            self.logger.warning(
+                "parse_error", file_path=file_path, parser=type(self).__name__, error=str(e)
+            )
+            return []
+
+        for encoding in encodings:
+            try:
+                return self._parse_text_windows(
+                    iter_text_chunks(file_path, encoding, window_chars), file_path
+                )
+            except UnicodeDecodeError:
+                continue
+            except OSError as e:
+                self.logger.warning(
+                    "parse_error", file_path=file_path, parser=type(self).__name__, error=str(e)
+                )
+                return []
+        return []
+
+    def _parse_text_windows(self, chunks: Iterable[str], file_path: str) -> List[LinkReference]:
+        """Run ``parse_content()`` over *chunks* re-cut into windows of whole lines."""
+        references: List[LinkReference] = []
+        context = ""  # trailing lines of the previous window
+        lines_before = 0  # file lines preceding the current window's own lines
+        pending = ""  # partial last line carried into the next window
+
+        state = None  # block state at the start of `context` (None: file start)
+
+        def parse_window(body: str):
+            nonlocal context, lines_before, state
+            # Later windows start with an empty line so start-of-file
+            # constructs (markdown frontmatter) are not detected mid-file,
+            # then re-enter the block the context starts in.
+            if lines_before:
+                window = "\n" + self._window_state_lines(state) + context + body
+            else:
+                window = body
+            skip = window.count("\n", 0, len(window) - len(body))
+            for ref in self.parse_content(window, file_path):
+                if ref.line_number > skip:
+                    ref.line_number += lines_before - skip
+                    references.append(ref)
+            lines_before += body.count("\n")
+            start = len(body)
+            for _ in range(self.window_overlap_lines):
+                start = body.rfind("\n", 0, start - 1) + 1
+                if start == 0:
+                    break
+            if context:
+                state = self._window_block_state(context, state)
+            state = self._window_block_state(body[:start], state)
+            context = body[start:]
+
+        for chunk in chunks:
+            text = pending + chunk
+            cut = text.rfind("\n") + 1
+            if cut == 0:
+                # One line longer than the window: keep reading until it ends.
+                pending = text
+                continue
+            pending = text[cut:]
+            parse_window(text[:cut])
+        if pending:
+            parse_window(pending)
+        return references
+
+    def _window_block_state(self, text: str, state):
+        """Return the block state after the window lines *text*.
+
+        *state* is the state *text* starts in (None at the start of the
+        file).  Parsers whose blocks can span windows override this and
+        ``_window_state_lines()``; stateless parsers carry None.
+        """
+        return None
+
+    def _window_state_lines(self, state) -> str:
+        """Return lines that put ``parse_content()`` into block *state*.
+
+        They are prepended to a window and their references dropped.
+        """
+        return ""
+
+    def _prefiltered_lines(self, content: str) -> Iterator[Tuple[int, str]]:
+        """Yield ``(line_number, line)`` for the lines that pass the prefilter.
+
+        One ``PATH_TRIGGER_PATTERN.search()`` over the buffer jumps straight
+        to the next line with a trigger, so runs of plain lines are skipped
+        without being split out.  Skipped and total line counts accumulate
+        in ``prefilter_stats`` once the content is exhausted.
+        """
+        search = PATH_TRIGGER_PATTERN.search
+        find = content.find
+        size = len(content)
+        line_num = 1
+        line_start = 0
+        yielded = 0
+        pos = 0
+        while pos <= size:
+            match = search(content, pos)
+            if match is None:
+                break
+            start = content.rfind("\n", 0, match.start()) + 1
+            line_num += content.count("\n", line_start, start)
+            line_start = start
+            end = find("\n", match.end())
+            if end == -1:
+                end = size
+            yielded += 1
+            yield line_num, content[start:end]
+            pos = end + 1
+        total = content.count("\n") + 1
+        with self._prefilter_lock:
+            self.prefilter_stats["lines"] += total
+            self.prefilter_stats["skipped"] += total - yielded
+
+    #: True for parsers whose references depend only on their own line and
+    #: on block state marked by ``block_delimiter_pattern``, so an edited
+    #: file can be re-parsed from its changed lines (``reparse_content()``).
+    incremental = False
+
+    #: MULTILINE regex for lines that can open or close a block (code
+    #: fences, block comments, here-strings); None when there is no block
+    #: state.  Edits touching such a line fall back to a full parse.
+    block_delimiter_pattern: Optional[re.Pattern] = None
+
+    def reparse_content(
+        self, content: str, file_path: str, previous: Optional[LineSnapshot] = None
+    ) -> Tuple[List[LinkReference], LineSnapshot]:
+        """Parse *content*, re-using *previous* for the lines that did not change.
+
+        The changed range is the span between the longest common prefix and
+        suffix of line hashes.  Only that range is passed to
+        ``parse_content()``; references on the unchanged lines are copied
+        from *previous*, those after the range shifted by the change in
+        line count.  A full parse runs when there is no *previous*, when a
+        block delimiter was added or removed in the range, or when the range
+        starts inside a block (``_block_open_before()``).
+
+        Returns the references (offsets stamped) and the snapshot to pass
+        next time.
+        """
+        lines = content.split("\n")
+        hashes = array("q", map(hash, lines))
+        delimiters = self._delimiter_lines(content)
+        references = None
+        if previous is not None:
+            references = self._reparse_changed_lines(lines, hashes, delimiters, file_path, previous)
+        if references is None:
+            references = self.parse_content(content, file_path)
+        stamp_offsets(references, content)
+        snapshot = LineSnapshot(hashes, delimiters, [dataclasses.replace(r) for r in references])
+        return references, snapshot
+
+    def _reparse_changed_lines(
+        self,
+        lines: List[str],
+        hashes: array,
+        delimiters: List[int],
+        file_path: str,
+        previous: LineSnapshot,
+    ) -> Optional[List[LinkReference]]:
+        """Return merged references, or None when a full parse is needed."""
+        old_hashes = previous.line_hashes
+        old_count, new_count = len(old_hashes), len(hashes)
+        limit = min(old_count, new_count)
+        start = 0
+        while start < limit and old_hashes[start] == hashes[start]:
+            start += 1
+        trailing = 0
+        while (
+            trailing < limit - start
+            and old_hashes[old_count - 1 - trailing] == hashes[new_count - 1 - trailing]
+        ):
+            trailing += 1
+        old_end, new_end = old_count - trailing, new_count - trailing
+
+        if _has_index_in(previous.delimiters, start, old_end) or _has_index_in(
+            delimiters, start, new_end
+        ):
+            return None
+        if self._block_open_before(lines, delimiters, start):
+            return None
+
+        # Line numbers are 1-based: lines start+1 .. end changed.
+        shift = new_count - old_count
+        references = [
+            dataclasses.replace(ref, file_path=file_path)
+            for ref in previous.references
+            if ref.line_number <= start
+        ]
+        if new_end > start:
+            for ref in self.parse_content("\n".join(lines[start:new_end]), file_path):
+                ref.line_number += start
+                references.append(ref)
+        references.extend(
+            dataclasses.replace(ref, file_path=file_path, line_number=ref.line_number + shift)
+            for ref in previous.references
+            if ref.line_number > old_end
+        )
+        self.logger.debug(
+            "file_reparsed_incremental",
+            file_path=file_path,
+            lines_reparsed=new_end - start,
+            lines=new_count,
+        )
+        return references
+
+    def _delimiter_lines(self, content: str) -> List[int]:
+        """Return the 0-based indices of lines matching ``block_delimiter_pattern``."""
+        pattern = self.block_delimiter_pattern
+        if pattern is None:
+            return []
+        indices: List[int] = []
+        line = 0
+        pos = 0
+        for match in pattern.finditer(content):
+            line += content.count("\n", pos, match.start())
+            pos = match.start()
+            if not indices or indices[-1] != line:
+                indices.append(line)
+        return indices
+
+    def _block_open_before(self, lines: List[str], delimiters: List[int], index: int) -> bool:
+        """Return True if line *index* may depend on the lines before it.
+
+        *delimiters* are the block-delimiter line indices of *lines*; only
+        they can change block state.  Parsers with block state override this.
+        """
+        return False
+
     @abstractmethod
     def parse_content(self, content: str, file_path: str) -> List[LinkReference]:
         """
@@ -116,6 +484,19 @@ class BaseParser(ABC):
     #: Shared by YAML and JSON parsers (PD-BUG-060, PD-BUG-061).
     _path_pattern = re.compile(r"([a-zA-Z0-9_\-./\\]+\.[a-zA-Z0-9]+)")
 
+    # Per-parse forward-scan cursor of the structured-data parsers, kept
+    # thread-local so one parser instance can serve concurrent parses
+    # (e.g. parallel moved-file rewrites).
+    _scan_state = threading.local()
+
+    @property
+    def _search_start_line(self) -> int:
+        return getattr(self._scan_state, "line", 0)
+
+    @_search_start_line.setter
+    def _search_start_line(self, value: int):
+        self._scan_state.line = value
+
     @staticmethod
     def _walk_structured_data(data) -> Generator[Tuple[str, str], None, None]:
         """Yield ``(value, yaml_path)`` for every string leaf in a nested dict/list structure.
@@ -6,10 +6,12 @@ and other file references, excluding package imports.
 
 AI Context
 ----------
-- **Entry point**: ``parse_content()`` — iterates lines, delegates
-  to 5 ``_extract_*()`` helpers.  Import/part lines are processed
-  separately; quoted, standalone, and embedded extractors only run
-  on non-import/non-part lines to avoid duplicates.
+- **Entry point**: ``parse_content()`` — delegates to 4
+  ``_extract_*()`` helpers, each running its pattern once over the
+  whole buffer (``LineIndex`` in base.py maps offsets to line and
+  column).  Quoted, standalone, and embedded refs on import/part lines
+  are dropped to avoid duplicates; results are regrouped into per-line
+  order.
 - **Pattern architecture**: 5 compiled regexes in ``__init__()`` —
   ``import_pattern`` (``import '...'``), ``part_pattern``
   (``part '...'``), ``quoted_pattern`` (shared from
@@ -33,24 +35,28 @@ AI Context
 """
 
 import re
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from ..link_types import LinkType
 from ..models import LinkReference
-from .base import BaseParser
+from .base import BaseParser, LineIndex
 from .patterns import QUOTED_PATH_PATTERN
 
 
 class DartParser(BaseParser):
     """Parser for Dart files (.dart)."""
 
+    line_oriented = True
+
     def __init__(self):
         super().__init__()
         # Pattern for import statements
-        self.import_pattern = re.compile(r"import\s+['\"]([^'\"]+)['\"]")
+        # Patterns run over the whole buffer (LineIndex): whitespace and
+        # negated classes exclude "\n" so no match spans lines.
+        self.import_pattern = re.compile(r"import[^\S\n]+['\"]([^'\"\n]+)['\"]")
 
         # Pattern for part statements
-        self.part_pattern = re.compile(r"part\s+['\"]([^'\"]+)['\"]")
+        self.part_pattern = re.compile(r"part[^\S\n]+['\"]([^'\"\n]+)['\"]")
 
         self.quoted_pattern = QUOTED_PATH_PATTERN
 
@@ -61,135 +67,150 @@ class DartParser(BaseParser):
         # PD-BUG-080: Use lookahead for trailing boundary so sentence punctuation
         # doesn't break the match.
         self.standalone_pattern = re.compile(
-            r"(?:^|\s)([a-zA-Z0-9_\-./\\]+\.[a-zA-Z0-9]+)(?=[.,;:!?)\]}\s]|$)"
+            r"(?:^|\s)([a-zA-Z0-9_\-./\\]+\.[a-zA-Z0-9]+)(?=[.,;:!?)\]}\s]|$)", re.MULTILINE
         )
 
     def parse_content(self, content: str, file_path: str) -> List[LinkReference]:
-        """Parse Dart content for file references."""
-        try:
-            lines = content.split("\n")
-            references = []
+        """Parse Dart content for file references.
 
-            for line_num, line in enumerate(lines, 1):
-                references.extend(self._extract_imports(line, line_num, file_path))
-                references.extend(self._extract_parts(line, line_num, file_path))
-
-                # Quoted, standalone, and embedded only on non-import/non-part lines
-                if not (self.import_pattern.search(line) or self.part_pattern.search(line)):
-                    references.extend(self._extract_quoted_refs(line, line_num, file_path))
-                    references.extend(self._extract_standalone_refs(line, line_num, file_path))
-                    references.extend(
-                        self._extract_embedded_refs(line, line_num, file_path, references)
-                    )
+        Each pattern runs once over the whole buffer; line numbers and
+        columns come from a ``LineIndex``.  References are returned in the
+        same per-line order as a line-by-line scan.
+        """
+        try:
+            index = LineIndex(content)
+            # line_number -> [import/part refs, quoted refs, standalone refs,
+            # embedded refs], flattened in that order per line at the end.
+            by_line: Dict[int, List[List[LinkReference]]] = {}
+
+            def bucket(line_num: int, kind: int) -> List[LinkReference]:
+                slots = by_line.get(line_num)
+                if slots is None:
+                    slots = by_line[line_num] = [[], [], [], []]
+                return slots[kind]
+
+            # Import/part statements; their lines skip the other extractors.
+            statement_lines = set()
+            for line_num, ref in self._extract_statements(content, index, file_path):
+                statement_lines.add(line_num)
+                if ref is not None:
+                    bucket(line_num, 0).append(ref)
+
+            for kind, extract in (
+                (1, self._extract_quoted_refs),
+                (2, self._extract_standalone_refs),
+            ):
+                for ref in extract(content, index, file_path):
+                    if ref.line_number not in statement_lines:
+                        bucket(ref.line_number, kind).append(ref)
+
+            for ref in self._extract_embedded_refs(content, index, file_path, by_line):
+                if ref.line_number not in statement_lines:
+                    bucket(ref.line_number, 3).append(ref)
 
+            references = []
+            for line_num in sorted(by_line):
+                for refs in by_line[line_num]:
+                    references.extend(refs)
             return references
 
         except Exception as e:
             self.logger.warning("parse_error", file_path=file_path, parser="dart", error=str(e))
             return []
 
-    def _extract_imports(self, line: str, line_num: int, file_path: str) -> List[LinkReference]:
-        """Extract import statement references from a line."""
+    def _extract_statements(
+        self, content: str, index: LineIndex, file_path: str
+    ) -> List[Tuple[int, Optional[LinkReference]]]:
+        """Extract import and part statement references.
+
+        Returns ``(line_number, ref)`` for every statement, with ``ref``
+        None for skipped ``package:``/``dart:`` imports, ordered by position
+        (imports before parts on the same line).
+        """
         results = []
-        for match in self.import_pattern.finditer(line):
+        for match in self.import_pattern.finditer(content):
+            line_num, column = index.locate(match.start(1))
             import_path = match.group(1)
             if import_path.startswith("package:") or import_path.startswith("dart:"):
+                results.append((line_num, None))
                 continue
             results.append(
-                LinkReference(
-                    file_path=file_path,
-                    line_number=line_num,
-                    column_start=match.start(1),
-                    column_end=match.end(1),
-                    link_text=import_path,
-                    link_target=import_path,
-                    link_type=LinkType.DART_IMPORT,
+                (
+                    line_num,
+                    self._make_ref(file_path, line_num, column, import_path, LinkType.DART_IMPORT),
                 )
             )
-        return results
-
-    def _extract_parts(self, line: str, line_num: int, file_path: str) -> List[LinkReference]:
-        """Extract part statement references from a line."""
-        results = []
-        for match in self.part_pattern.finditer(line):
+        parts = []
+        for match in self.part_pattern.finditer(content):
+            line_num, column = index.locate(match.start(1))
             part_path = match.group(1)
-            results.append(
-                LinkReference(
-                    file_path=file_path,
-                    line_number=line_num,
-                    column_start=match.start(1),
-                    column_end=match.end(1),
-                    link_text=part_path,
-                    link_target=part_path,
-                    link_type=LinkType.DART_PART,
+            parts.append(
+                (
+                    line_num,
+                    self._make_ref(file_path, line_num, column, part_path, LinkType.DART_PART),
                 )
             )
-        return results
+        # Stable sort: per line, imports stay ahead of parts.
+        return sorted(results + parts, key=lambda item: item[0])
 
-    def _extract_quoted_refs(self, line: str, line_num: int, file_path: str) -> List[LinkReference]:
-        """Extract quoted file path references from a line."""
+    def _extract_quoted_refs(
+        self, content: str, index: LineIndex, file_path: str
+    ) -> List[LinkReference]:
+        """Extract quoted file path references."""
         results = []
-        for match in self.quoted_pattern.finditer(line):
+        for match in self.quoted_pattern.finditer(content):
             potential_file = match.group(1)
             if potential_file.startswith("package:") or potential_file.startswith("dart:"):
                 continue
             if self._looks_like_file_path(potential_file):
+                line_num, column = index.locate(match.start(1))
                 results.append(
-                    LinkReference(
-                        file_path=file_path,
-                        line_number=line_num,
-                        column_start=match.start(1),
-                        column_end=match.end(1),
-                        link_text=potential_file,
-                        link_target=potential_file,
-                        link_type=LinkType.DART_QUOTED,
+                    self._make_ref(
+                        file_path, line_num, column, potential_file, LinkType.DART_QUOTED
                     )
                 )
         return results
 
     def _extract_standalone_refs(
-        self, line: str, line_num: int, file_path: str
+        self, content: str, index: LineIndex, file_path: str
     ) -> List[LinkReference]:
-        """Extract standalone (unquoted) file path references from a line."""
+        """Extract standalone (unquoted) file path references."""
         results = []
-        for match in self.standalone_pattern.finditer(line):
+        for match in self.standalone_pattern.finditer(content):
             potential_file = match.group(1)
             if potential_file.startswith("package:") or potential_file.startswith("dart:"):
                 continue
             if self._looks_like_file_path(potential_file):
+                line_num, column = index.locate(match.start(1))
                 results.append(
-                    LinkReference(
-                        file_path=file_path,
-                        line_number=line_num,
-                        column_start=match.start(1),
-                        column_end=match.end(1),
-                        link_text=potential_file,
-                        link_target=potential_file,
-                        link_type=LinkType.DART_STANDALONE,
+                    self._make_ref(
+                        file_path, line_num, column, potential_file, LinkType.DART_STANDALONE
                     )
                 )
         return results
 
     def _extract_embedded_refs(
         self,
-        line: str,
-        line_num: int,
+        content: str,
+        index: LineIndex,
         file_path: str,
-        references: List[LinkReference],
+        by_line: Dict[int, List[List[LinkReference]]],
     ) -> List[LinkReference]:
-        """Extract embedded file path references from a line.
+        """Extract embedded file path references.
 
-        Deduplicates against existing refs.
+        Deduplicates against the quoted and standalone refs of the same line.
         """
         results = []
-        for match in self.embedded_pattern.finditer(line):
+        for match in self.embedded_pattern.finditer(content):
             potential_file = match.group(1)
             if potential_file.startswith("package:") or potential_file.startswith("dart:"):
                 continue
 
+            line_num, start_pos = index.locate(match.start(1))
+
             # Skip URLs (check if preceded by http:// or https://)
-            start_pos = match.start(1)
             if potential_file.startswith("//"):
+                line = index.line(line_num)
                 if start_pos >= 1 and line[start_pos - 1] == ":":
                     if start_pos >= 6 and line[start_pos - 6 : start_pos - 1] == "https":
                         continue
@@ -197,29 +218,32 @@ class DartParser(BaseParser):
                         continue
 
             # Skip if already found by other patterns
-            already_found = False
-            for existing_ref in references:
-                if (
-                    existing_ref.line_number == line_num
-                    and existing_ref.link_target == potential_file
-                    and existing_ref.column_start <= match.start(1) < existing_ref.column_end
-                ):
-                    already_found = True
-                    break
-
-            if already_found:
+            slots = by_line.get(line_num)
+            if slots is not None and any(
+                existing_ref.link_target == potential_file
+                and existing_ref.column_start <= start_pos < existing_ref.column_end
+                for existing_ref in slots[1] + slots[2]
+            ):
                 continue
 
             if self._looks_like_file_path(potential_file):
                 results.append(
-                    LinkReference(
-                        file_path=file_path,
-                        line_number=line_num,
-                        column_start=match.start(1),
-                        column_end=match.end(1),
-                        link_text=potential_file,
-                        link_target=potential_file,
-                        link_type=LinkType.DART_EMBEDDED,
+                    self._make_ref(
+                        file_path, line_num, start_pos, potential_file, LinkType.DART_EMBEDDED
                     )
                 )
         return results
+
+    @staticmethod
+    def _make_ref(
+        file_path: str, line_num: int, column: int, target: str, link_type: LinkType
+    ) -> LinkReference:
+        return LinkReference(
+            file_path=file_path,
+            line_number=line_num,
+            column_start=column,
+            column_end=column + len(target),
+            link_text=target,
+            link_target=target,
+            link_type=link_type,
+        )
@@ -6,10 +6,11 @@ using simple heuristics. It's used as a fallback for unsupported file types.
 
 AI Context
 ----------
-- **Entry point**: ``parse_content()`` — iterates lines with a
-  three-pass strategy: quoted file paths first, then quoted
-  directory paths, then unquoted paths (only if no quoted paths
-  matched on the same line).
+- **Entry point**: ``parse_content()`` — three passes over the whole
+  buffer: quoted file paths first, then quoted directory paths, then
+  unquoted paths (only on lines where no quoted path matched).  Line
+  numbers and columns come from a ``LineIndex`` (base.py); results are
+  sorted back into per-line pass order.
 - **Pattern architecture**: 3 compiled regexes in ``__init__()`` —
   ``quoted_pattern`` and ``quoted_dir_pattern`` (shared from
   ``parsers/patterns.py``), and ``unquoted_pattern`` (conservative
@@ -38,13 +39,16 @@ from typing import List
 
 from ..link_types import LinkType
 from ..models import LinkReference
-from .base import BaseParser
+from .base import BaseParser, LineIndex
 from .patterns import QUOTED_DIR_PATTERN, QUOTED_PATH_PATTERN
 
 
 class GenericParser(BaseParser):
     """Generic parser for any text file."""
 
+    line_oriented = True
+    incremental = True
+
     def __init__(self):
         super().__init__()
         self.quoted_pattern = QUOTED_PATH_PATTERN
@@ -54,78 +58,104 @@ class GenericParser(BaseParser):
         # Pattern for unquoted file paths (be conservative)
         # PD-BUG-080: Use lookahead for trailing boundary so sentence punctuation
         # doesn't break the match.
+        # Whole-buffer scan: MULTILINE makes ^/$ match at every line boundary.
         self.unquoted_pattern = re.compile(
-            r"(?:^|\s)([a-zA-Z0-9_\-./\\]+\.[a-zA-Z0-9]+)(?=[.,;:!?)\]}\s]|$)"
+            r"(?:^|\s)([a-zA-Z0-9_\-./\\]+\.[a-zA-Z0-9]+)(?=[.,;:!?)\]}\s]|$)", re.MULTILINE
         )
 
     def parse_content(self, content: str, file_path: str) -> List[LinkReference]:
-        """Parse generic text content for file references."""
-        try:
-            lines = content.split("\n")
-            references = []
-
-            for line_num, line in enumerate(lines, 1):
-                # Look for quoted file paths first (more reliable)
-                for match in self.quoted_pattern.finditer(line):
-                    potential_file = match.group(1)
+        """Parse generic text content for file references.
 
-                    if self._looks_like_file_path(potential_file):
-                        references.append(
+        Each pattern runs once over the whole buffer; line numbers and
+        columns come from a ``LineIndex``.  References are returned in the
+        same per-line order as a line-by-line scan.
+        """
+        try:
+            index = LineIndex(content)
+            # (line_number, pass, reference) — sorted by line then pass so the
+            # output matches the three-pass per-line order.
+            found = []
+            quoted_lines = set()
+
+            # Look for quoted file paths first (more reliable)
+            for match in self.quoted_pattern.finditer(content):
+                line_num, column = index.locate(match.start(1))
+                quoted_lines.add(line_num)
+                potential_file = match.group(1)
+
+                if self._looks_like_file_path(potential_file):
+                    found.append(
+                        (
+                            line_num,
+                            0,
                             LinkReference(
                                 file_path=file_path,
                                 line_number=line_num,
-                                column_start=match.start(1),
-                                column_end=match.end(1),
+                                column_start=column,
+                                column_end=column + len(potential_file),
                                 link_text=potential_file,
                                 link_target=potential_file,
                                 link_type=LinkType.GENERIC_QUOTED,
-                            )
+                            ),
                         )
-
-                # PD-BUG-021: Look for quoted directory paths (paths without extensions)
-                for match in self.quoted_dir_pattern.finditer(line):
-                    potential_dir = match.group(1)
-
-                    # Skip if it has a file extension (already handled by quoted_pattern)
-                    _, ext = os.path.splitext(potential_dir)
-                    if ext:
-                        continue
-
-                    if self._looks_like_directory_path(potential_dir):
-                        references.append(
+                    )
+
+            # PD-BUG-021: Look for quoted directory paths (paths without extensions)
+            for match in self.quoted_dir_pattern.finditer(content):
+                potential_dir = match.group(1)
+
+                # Skip if it has a file extension (already handled by quoted_pattern)
+                _, ext = os.path.splitext(potential_dir)
+                if ext:
+                    continue
+
+                if self._looks_like_directory_path(potential_dir):
+                    line_num, column = index.locate(match.start(1))
+                    found.append(
+                        (
+                            line_num,
+                            1,
                             LinkReference(
                                 file_path=file_path,
                                 line_number=line_num,
-                                column_start=match.start(1),
-                                column_end=match.end(1),
+                                column_start=column,
+                                column_end=column + len(potential_dir),
                                 link_text=potential_dir,
                                 link_target=potential_dir,
                                 link_type=LinkType.GENERIC_QUOTED_DIR,
+                            ),
+                        )
+                    )
+
+            # Look for unquoted file paths (less reliable, be conservative)
+            # Only on lines where no quoted paths were found
+            for match in self.unquoted_pattern.finditer(content):
+                line_num, column = index.locate(match.start(1))
+                if line_num in quoted_lines:
+                    continue
+                potential_file = match.group(1)
+
+                if self._looks_like_file_path(potential_file):
+                    # Additional validation for unquoted paths
+                    if self._is_likely_file_reference(potential_file, index.line(line_num)):
+                        found.append(
+                            (
+                                line_num,
+                                2,
+                                LinkReference(
+                                    file_path=file_path,
+                                    line_number=line_num,
+                                    column_start=column,
+                                    column_end=column + len(potential_file),
+                                    link_text=potential_file,
+                                    link_target=potential_file,
+                                    link_type=LinkType.GENERIC_UNQUOTED,
+                                ),
                             )
                         )
 
-                # Look for unquoted file paths (less reliable, be conservative)
-                # Only if no quoted paths were found on this line
-                if not self.quoted_pattern.search(line):
-                    for match in self.unquoted_pattern.finditer(line):
-                        potential_file = match.group(1)
-
-                        if self._looks_like_file_path(potential_file):
-                            # Additional validation for unquoted paths
-                            if self._is_likely_file_reference(potential_file, line):
-                                references.append(
-                                    LinkReference(
-                                        file_path=file_path,
-                                        line_number=line_num,
-                                        column_start=match.start(1),
-                                        column_end=match.end(1),
-                                        link_text=potential_file,
-                                        link_target=potential_file,
-                                        link_type=LinkType.GENERIC_UNQUOTED,
-                                    )
-                                )
-
-            return references
+            found.sort(key=lambda item: (item[0], item[1]))
+            return [ref for _, _, ref in found]
 
         except Exception as e:
             self.logger.warning("parse_error", file_path=file_path, parser="generic", error=str(e))
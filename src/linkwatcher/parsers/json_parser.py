@@ -6,21 +6,26 @@ from string values throughout the JSON structure.
 
 AI Context
 ----------
-- **Entry point**: ``parse_content()`` — parses JSON via
-  ``json.loads()``, walks the parsed tree with
-  ``_walk_structured_data()`` (inherited from ``BaseParser``),
-  and processes each string value through
-  ``_process_string_value()``.  Falls back to ``GenericParser``
-  on ``JSONDecodeError``.
-- **Pattern architecture**: No compiled regexes in this class.
+- **Entry point**: ``parse_content()`` — scans the source text with
+  ``iter_json_strings()``, which yields every string value with its
+  JSON path and exact line/column without building the object tree,
+  and processes each value through ``_process_string_value()``.
+  Falls back to ``GenericParser`` on ``JSONDecodeError`` (the scanner
+  rejects exactly what ``json.loads()`` rejects).
+- **Oversize files**: ``parse_oversize_file()`` feeds the same scanner
+  1 MiB chunks via ``parse_stream()``, so files above
+  ``max_file_size_mb`` are parsed in bounded memory instead of skipped.
+  Encodings come from ``sniff_file_encodings()``; ``parse_stream()``
+  skips a leading BOM.  The scanner holds back any token that could
+  continue in the next chunk, including numbers cut after ``1.``/``1e``.
+- **Pattern architecture**: ``_JSON_TOKEN`` (module level) is the
+  scanner's only regex; the class itself compiles none.
   Uses ``_classify_path()`` (from ``BaseParser``) for file vs
   directory detection, and ``_path_pattern`` (from ``BaseParser``)
   for embedded path extraction.
-- **Duplicate handling**: A ``claimed`` set of ``(value, line_num)``
-  tuples prevents the same JSON value on the same line from being
-  matched twice (PD-BUG-013).  ``_find_unclaimed_line()`` scans
-  forward from ``_search_start_line`` for O(V+L) amortized
-  performance.
+- **Duplicate handling**: Scanner positions are exact, so duplicate
+  values (PD-BUG-013) need no bookkeeping.  Values with backslash
+  escapes are skipped: their decoded text is not in the source.
 - **Embedded path extraction**: ``_extract_embedded_paths()``
   handles compound strings containing spaces (PD-BUG-061), e.g.
   ``"Bash(python doc/scripts/run.py *)"``.
@@ -28,18 +33,181 @@ AI Context
 - **Common tasks**:
   - Debugging missed paths: check ``_classify_path()`` in
     ``base.py`` — it determines file vs directory classification.
-  - Debugging duplicate matches: check the ``claimed`` set logic
-    in ``_process_string_value()`` and ``_find_unclaimed_line()``.
+  - Debugging wrong positions or fallbacks to ``GenericParser``: run
+    ``iter_json_strings()`` on the content directly.
   - Testing: ``test/automated/unit/2-link-parsing-update/2-0-link-parsing-update/test_json.py``.
 """
 
 import json
-from typing import List
+import re
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from ..link_types import LinkType
 from ..models import LinkReference
+from ..utils import BinaryFileError, iter_text_chunks, sniff_file_encodings
 from .base import BaseParser
 
+# One JSON value token with everything that leads up to it: whitespace,
+# an optional "," and an optional ``"key":`` prefix.  A typical object
+# member costs a single match.  Strings follow RFC 8259 (no raw control
+# characters); NaN/Infinity are accepted like json.loads().
+_JSON_STRING = r'"[^"\\\x00-\x1f]*(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})[^"\\\x00-\x1f]*)*"'
+_JSON_TOKEN = re.compile(
+    rf"""(?P<lead>[ \t\r\n]*(?:,[ \t\r\n]*)?)
+    (?:(?P<key>{_JSON_STRING})[ \t\r\n]*:[ \t\r\n]*)?
+    (?:
+        (?P<string>{_JSON_STRING})
+      | (?P<punct>[{{}}\[\]:])
+      | (?P<scalar>-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?
+                  |true|false|null|NaN|-?Infinity)
+    )""",
+    re.VERBOSE,
+)
+_TRAILING_WS = re.compile(r"[ \t\r\n]*")
+# Text after a scalar that may still be part of it once the next chunk
+# arrives (``1.`` | ``5``, ``1e`` | ``-3``).
+_SCALAR_TAIL = re.compile(r"[0-9.eE+\-]*\Z")
+# Characters read per chunk when streaming oversize files.
+_STREAM_CHUNK_CHARS = 1 << 20
+
+# Scanner states: what the next token may be.
+_VALUE, _VALUE_OR_CLOSE, _NAME, _NAME_OR_CLOSE, _COLON, _COMMA_OR_CLOSE, _DONE = range(7)
+
+
+def iter_json_strings(chunks: Iterable[str]) -> Iterator[Tuple[str, str, int, int, bool]]:
+    """Stream the string values of a JSON document without building it.
+
+    Yields ``(value, json_path, line_number, column, escaped)`` for every
+    string *value* (object keys are not yielded), in document order.
+    ``json_path`` uses the ``_walk_structured_data()`` format
+    (``.key[0].sub``); ``line_number`` is 1-based and ``column`` is the
+    0-based position of the first character inside the quotes.
+    ``escaped`` is True when the raw text contains backslash escapes, so
+    the decoded value does not appear verbatim in the source.
+
+    *chunks* is any iterable of text pieces (e.g. a file read in blocks);
+    tokens may straddle chunk boundaries.  Raises ``json.JSONDecodeError``
+    on input that ``json.loads()`` would reject.
+    """
+    chunk_iter = iter(chunks)
+    buf = ""
+    pos = 0
+    base = 0  # absolute offset of buf[0]
+    line = 1
+    line_start = 0  # absolute offset of the current line's first character
+    counted = 0  # buf index up to which newlines are included in `line`
+    state = _VALUE
+    # Open containers as [is_object, key_or_index, path_of_container]
+    stack: List[list] = []
+    exhausted = False
+
+    while True:
+        buf_len = len(buf)
+        for match in _JSON_TOKEN.finditer(buf, pos):
+            start, end = match.span()
+            # A gap means an invalid (or chunk-truncated) token; a token
+            # touching the buffer end may continue in the next chunk, and
+            # so may a number followed only by number characters.
+            if start != pos or (
+                not exhausted
+                and (
+                    end == buf_len or (match.lastgroup == "scalar" and _SCALAR_TAIL.match(buf, end))
+                )
+            ):
+                break
+            pos = end
+            lead, key, raw, punct, _scalar = match.groups()
+
+            if "," in lead:
+                if state != _COMMA_OR_CLOSE:
+                    raise json.JSONDecodeError("Expecting value", buf, start)
+                top = stack[-1]
+                if top[0]:
+                    state = _NAME
+                else:
+                    top[1] += 1
+                    state = _VALUE
+            if key is not None:
+                if state != _NAME and state != _NAME_OR_CLOSE:
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buf, start)
+                stack[-1][1] = json.loads(key) if "\\" in key else key[1:-1]
+                state = _VALUE
+
+            if raw is not None:
+                escaped = "\\" in raw
+                if state == _NAME or state == _NAME_OR_CLOSE:
+                    # Key whose ":" is not part of this match (e.g. chunk boundary)
+                    stack[-1][1] = json.loads(raw) if escaped else raw[1:-1]
+                    state = _COLON
+                    continue
+                if state != _VALUE and state != _VALUE_OR_CLOSE:
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buf, start)
+                if stack:
+                    is_object, name, prefix = stack[-1]
+                    path = f"{prefix}.{name}" if is_object else f"{prefix}[{name}]"
+                    state = _COMMA_OR_CLOSE
+                else:
+                    path = ""
+                    state = _DONE
+                token_start = end - len(raw)
+                newlines = buf.count("\n", counted, token_start)
+                if newlines:
+                    line += newlines
+                    line_start = base + buf.rindex("\n", counted, token_start) + 1
+                counted = token_start
+                value = json.loads(raw) if escaped else raw[1:-1]
+                yield value, path, line, base + token_start - line_start + 1, escaped
+            elif punct is not None:
+                if punct == ":":
+                    if state != _COLON:
+                        raise json.JSONDecodeError("Expecting ':' delimiter", buf, start)
+                    state = _VALUE
+                elif punct == "{" or punct == "[":
+                    if state != _VALUE and state != _VALUE_OR_CLOSE:
+                        raise json.JSONDecodeError("Expecting ',' delimiter", buf, start)
+                    if stack:
+                        is_object, name, prefix = stack[-1]
+                        path = f"{prefix}.{name}" if is_object else f"{prefix}[{name}]"
+                    else:
+                        path = ""
+                    if punct == "{":
+                        stack.append([True, "", path])
+                        state = _NAME_OR_CLOSE
+                    else:
+                        stack.append([False, 0, path])
+                        state = _VALUE_OR_CLOSE
+                else:  # "}" or "]"
+                    if (
+                        not stack
+                        or stack[-1][0] != (punct == "}")
+                        or state not in (_COMMA_OR_CLOSE, _NAME_OR_CLOSE, _VALUE_OR_CLOSE)
+                    ):
+                        raise json.JSONDecodeError("Unexpected close", buf, start)
+                    stack.pop()
+                    state = _COMMA_OR_CLOSE if stack else _DONE
+            else:  # number / true / false / null
+                if state != _VALUE and state != _VALUE_OR_CLOSE:
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buf, start)
+                state = _COMMA_OR_CLOSE if stack else _DONE
+
+        if not exhausted:
+            chunk = next(chunk_iter, None)
+            if chunk is None:
+                exhausted = True
+            else:
+                newlines = buf.count("\n", counted, pos)
+                if newlines:
+                    line += newlines
+                    line_start = base + buf.rindex("\n", counted, pos) + 1
+                base += pos
+                buf = buf[pos:] + chunk
+                pos = counted = 0
+            continue
+        if state == _DONE and _TRAILING_WS.match(buf, pos).end() == len(buf):
+            return
+        raise json.JSONDecodeError("Expecting value" if state != _DONE else "Extra data", buf, pos)
+
 
 class JsonParser(BaseParser):
     """Parser for JSON files (.json)."""
@@ -47,21 +215,8 @@ class JsonParser(BaseParser):
     def parse_content(self, content: str, file_path: str) -> List[LinkReference]:
         """Parse JSON content for file references."""
         try:
-            lines = content.split("\n")
-            references = []
-
             try:
-                # Parse JSON to find file references
-                data = json.loads(content)
-
-                # Track claimed (value, line) pairs to handle duplicate values (PD-BUG-013)
-                claimed = set()
-                self._search_start_line = 0  # Offset for O(V+L) scanning
-
-                # Walk the parsed tree and process each string value
-                for value, _path in self._walk_structured_data(data):
-                    self._process_string_value(value, file_path, lines, references, claimed)
-
+                return self.parse_stream([content], file_path)
             except json.JSONDecodeError:
                 # Fall back to generic parsing if JSON is invalid
                 from .generic import GenericParser
@@ -69,86 +224,95 @@ class JsonParser(BaseParser):
                 generic_parser = GenericParser()
                 return generic_parser.parse_content(content, file_path)
 
-            return references
-
         except Exception as e:
             self.logger.warning("parse_error", file_path=file_path, parser="json", error=str(e))
             return []
 
-    @staticmethod
-    def _find_unclaimed_line(
-        lines: List[str], search_text: str, claimed: set, start_line: int = 0
-    ) -> int:
-        """Find next line containing search_text not yet claimed for this value (PD-BUG-013).
+    def parse_oversize_file(self, file_path: str) -> Optional[List[LinkReference]]:
+        """Stream a JSON file above ``max_file_size_mb`` in fixed-size chunks."""
+        try:
+            encodings = sniff_file_encodings(file_path)
+        except BinaryFileError:
+            self.logger.debug("file_skipped_binary", file_path=file_path)
+            return []
+        except OSError as e:
+            self.logger.warning("parse_error", file_path=file_path, parser="json", error=str(e))
+            return []
+
+        for encoding in encodings:
+            try:
+                return self.parse_stream(
+                    iter_text_chunks(file_path, encoding, _STREAM_CHUNK_CHARS), file_path
+                )
+            except UnicodeDecodeError:
+                continue
+            except (json.JSONDecodeError, OSError) as e:
+                self.logger.warning("parse_error", file_path=file_path, parser="json", error=str(e))
+                return []
+        return []
+
+    def parse_stream(self, chunks: Iterable[str], file_path: str) -> List[LinkReference]:
+        """Parse JSON text arriving in *chunks* for file references.
 
-        Scans from start_line for O(V+L) amortized performance instead of O(V*L).
-        Falls back to scanning lines before start_line for out-of-order edge cases.
+        Only one chunk and the current token are held, never the document.
+        Values with backslash escapes are skipped: their decoded text does
+        not appear verbatim in the file, so it could not be rewritten in
+        place.  Raises ``json.JSONDecodeError`` on invalid JSON.
         """
-        # Scan from start_line forward
-        for i in range(start_line, len(lines)):
-            if search_text in lines[i] and (search_text, i + 1) not in claimed:
-                return i + 1
-        # Fallback: scan lines before start_line
-        for i in range(0, start_line):
-            if search_text in lines[i] and (search_text, i + 1) not in claimed:
-                return i + 1
-        return 0
+        references: List[LinkReference] = []
+        chunks = iter(chunks)
+        first = next(chunks, "")
+        # A BOM (accepted by json.load() on bytes) stays in the decoded text
+        # the updater edits, so line-1 columns keep counting it.
+        bom = first.startswith("\ufeff")
+        if bom:
+            first = first[1:]
+        for value, _path, line_num, column, escaped in iter_json_strings(chain([first], chunks)):
+            if not escaped:
+                if bom and line_num == 1:
+                    column += 1
+                self._process_string_value(value, file_path, references, line_num, column)
+        return references
 
     def _process_string_value(
         self,
         data: str,
         file_path: str,
-        lines: List[str],
         references: List[LinkReference],
-        claimed: set,
+        line_num: int,
+        col_start: int,
     ):
-        """Process a single string value from the JSON tree."""
+        """Process one string value found at ``(line_num, col_start)``."""
         # PD-BUG-061: If the string contains spaces, it may be a compound
         # command string with embedded paths (e.g., "Bash(python doc/scripts/run.py *)").
         # Try sub-path extraction first; fall through to whole-string check if nothing found.
         if " " in data:
-            embedded = self._extract_embedded_paths(data, file_path, lines, references, claimed)
-            if embedded:
+            if self._extract_embedded_paths(data, file_path, references, line_num, col_start):
                 return
 
         # Check for file paths (with extension) or directory paths (PD-BUG-030)
         is_file, is_dir = self._classify_path(data)
 
         if is_file or is_dir:
-            # Find the next unclaimed line for this value (PD-BUG-013)
-            line_num = self._find_unclaimed_line(lines, data, claimed, self._search_start_line)
-            if line_num > 0:
-                claimed.add((data, line_num))
-                self._search_start_line = line_num - 1  # Resume from this line next time
-                # Find the column position
-                line_content = lines[line_num - 1]
-                col_start = line_content.find(f'"{data}"')
-                if col_start >= 0:
-                    col_start += 1  # Skip opening quote
-                    col_end = col_start + len(data)
-                else:
-                    col_start = line_content.find(data)
-                    col_end = col_start + len(data) if col_start >= 0 else 0
-
-                references.append(
-                    LinkReference(
-                        file_path=file_path,
-                        line_number=line_num,
-                        column_start=col_start,
-                        column_end=col_end,
-                        link_text=data,
-                        link_target=data,
-                        link_type=LinkType.JSON_DIR if is_dir else LinkType.JSON,
-                    )
+            references.append(
+                LinkReference(
+                    file_path=file_path,
+                    line_number=line_num,
+                    column_start=col_start,
+                    column_end=col_start + len(data),
+                    link_text=data,
+                    link_target=data,
+                    link_type=LinkType.JSON_DIR if is_dir else LinkType.JSON,
                 )
+            )
 
     def _extract_embedded_paths(
         self,
         data: str,
         file_path: str,
-        lines: List[str],
         references: List[LinkReference],
-        claimed: set,
+        line_num: int,
+        val_col_start: int,
     ) -> bool:
         """
         PD-BUG-061: Extract file paths embedded within compound strings.
@@ -160,33 +324,17 @@ class JsonParser(BaseParser):
         Returns True if any embedded paths were found.
         """
         found = False
-        line_num = 0
-        val_col_start = 0
         for match in self._path_pattern.finditer(data):
             candidate = match.group(1)
             if "/" not in candidate and "\\" not in candidate:
                 continue
             if self._looks_like_file_path(candidate):
-                if not found:
-                    line_num = self._find_unclaimed_line(
-                        lines, data, claimed, self._search_start_line
-                    )
-                    if line_num == 0:
-                        return False
-                    claimed.add((data, line_num))
-                    self._search_start_line = line_num - 1
-                    line_content = lines[line_num - 1]
-                    val_col_start = line_content.find(data)
-                    if val_col_start < 0:
-                        val_col_start = 0
-                col_start = val_col_start + match.start(1)
-                col_end = val_col_start + match.end(1)
                 references.append(
                     LinkReference(
                         file_path=file_path,
                         line_number=line_num,
-                        column_start=col_start,
-                        column_end=col_end,
+                        column_start=val_col_start + match.start(1),
+                        column_end=val_col_start + match.end(1),
                         link_text=candidate,
                         link_target=candidate,
                         link_type=LinkType.JSON,
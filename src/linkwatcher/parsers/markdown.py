@@ -13,6 +13,13 @@ AI Context
   covering markdown links (``[text](url)``), reference-style
   (``[label]: url``), HTML anchors, quoted/backtick/bare/@-prefixed
   paths, and shared patterns from ``parsers/patterns.py``.
+- **Trigger gating**: lines come from ``BaseParser._prefiltered_lines()``,
+  so lines without a ``PATH_TRIGGER_PATTERN`` match (separator, quote,
+  backtick, bracket, ``.`` + extension character) are never visited.
+  Every pattern also needs a literal marker (``](``, ``]:``, ``<``, a
+  quote, a backtick, a separator); ``parse_content()`` checks the markers
+  once per line and only calls the extractors that can match.  When
+  adding a pattern, make sure the prefilter admits its marker.
 - **Link types**: Uses ``LinkType`` enum members from ``link_types.py``.
 - **Overlap prevention**: higher-priority extractors (standard links,
   HTML anchors) return *span tuples* that lower-priority extractors
@@ -42,6 +49,11 @@ from .patterns import QUOTED_DIR_PATTERN, QUOTED_PATH_PATTERN
 class MarkdownParser(BaseParser):
     """Parser for Markdown files (.md)."""
 
+    line_oriented = True
+    incremental = True
+    # Code fences (mermaid state) and frontmatter ``---`` lines.
+    block_delimiter_pattern = re.compile(r"^[^\S\n]*(?:```|---[^\S\n]*$)", re.MULTILINE)
+
     def __init__(self):
         super().__init__()
         # Pattern 1: Standard markdown links [text](link) - handles balanced parentheses
@@ -451,6 +463,56 @@ class MarkdownParser(BaseParser):
             )
         return refs
 
+    def _block_open_before(self, lines: List[str], delimiters: List[int], index: int) -> bool:
+        """Line *index* depends on earlier lines inside frontmatter or a mermaid
+        block, and line 1 decides whether there is frontmatter at all."""
+        if index == 0:
+            return True
+        fm_close = self._frontmatter_close(lines, delimiters)
+        if index <= fm_close:
+            return True
+        return self._replay_fences(lines, delimiters, index, fm_close, False)
+
+    def _window_block_state(self, text: str, state) -> bool:
+        """Carry the mermaid-block state across oversize-file windows."""
+        lines = text.split("\n")
+        delimiters = self._delimiter_lines(text)
+        # Only the first window can hold frontmatter.
+        fm_close = self._frontmatter_close(lines, delimiters) if state is None else -1
+        return self._replay_fences(lines, delimiters, len(lines), fm_close, bool(state))
+
+    def _window_state_lines(self, state) -> str:
+        return "```mermaid\n" if state else ""
+
+    @staticmethod
+    def _frontmatter_close(lines: List[str], delimiters: List[int]) -> int:
+        """Return the index of the closing frontmatter ``---`` line, or -1.
+
+        -1 (no frontmatter, or unclosed) keeps line 0 in the fence replay:
+        a file may open with a mermaid fence.
+        """
+        if lines[0].strip() != "---":
+            return -1
+        return next((i for i in delimiters if i > 0 and lines[i].strip() == "---"), -1)
+
+    @staticmethod
+    def _replay_fences(
+        lines: List[str], delimiters: List[int], index: int, fm_close: int, in_mermaid_block: bool
+    ) -> bool:
+        """Replay the mermaid tracking of parse_content() over the fence lines
+        before *index*, starting in *in_mermaid_block*."""
+        for i in delimiters:
+            if i >= index:
+                break
+            stripped = lines[i].strip()
+            if i <= fm_close or not stripped.startswith("```"):
+                continue
+            if in_mermaid_block:
+                in_mermaid_block = False
+            elif stripped.startswith("```mermaid"):
+                in_mermaid_block = True
+        return in_mermaid_block
+
     def _extract_frontmatter_refs(self, content: str, file_path: str) -> tuple:
         """PD-BUG-092: Parse leading YAML frontmatter (--- delimited) via
         YamlParser so bare directory paths in metadata values (e.g.,
@@ -493,7 +555,6 @@ class MarkdownParser(BaseParser):
     def parse_content(self, content: str, file_path: str) -> List[LinkReference]:
         """Parse markdown content for links."""
         try:
-            lines = content.split("\n")
             references = []
 
             # PD-BUG-092: Parse YAML frontmatter via YamlParser so bare
@@ -503,7 +564,9 @@ class MarkdownParser(BaseParser):
 
             in_mermaid_block = False
 
-            for line_num, line in enumerate(lines, 1):
+            # Lines without a path trigger are skipped by the shared prefilter;
+            # fence lines always pass it (backticks).
+            for line_num, line in self._prefiltered_lines(content):
                 # PD-BUG-092: Skip frontmatter lines — already handled above
                 if fm_close_line > 0 and line_num <= fm_close_line:
                     continue
@@ -520,29 +583,50 @@ class MarkdownParser(BaseParser):
                 if in_mermaid_block:
                     continue
 
-                std_refs, md_spans = self._extract_standard_links(line, line_num, file_path)
-                references.extend(std_refs)
-                references.extend(self._extract_reference_links(line, line_num, file_path))
+                # Trigger gating: every pattern below needs a literal marker
+                # character, so one substring check per marker decides which
+                # extractors can match at all; output is unchanged.
+                has_sep = "/" in line or "\\" in line
+                has_quote = '"' in line or "'" in line
+                has_backtick = "`" in line
 
-                html_refs, html_anchor_spans = self._extract_html_anchors(line, line_num, file_path)
-                references.extend(html_refs)
+                md_spans = []
+                if "](" in line:
+                    std_refs, md_spans = self._extract_standard_links(line, line_num, file_path)
+                    references.extend(std_refs)
 
                 # Skip standalone/quoted extraction on reference definition lines
-                if self.reference_pattern.match(line) is not None:
-                    continue
-
-                quoted_refs = self._extract_quoted_paths(
-                    line, line_num, file_path, md_spans, html_anchor_spans
-                )
-                references.extend(quoted_refs)
+                is_reference_def = "]:" in line and self.reference_pattern.match(line) is not None
+                if is_reference_def:
+                    references.extend(self._extract_reference_links(line, line_num, file_path))
+
+                html_anchor_spans = []
+                if "<" in line:
+                    html_refs, html_anchor_spans = self._extract_html_anchors(
+                        line, line_num, file_path
+                    )
+                    references.extend(html_refs)
 
-                quoted_dir_refs = self._extract_quoted_dirs(
-                    line, line_num, file_path, md_spans, html_anchor_spans
-                )
-                references.extend(quoted_dir_refs)
+                if is_reference_def:
+                    continue
 
-                standalone_refs = self._extract_standalone_refs(line, line_num, file_path, md_spans)
-                references.extend(standalone_refs)
+                quoted_refs = quoted_dir_refs = standalone_refs = []
+                if has_quote:
+                    quoted_refs = self._extract_quoted_paths(
+                        line, line_num, file_path, md_spans, html_anchor_spans
+                    )
+                    references.extend(quoted_refs)
+                    if has_sep:
+                        quoted_dir_refs = self._extract_quoted_dirs(
+                            line, line_num, file_path, md_spans, html_anchor_spans
+                        )
+                        references.extend(quoted_dir_refs)
+
+                if "." in line:
+                    standalone_refs = self._extract_standalone_refs(
+                        line, line_num, file_path, md_spans
+                    )
+                    references.extend(standalone_refs)
 
                 # Build comprehensive span list from all earlier patterns so that
                 # bare_path and @-prefix don't duplicate already-detected paths
@@ -557,24 +641,31 @@ class MarkdownParser(BaseParser):
                 )
 
                 # Backtick-quoted paths and dirs (PD-BUG-054)
-                backtick_refs = self._extract_backtick_paths(line, line_num, file_path, all_spans)
-                references.extend(backtick_refs)
-
-                backtick_dir_refs = self._extract_backtick_dirs(
-                    line, line_num, file_path, all_spans
-                )
-                references.extend(backtick_dir_refs)
-
-                all_spans += [
-                    (r.column_start, r.column_end) for r in backtick_refs + backtick_dir_refs
-                ]
+                if has_backtick:
+                    backtick_refs = self._extract_backtick_paths(
+                        line, line_num, file_path, all_spans
+                    )
+                    references.extend(backtick_refs)
+                    backtick_dir_refs = []
+                    if has_sep:
+                        backtick_dir_refs = self._extract_backtick_dirs(
+                            line, line_num, file_path, all_spans
+                        )
+                        references.extend(backtick_dir_refs)
+                    all_spans += [
+                        (r.column_start, r.column_end) for r in backtick_refs + backtick_dir_refs
+                    ]
 
                 # Bare paths with separators (PD-BUG-054, PD-BUG-055)
-                references.extend(self._extract_bare_paths(line, line_num, file_path, all_spans))
-                # @-prefixed paths (PD-BUG-055)
-                references.extend(
-                    self._extract_at_prefix_paths(line, line_num, file_path, all_spans)
-                )
+                if has_sep:
+                    references.extend(
+                        self._extract_bare_paths(line, line_num, file_path, all_spans)
+                    )
+                    # @-prefixed paths (PD-BUG-055)
+                    if "@" in line:
+                        references.extend(
+                            self._extract_at_prefix_paths(line, line_num, file_path, all_spans)
+                        )
 
             return references
 
@@ -18,6 +18,12 @@ from .patterns import QUOTED_DIR_PATTERN_STRICT
 class PowerShellParser(BaseParser):
     """Parser for PowerShell files (.ps1, .psm1)."""
 
+    incremental = True
+    # Block comment boundaries and here-string openers/closers.
+    block_delimiter_pattern = re.compile(
+        r"<#|#>|@[\"'][^\S\n]*$|^[^\S\n]*[\"']@[^\S\n]*$", re.MULTILINE
+    )
+
     def __init__(self):
         super().__init__()
         # Strict variant: requires content after last separator
@@ -41,12 +47,13 @@ class PowerShellParser(BaseParser):
     def parse_content(self, content: str, file_path: str) -> List[LinkReference]:
         """Parse PowerShell content for file references."""
         try:
-            lines = content.split("\n")
             references = []
             in_block_comment = False
             in_here_string = False
 
-            for line_num, line in enumerate(lines, 1):
+            # Lines without a path trigger are skipped by the shared prefilter;
+            # here-string quotes and <# #> delimiters always pass it.
+            for line_num, line in self._prefiltered_lines(content):
                 # Track here-string state (@"..."@ and @'...'@)
                 stripped = line.strip()
                 if in_here_string:
@@ -113,6 +120,29 @@ class PowerShellParser(BaseParser):
             )
             return []
 
+    def _block_open_before(self, lines: List[str], delimiters: List[int], index: int) -> bool:
+        """Replay the block-comment / here-string tracking of parse_content()
+        over the delimiter lines before *index*."""
+        in_block_comment = False
+        in_here_string = False
+        for i in delimiters:
+            if i >= index:
+                break
+            line = lines[i]
+            stripped = line.strip()
+            if in_here_string:
+                if stripped == '"@' or stripped == "'@":
+                    in_here_string = False
+                continue
+            if stripped.endswith('@"') or stripped.endswith("@'"):
+                in_here_string = True
+            if not in_block_comment and "<#" in line:
+                in_block_comment = "#>" not in line[line.find("<#") + 2 :]
+                continue
+            if in_block_comment and "#>" in line:
+                in_block_comment = False
+        return in_block_comment or in_here_string
+
     def _find_comment_start(self, line: str) -> int | None:
         """Find the start position of a line comment, ignoring # inside strings."""
         in_single_quote = False
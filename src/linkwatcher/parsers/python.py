@@ -8,8 +8,18 @@ AI Context
 ----------
 - **Entry point**: ``parse_content()`` — iterates lines with a
   docstring state machine (triple-quote tracking via
-  ``_TRIPLE_QUOTE_RE``) and delegates to inline extraction blocks
-  for each link category.
+  ``_TRIPLE_QUOTE_RE``) and delegates to the ``_extract_*()``
+  helpers for each link category.
+- **Engines** (``config.python_parser_engine``): ``"regex"`` is the
+  line scanner above.  ``"tokenize"`` (``_parse_tokens()``) walks
+  stdlib ``tokenize`` tokens instead: triple-quoted STRING tokens get
+  docstring treatment plus the quoted patterns on every body line (the
+  regex engine runs those only on lines holding the triple quote),
+  single-line STRING and COMMENT tokens get the quoted patterns over
+  the token text only, and ``import``/``from``
+  at the start of a logical line yield the dotted module.  The same
+  ``_extract_*()`` helpers emit the references.  Source that cannot
+  be tokenized falls back to the regex engine.  BM-014 compares them.
 - **Pattern architecture**: 5 compiled regexes — ``quoted_pattern``
   and ``quoted_dir_pattern`` (shared from ``parsers/patterns.py``),
   ``comment_pattern`` (bare file paths), ``local_import_pattern``
@@ -30,14 +40,17 @@ AI Context
   - Debugging missed imports: check ``_looks_like_local_import()``
     prefix list and ``_STDLIB_TOP_LEVEL_MODULES`` filtering.
   - Debugging missed docstring paths: verify triple-quote state
-    tracking toggles correctly for the input.
+    tracking toggles correctly for the input (regex engine), or
+    compare with ``PythonParser(engine="tokenize")``.
   - Testing: ``test/automated/unit/2-link-parsing-update/2-0-link-parsing-update/test_python.py``.
 """
 
+import io
 import os
 import re
 import sys
-from typing import List
+import tokenize
+from typing import List, Optional, Tuple
 
 from ..link_types import LinkType
 from ..models import LinkReference
@@ -263,12 +276,34 @@ except AttributeError:
 # Regex to extract the top-level module name from an import line.
 _IMPORT_MODULE_RE = re.compile(r"^\s*(?:import|from)\s+(\w+)")
 
+# Parsing engines (config.python_parser_engine):
+#   regex    — line scanner with a hand-written docstring state machine
+#   tokenize — stdlib tokenizer; exact string/comment/import positions
+PYTHON_PARSER_ENGINES = ("regex", "tokenize")
+
+_IMPORT_KEYWORDS = frozenset({"import", "from"})
+# Tokens after which the next token begins a logical line.
+_LINE_START_TOKENS = frozenset(
+    {tokenize.NEWLINE, tokenize.NL, tokenize.INDENT, tokenize.DEDENT, tokenize.ENCODING}
+)
+# f-strings are tokenized into parts on Python 3.12+ (-1: never matches).
+_FSTRING_START = getattr(tokenize, "FSTRING_START", -1)
+_FSTRING_END = getattr(tokenize, "FSTRING_END", -1)
+
 
 class PythonParser(BaseParser):
-    """Parser for Python files (.py)."""
+    """Parser for Python files (.py).
+
+    Args:
+        engine: ``"regex"`` (line scanner, default) or ``"tokenize"``
+            (stdlib tokenizer; see ``_parse_tokens()``).
+    """
 
-    def __init__(self):
+    def __init__(self, engine: str = "regex"):
         super().__init__()
+        if engine not in PYTHON_PARSER_ENGINES:
+            raise ValueError(f"engine must be one of: {list(PYTHON_PARSER_ENGINES)}")
+        self.engine = engine
         self.quoted_pattern = QUOTED_PATH_PATTERN
         # PD-BUG-056: Quoted directory paths (paths with separators, no extension required)
         self.quoted_dir_pattern = QUOTED_DIR_PATTERN
@@ -286,13 +321,18 @@ class PythonParser(BaseParser):
 
     def parse_content(self, content: str, file_path: str) -> List[LinkReference]:
         """Parse Python content for file references."""
+        if self.engine == "tokenize":
+            references = self._parse_tokens(content, file_path)
+            if references is not None:
+                return references
         try:
-            lines = content.split("\n")
             references = []
             in_docstring = False
             docstring_quote = None  # tracks which triple-quote opened the block
 
-            for line_num, line in enumerate(lines, 1):
+            # Lines without a path trigger are skipped by the shared prefilter;
+            # triple quotes always pass it, so docstring state stays exact.
+            for line_num, line in self._prefiltered_lines(content):
                 # --- Docstring state tracking (PD-BUG-062) ---
                 # Toggle in/out of docstring on triple quotes, and record the
                 # docstring content as (start, end) spans *of this line*.
@@ -331,50 +371,9 @@ class PythonParser(BaseParser):
 
                 if any(line[s:e].strip() for s, e in docstring_spans):
                     for seg_start, seg_end in docstring_spans:
-                        segment = line[seg_start:seg_end]
-                        if not segment.strip():
-                            continue
-                        # Reuse comment_pattern for bare file paths (with extension)
-                        for match in self.comment_pattern.finditer(segment):
-                            potential_file = match.group(1)
-                            if self._looks_like_file_path(potential_file):
-                                references.append(
-                                    LinkReference(
-                                        file_path=file_path,
-                                        line_number=line_num,
-                                        column_start=seg_start + match.start(1),
-                                        column_end=seg_start + match.end(1),
-                                        link_text=potential_file,
-                                        link_target=potential_file,
-                                        link_type=LinkType.PYTHON_DOCSTRING,
-                                    )
-                                )
-                        # Bare directory paths (no extension, with path separator)
-                        for match in self._BARE_DIR_RE.finditer(segment):
-                            potential_dir = match.group(0)
-                            # PD-BUG-118: _BARE_DIR_RE's character class includes
-                            # '.', so a sentence-ending period is swallowed into
-                            # the "path" and then eaten by the rewrite.
-                            trimmed = self._trim_trailing_punctuation(potential_dir)
-                            if not trimmed or ("/" not in trimmed and "\\" not in trimmed):
-                                continue
-                            potential_dir = trimmed
-                            # Skip if already captured as a file path (has extension)
-                            _, ext = os.path.splitext(potential_dir)
-                            if ext:
-                                continue
-                            if self._looks_like_directory_path(potential_dir):
-                                references.append(
-                                    LinkReference(
-                                        file_path=file_path,
-                                        line_number=line_num,
-                                        column_start=seg_start + match.start(0),
-                                        column_end=seg_start + match.start(0) + len(potential_dir),
-                                        link_text=potential_dir,
-                                        link_target=potential_dir,
-                                        link_type=LinkType.PYTHON_DOCSTRING_DIR,
-                                    )
-                                )
+                        self._extract_docstring_paths(
+                            line[seg_start:seg_end], seg_start, line_num, file_path, references
+                        )
                     if not tq_matches:
                         continue  # skip normal parsing for pure docstring body lines
 
@@ -383,86 +382,25 @@ class PythonParser(BaseParser):
                 if _m and _m.group(1) in _STDLIB_TOP_LEVEL_MODULES:
                     continue
 
-                # Look for quoted file paths
-                for match in self.quoted_pattern.finditer(line):
-                    potential_file = match.group(1)
-
-                    if self._looks_like_file_path(potential_file):
-                        references.append(
-                            LinkReference(
-                                file_path=file_path,
-                                line_number=line_num,
-                                column_start=match.start(1),
-                                column_end=match.end(1),
-                                link_text=potential_file,
-                                link_target=potential_file,
-                                link_type=LinkType.PYTHON_QUOTED,
-                            )
-                        )
-
-                # PD-BUG-056: Look for quoted directory paths (paths without extensions)
-                for match in self.quoted_dir_pattern.finditer(line):
-                    potential_dir = match.group(1)
-
-                    # Skip if it has a file extension (already handled by quoted_pattern)
-                    _, ext = os.path.splitext(potential_dir)
-                    if ext:
-                        continue
-
-                    if self._looks_like_directory_path(potential_dir):
-                        references.append(
-                            LinkReference(
-                                file_path=file_path,
-                                line_number=line_num,
-                                column_start=match.start(1),
-                                column_end=match.end(1),
-                                link_text=potential_dir,
-                                link_target=potential_dir,
-                                link_type=LinkType.PYTHON_QUOTED_DIR,
-                            )
-                        )
+                self._extract_quoted_paths(line, 0, line_num, file_path, references)
 
                 # Look for local import statements
                 import_match = self.local_import_pattern.match(line)
                 if import_match:
-                    import_path = import_match.group(1)
-                    # Convert dot notation to file path
-                    # e.g., src.utils.string_utils -> src/utils/string_utils
-                    if "." in import_path and not import_path.startswith("."):
-                        file_path_candidate = import_path.replace(".", "/")
-                        if self._looks_like_local_import(file_path_candidate):
-                            references.append(
-                                LinkReference(
-                                    file_path=file_path,
-                                    line_number=line_num,
-                                    column_start=import_match.start(1),
-                                    column_end=import_match.end(1),
-                                    link_text=import_path,
-                                    link_target=file_path_candidate,
-                                    link_type=LinkType.PYTHON_IMPORT,
-                                )
-                            )
+                    self._extract_import_path(
+                        import_match.group(1),
+                        import_match.start(1),
+                        line_num,
+                        file_path,
+                        references,
+                    )
 
                 # Look for file paths in comments (only in lines that contain #)
                 if "#" in line:
-                    comment_part = line[line.find("#") :]  # Get only the comment part
-                    for match in self.comment_pattern.finditer(comment_part):
-                        potential_file = match.group(1)
-
-                        if self._looks_like_file_path(potential_file):
-                            # Adjust column position to account for the comment offset
-                            comment_start = line.find("#")
-                            references.append(
-                                LinkReference(
-                                    file_path=file_path,
-                                    line_number=line_num,
-                                    column_start=comment_start + match.start(1),
-                                    column_end=comment_start + match.end(1),
-                                    link_text=potential_file,
-                                    link_target=potential_file,
-                                    link_type=LinkType.PYTHON_COMMENT,
-                                )
-                            )
+                    comment_start = line.find("#")
+                    self._extract_comment_paths(
+                        line[comment_start:], comment_start, line_num, file_path, references
+                    )
 
             return references
 
@@ -470,6 +408,303 @@ class PythonParser(BaseParser):
             self.logger.warning("parse_error", file_path=file_path, parser="python", error=str(e))
             return []
 
+    def _parse_tokens(self, content: str, file_path: str) -> Optional[List[LinkReference]]:
+        """Tokenize engine: extract references from ``tokenize`` tokens.
+
+        String, comment and import positions come straight from the
+        tokenizer, so docstrings need no quote tracking and columns are
+        exact.  Returns None when the source cannot be tokenized (e.g. an
+        unterminated triple-quoted string); the caller then falls back to
+        the regex engine.
+        """
+        references: List[LinkReference] = []
+        at_line_start = True
+        import_tokens = None  # NAME/"." tokens after an import keyword
+        fstring_starts = []  # open f-string start tokens (Python 3.12+)
+
+        try:
+            for tok in tokenize.generate_tokens(io.StringIO(content).readline):
+                tok_type = tok.type
+
+                if import_tokens is not None:
+                    prev = import_tokens[-1] if import_tokens else None
+                    if (tok_type == tokenize.NAME or tok.string == ".") and (
+                        prev is None or prev.end == tok.start
+                    ):
+                        import_tokens.append(tok)
+                        continue
+                    self._extract_import_tokens(import_tokens, file_path, references)
+                    import_tokens = None
+
+                if tok_type == tokenize.STRING:
+                    if not fstring_starts:
+                        self._extract_string_token(
+                            tok.string, tok.start, tok.end, file_path, references
+                        )
+                elif tok_type == tokenize.COMMENT:
+                    row, col = tok.start
+                    self._extract_quoted_paths(tok.string, col, row, file_path, references)
+                    self._extract_comment_paths(tok.string, col, row, file_path, references)
+                elif tok_type == _FSTRING_START:
+                    fstring_starts.append(tok)
+                elif tok_type == _FSTRING_END and fstring_starts:
+                    start = fstring_starts.pop()
+                    if not fstring_starts:
+                        self._extract_fstring(start, tok, content, file_path, references)
+                elif tok_type == tokenize.NAME and at_line_start and tok.string in _IMPORT_KEYWORDS:
+                    import_tokens = []
+
+                at_line_start = tok_type in _LINE_START_TOKENS
+        except (tokenize.TokenError, SyntaxError) as e:
+            self.logger.debug("python_tokenize_fallback", file_path=file_path, error=str(e))
+            return None
+
+        return references
+
+    def _extract_string_token(
+        self,
+        text: str,
+        start: Tuple[int, int],
+        end: Tuple[int, int],
+        file_path: str,
+        references: List[LinkReference],
+    ):
+        """Classify one string literal (prefix and quotes included in *text*)."""
+        body_offset = len(text) - len(text.lstrip("rRbBuUfF"))
+        quote = text[body_offset : body_offset + 3]
+        if quote not in ('"""', "'''"):
+            quote = quote[:1]
+        body = text[body_offset + len(quote) : len(text) - len(quote)]
+        row, col = start
+        col += body_offset + len(quote)
+
+        if len(quote) == 3:
+            # Triple-quoted strings get docstring treatment, line by line.
+            # Quoted paths inside them (templates, usage examples such as
+            # ``$config = "config/settings.yaml"``) are extracted as
+            # PYTHON_QUOTED first, and bare matches overlapping them are
+            # dropped, so a quoted path with spaces is not split apart.
+            for line_num, segment in enumerate(body.split("\n"), row):
+                if segment.strip():
+                    self._extract_docstring_segment(segment, col, line_num, file_path, references)
+                col = 0
+            return
+
+        # Single-line strings: run the quoted patterns over the literal
+        # itself (quotes included), so quoted paths nested inside it are
+        # found too, as the regex engine finds them.  Skip cheaply when
+        # there is no separator or extension dot.
+        if start[0] == end[0] and ("." in body or "/" in body or "\\" in body):
+            self._extract_quoted_paths(text, start[1], row, file_path, references)
+
+    def _extract_docstring_segment(
+        self,
+        segment: str,
+        seg_start: int,
+        line_num: int,
+        file_path: str,
+        references: List[LinkReference],
+    ):
+        """Extract quoted, then non-overlapping bare paths from one line of a string body."""
+        if '"' not in segment and "'" not in segment:
+            self._extract_docstring_paths(segment, seg_start, line_num, file_path, references)
+            return
+        quoted: List[LinkReference] = []
+        self._extract_quoted_paths(segment, seg_start, line_num, file_path, quoted)
+        bare: List[LinkReference] = []
+        self._extract_docstring_paths(segment, seg_start, line_num, file_path, bare)
+        references.extend(quoted)
+        references.extend(
+            ref
+            for ref in bare
+            if not any(
+                ref.column_start < q.column_end and q.column_start < ref.column_end for q in quoted
+            )
+        )
+
+    def _extract_fstring(
+        self,
+        start: tokenize.TokenInfo,
+        end: tokenize.TokenInfo,
+        content: str,
+        file_path: str,
+        references: List[LinkReference],
+    ):
+        """Treat a tokenized f-string (Python 3.12+) like one STRING token."""
+        (start_row, start_col), (end_row, end_col) = start.start, end.end
+        if start_row == end_row:
+            text = end.line[start_col:end_col]
+        else:
+            source_lines = content.split("\n")[start_row - 1 : end_row]
+            source_lines[-1] = source_lines[-1][:end_col]
+            source_lines[0] = source_lines[0][start_col:]
+            text = "\n".join(source_lines)
+        self._extract_string_token(text, start.start, end.end, file_path, references)
+
+    def _extract_import_tokens(self, tokens, file_path: str, references: List[LinkReference]):
+        """Build the dotted module path from import tokens and extract it."""
+        if not tokens or tokens[0].type != tokenize.NAME:
+            return  # relative import or bare keyword
+        import_path = "".join(tok.string for tok in tokens)
+        if import_path.split(".", 1)[0] in _STDLIB_TOP_LEVEL_MODULES:
+            return
+        row, col = tokens[0].start
+        self._extract_import_path(import_path, col, row, file_path, references)
+
+    def _extract_import_path(
+        self,
+        import_path: str,
+        col_start: int,
+        line_num: int,
+        file_path: str,
+        references: List[LinkReference],
+    ):
+        """Emit a PYTHON_IMPORT reference for a dotted local module path."""
+        # Convert dot notation to file path
+        # e.g., src.utils.string_utils -> src/utils/string_utils
+        if "." in import_path and not import_path.startswith("."):
+            file_path_candidate = import_path.replace(".", "/")
+            if self._looks_like_local_import(file_path_candidate):
+                references.append(
+                    LinkReference(
+                        file_path=file_path,
+                        line_number=line_num,
+                        column_start=col_start,
+                        column_end=col_start + len(import_path),
+                        link_text=import_path,
+                        link_target=file_path_candidate,
+                        link_type=LinkType.PYTHON_IMPORT,
+                    )
+                )
+
+    def _extract_quoted_paths(
+        self,
+        text: str,
+        offset: int,
+        line_num: int,
+        file_path: str,
+        references: List[LinkReference],
+    ):
+        """Extract quoted file and directory paths from *text* at column *offset*."""
+        # Look for quoted file paths
+        for match in self.quoted_pattern.finditer(text):
+            potential_file = match.group(1)
+
+            if self._looks_like_file_path(potential_file):
+                references.append(
+                    LinkReference(
+                        file_path=file_path,
+                        line_number=line_num,
+                        column_start=offset + match.start(1),
+                        column_end=offset + match.end(1),
+                        link_text=potential_file,
+                        link_target=potential_file,
+                        link_type=LinkType.PYTHON_QUOTED,
+                    )
+                )
+
+        # PD-BUG-056: Look for quoted directory paths (paths without extensions)
+        for match in self.quoted_dir_pattern.finditer(text):
+            potential_dir = match.group(1)
+
+            # Skip if it has a file extension (already handled by quoted_pattern)
+            _, ext = os.path.splitext(potential_dir)
+            if ext:
+                continue
+
+            if self._looks_like_directory_path(potential_dir):
+                references.append(
+                    LinkReference(
+                        file_path=file_path,
+                        line_number=line_num,
+                        column_start=offset + match.start(1),
+                        column_end=offset + match.end(1),
+                        link_text=potential_dir,
+                        link_target=potential_dir,
+                        link_type=LinkType.PYTHON_QUOTED_DIR,
+                    )
+                )
+
+    def _extract_docstring_paths(
+        self,
+        segment: str,
+        seg_start: int,
+        line_num: int,
+        file_path: str,
+        references: List[LinkReference],
+    ):
+        """Extract bare file and directory paths from one line of docstring text.
+
+        *seg_start* is the column of ``segment[0]`` in the physical line, so
+        the emitted columns are line-absolute (PD-BUG-118).
+        """
+        # Reuse comment_pattern for bare file paths (with extension)
+        for match in self.comment_pattern.finditer(segment):
+            potential_file = match.group(1)
+            if self._looks_like_file_path(potential_file):
+                references.append(
+                    LinkReference(
+                        file_path=file_path,
+                        line_number=line_num,
+                        column_start=seg_start + match.start(1),
+                        column_end=seg_start + match.end(1),
+                        link_text=potential_file,
+                        link_target=potential_file,
+                        link_type=LinkType.PYTHON_DOCSTRING,
+                    )
+                )
+        # Bare directory paths (no extension, with path separator)
+        for match in self._BARE_DIR_RE.finditer(segment):
+            potential_dir = match.group(0)
+            # PD-BUG-118: _BARE_DIR_RE's character class includes
+            # '.', so a sentence-ending period is swallowed into
+            # the "path" and then eaten by the rewrite.
+            trimmed = self._trim_trailing_punctuation(potential_dir)
+            if not trimmed or ("/" not in trimmed and "\\" not in trimmed):
+                continue
+            potential_dir = trimmed
+            # Skip if already captured as a file path (has extension)
+            _, ext = os.path.splitext(potential_dir)
+            if ext:
+                continue
+            if self._looks_like_directory_path(potential_dir):
+                references.append(
+                    LinkReference(
+                        file_path=file_path,
+                        line_number=line_num,
+                        column_start=seg_start + match.start(0),
+                        column_end=seg_start + match.start(0) + len(potential_dir),
+                        link_text=potential_dir,
+                        link_target=potential_dir,
+                        link_type=LinkType.PYTHON_DOCSTRING_DIR,
+                    )
+                )
+
+    def _extract_comment_paths(
+        self,
+        comment: str,
+        comment_start: int,
+        line_num: int,
+        file_path: str,
+        references: List[LinkReference],
+    ):
+        """Extract file paths from comment text starting at column *comment_start*."""
+        for match in self.comment_pattern.finditer(comment):
+            potential_file = match.group(1)
+
+            if self._looks_like_file_path(potential_file):
+                references.append(
+                    LinkReference(
+                        file_path=file_path,
+                        line_number=line_num,
+                        column_start=comment_start + match.start(1),
+                        column_end=comment_start + match.end(1),
+                        link_text=potential_file,
+                        link_target=potential_file,
+                        link_type=LinkType.PYTHON_COMMENT,
+                    )
+                )
+
     def _looks_like_local_import(self, import_path: str) -> bool:
         """Check if an import path looks like a local module reference."""
         # Local imports typically start with project directories like src/, lib/, etc.
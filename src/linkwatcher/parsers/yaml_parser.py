@@ -6,12 +6,12 @@ from values throughout the YAML structure.
 
 AI Context
 ----------
-- **Entry point**: ``parse_content()`` — parses YAML via
-  ``yaml.safe_load()``, walks the parsed tree with
-  ``_walk_structured_data()`` (inherited from ``BaseParser``),
-  and processes each string value through
-  ``_process_string_value()``.  Falls back to ``GenericParser``
-  on ``YAMLError``.
+- **Entry point**: ``parse_content()`` — composes YAML into nodes via
+  ``yaml.compose_all()`` (libyaml ``CSafeLoader`` when available),
+  walks the string value nodes with ``_walk_string_nodes()``, and
+  processes each through ``_process_string_node()`` /
+  ``_process_string_value()``.  Falls back to ``GenericParser`` on
+  ``YAMLError`` (including custom tags, which ``safe_load`` rejects).
 - **Pattern architecture**: No compiled regexes in this class.
   Uses ``_classify_path()`` (from ``BaseParser``) for file vs
   directory detection, and ``_path_pattern`` (from ``BaseParser``)
@@ -21,9 +21,10 @@ AI Context
   ``"pwsh.exe -File doc/scripts/Run.ps1"``.  Supports multiline
   YAML blocks (literal ``|`` / folded ``>``) where
   ``yaml.safe_load()`` resolves newlines (PD-BUG-079).
-- **Line mapping**: ``_find_next_occurrence()`` with
-  ``_search_start_line`` offset provides O(V+L) amortized
-  line-number lookup for parsed values back to raw lines.
+- **Line mapping**: single-line plain and quoted scalars take their
+  line and column from the node's ``start_mark``.  Block scalars and
+  escaped/folded values (raw text differs from the value) fall back to
+  ``_find_next_occurrence()``, starting at the node's line.
 - **Link types**: ``YAML``, ``YAML_DIR``.
 - **Common tasks**:
   - Debugging missed paths: check ``_classify_path()`` in
@@ -33,7 +34,7 @@ AI Context
   - Testing: ``test/automated/unit/2-link-parsing-update/2-0-link-parsing-update/test_yaml.py``.
 """
 
-from typing import List
+from typing import Generator, List, Optional, Tuple
 
 import yaml
 
@@ -41,6 +42,12 @@ from ..link_types import LinkType
 from ..models import LinkReference
 from .base import BaseParser
 
+# libyaml-backed loader when PyYAML was built with it; composing only needs
+# the scanner/parser/composer/resolver, so both give identical nodes.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_STANDARD_TAG_PREFIX = "tag:yaml.org,2002:"
+_STR_TAG = _STANDARD_TAG_PREFIX + "str"
+
 
 class YamlParser(BaseParser):
     """Parser for YAML files (.yaml, .yml)."""
@@ -53,13 +60,14 @@ class YamlParser(BaseParser):
             self._search_start_line = 0  # Offset for O(V+L) scanning
 
             try:
-                # PD-BUG-092: Use safe_load_all to handle multi-document YAML
-                # (--- separators). Previously safe_load() raised ComposerError
-                # on any multi-document stream, forcing a GenericParser fallback
-                # that missed bare directory paths.
-                for data in yaml.safe_load_all(content):
-                    for value, _path in self._walk_structured_data(data):
-                        self._process_string_value(value, file_path, lines, references)
+                # PD-BUG-092: compose_all handles multi-document YAML (---
+                # separators); a single-document API raised ComposerError and
+                # forced a GenericParser fallback that missed bare directory
+                # paths.  Composing (not loading) keeps each scalar's start
+                # mark, so values are located without searching the text.
+                for root in yaml.compose_all(content, Loader=_YamlLoader):
+                    for node in self._walk_string_nodes(root):
+                        self._process_string_node(node, file_path, lines, references)
 
             except yaml.YAMLError:
                 # Fall back to generic parsing if YAML is invalid
@@ -74,15 +82,78 @@ class YamlParser(BaseParser):
             self.logger.warning("parse_error", file_path=file_path, parser="yaml", error=str(e))
             return []
 
+    @staticmethod
+    def _walk_string_nodes(root) -> Generator[yaml.ScalarNode, None, None]:
+        """Yield every string scalar *value* node of a composed document.
+
+        Mapping keys and non-string scalars (int, bool, null, timestamps)
+        are skipped, like the string leaves of the loaded data.  Aliased
+        nodes are yielded once.  A custom tag (e.g. ``!Ref``) raises a
+        ``ConstructorError``, as ``yaml.safe_load()`` would, so such files
+        keep their GenericParser fallback.
+        """
+        if root is None:
+            return
+        seen = set()
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            if not node.tag.startswith(_STANDARD_TAG_PREFIX):
+                raise yaml.constructor.ConstructorError(
+                    None, None, f"unsupported tag {node.tag!r}", node.start_mark
+                )
+            if isinstance(node, yaml.MappingNode):
+                # Push in reverse so that the first value is processed first.
+                for _key, value in reversed(node.value):
+                    stack.append(value)
+            elif isinstance(node, yaml.SequenceNode):
+                stack.extend(reversed(node.value))
+            elif node.tag == _STR_TAG:
+                yield node
+
+    def _process_string_node(
+        self,
+        node: yaml.ScalarNode,
+        file_path: str,
+        lines: List[str],
+        references: List[LinkReference],
+    ):
+        """Process one string scalar, anchored at its exact start mark.
+
+        Single-line plain and quoted scalars whose raw text equals the value
+        are located directly.  Block scalars, escaped or folded values fall
+        back to a text search starting at the node's line.
+        """
+        data = node.value
+        line_idx = node.start_mark.line
+        column = node.start_mark.column + (1 if node.style in ('"', "'") else 0)
+        if "\n" not in data and line_idx < len(lines) and lines[line_idx].startswith(data, column):
+            self._process_string_value(data, file_path, lines, references, (line_idx + 1, column))
+            return
+        self._search_start_line = min(line_idx, len(lines))
+        self._process_string_value(data, file_path, lines, references)
+
     def _process_string_value(
-        self, data: str, file_path: str, lines: List[str], references: List[LinkReference]
+        self,
+        data: str,
+        file_path: str,
+        lines: List[str],
+        references: List[LinkReference],
+        position: Optional[Tuple[int, int]] = None,
     ):
-        """Process a single string value from the YAML tree."""
+        """Process a single string value from the YAML tree.
+
+        *position* is the value's exact ``(line_number, column)`` when
+        known; otherwise it is searched for in *lines*.
+        """
         # PD-BUG-060: If the string contains spaces, it may be a compound
         # command string with embedded paths (e.g., "pwsh.exe -File doc/scripts/Run.ps1").
         # Try sub-path extraction first; fall through to whole-string check if nothing found.
         if " " in data:
-            embedded = self._extract_embedded_paths(data, file_path, lines, references)
+            embedded = self._extract_embedded_paths(data, file_path, lines, references, position)
             if embedded:
                 return
 
@@ -91,7 +162,10 @@ class YamlParser(BaseParser):
 
         if is_file or is_dir:
             # Find all occurrences of this value to get accurate line numbers
-            line_num, col_start = self._find_next_occurrence(lines, data, references)
+            if position is not None:
+                line_num, col_start = position
+            else:
+                line_num, col_start = self._find_next_occurrence(lines, data, references)
             if line_num > 0:
                 col_end = col_start + len(data) if col_start >= 0 else 0
 
@@ -157,7 +231,12 @@ class YamlParser(BaseParser):
         return 0, 0
 
     def _extract_embedded_paths(
-        self, data: str, file_path: str, lines: List[str], references: List[LinkReference]
+        self,
+        data: str,
+        file_path: str,
+        lines: List[str],
+        references: List[LinkReference],
+        position: Optional[Tuple[int, int]] = None,
     ) -> bool:
         """
         PD-BUG-060: Extract file paths embedded within compound strings.
@@ -201,7 +280,10 @@ class YamlParser(BaseParser):
                     found = True
                 else:
                     if not found:
-                        line_num, val_col_start = self._find_next_occurrence(lines, data, [])
+                        if position is not None:
+                            line_num, val_col_start = position
+                        else:
+                            line_num, val_col_start = self._find_next_occurrence(lines, data, [])
                         if line_num == 0:
                             return False
                     col_start = val_col_start + match.start(1)
@@ -43,6 +43,18 @@ Override-aware resolution (v1.1, PD-TDD-026 "Override-Aware Path Resolution"):
     the rewritten link keeps its /... virtual-root style (containment-guarded;
     emits update_resolution_override_applied).
 
+Per-batch memo (begin_batch / end_batch):
+    Within one update batch, many references share the same link type,
+    target, source directory and old/new pair (e.g. every doc in a folder
+    linking to the same moved file).  While a batch is open,
+    calculate_new_target() memoizes results on exactly those inputs
+    (_memo_key) and counts hits/misses in memo_stats; the batch entry point
+    calculate_new_targets(refs, old, new) resolves a list in one call.  The
+    memo is dropped at end_batch(): the early exits consult the disk
+    (path_exists_under_root), so results are only reusable while the tree
+    is unchanged.  Sources under a path_resolution_overrides folder are
+    keyed by full path, since the override base is per source file.
+
 Python import handler (_calculate_new_python_import):
     Compares extensionless paths (strips .py). Supports python_source_root
     config to strip a prefix like "src/" so imports match project-root paths
@@ -56,8 +68,9 @@ Key design decisions:
 """
 
 import os
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from .link_types import LinkType
 from .logging import get_logger
@@ -96,9 +109,80 @@ class PathResolver:
         # Per-source-file base cache — the base depends only on the (static)
         # config and the source path, so entries never go stale.
         self._resolution_base_cache: Dict[str, str] = {}
+        # Per-batch result memo (see begin_batch); None outside a batch.
+        # Nested/concurrent batches share it, so it is dropped only when
+        # the outermost batch ends.
+        self._memo: Optional[Dict[tuple, str]] = None
+        self._memo_depth = 0
+        self._memo_lock = threading.Lock()
+        self.memo_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+    def begin_batch(self):
+        """Open the per-batch memo for calculate_new_target()."""
+        with self._memo_lock:
+            if self._memo_depth == 0:
+                self._memo = {}
+                self.memo_stats = {"hits": 0, "misses": 0}
+            self._memo_depth += 1
+
+    def end_batch(self) -> Dict[str, int]:
+        """Close the batch memo and return its hit/miss counts."""
+        with self._memo_lock:
+            self._memo_depth = max(0, self._memo_depth - 1)
+            stats = dict(self.memo_stats, entries=len(self._memo or ()))
+            closed = self._memo_depth == 0
+            if closed:
+                self._memo = None
+        if closed and stats["hits"]:
+            self.logger.debug("path_resolution_memo_stats", **stats)
+        return stats
+
+    def calculate_new_targets(
+        self, references: List[LinkReference], old_path: str, new_path: str
+    ) -> List[str]:
+        """Calculate new targets for *references* moved from old_path to new_path.
+
+        Results are in input order.  The whole call is one memo batch, so
+        references sharing a target and source directory resolve once.
+        """
+        self.begin_batch()
+        try:
+            return [self.calculate_new_target(ref, old_path, new_path) for ref in references]
+        finally:
+            self.end_batch()
+
+    def _memo_key(self, ref: LinkReference, old_path: str, new_path: str) -> tuple:
+        """Return the inputs calculate_new_target() depends on for *ref*.
+
+        Everything below only looks at the source file's directory, except
+        the override base, which is looked up per source file.
+        """
+        if self._resolution_overrides:
+            source_key = ref.file_path
+        else:
+            source_key = os.path.dirname(ref.file_path.replace("\\", "/"))
+        return (ref.link_type, ref.link_target, source_key, old_path, new_path)
 
     def calculate_new_target(self, ref: LinkReference, old_path: str, new_path: str) -> str:
-        """Calculate the new target path for a reference."""
+        """Calculate the new target path for a reference.
+
+        Inside a batch (begin_batch) results are memoized per _memo_key.
+        """
+        memo = self._memo
+        if memo is None:
+            return self._calculate_new_target_uncached(ref, old_path, new_path)
+        key = self._memo_key(ref, old_path, new_path)
+        result = memo.get(key)
+        with self._memo_lock:
+            self.memo_stats["hits" if result is not None else "misses"] += 1
+        if result is None:
+            result = self._calculate_new_target_uncached(ref, old_path, new_path)
+            memo[key] = result
+        return result
+
+    def _calculate_new_target_uncached(
+        self, ref: LinkReference, old_path: str, new_path: str
+    ) -> str:
         original_target = ref.link_target
 
         # Special handling for Python imports
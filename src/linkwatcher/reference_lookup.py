@@ -15,19 +15,29 @@ AI Context
   - Debugging missed references: check ``find_references()`` →
     ``get_path_variations()`` — path format mismatches (forward/back
     slash, with/without first directory) are the most common cause.
+  - Upfront stale detection: ``refresh_changed_sources()`` compares each
+    referring file's ``(mtime_ns, size)`` with the signature the database
+    recorded at parse time and re-parses only the files that changed,
+    before the updater reads or writes anything.
   - Debugging stale update retries: ``retry_stale_references()`` rescans
     source files once and re-queries; if retry also stales, it logs a
-    warning and moves on.
+    warning and moves on.  It remains the fallback for edits the
+    signature cannot see (same size within one mtime tick).
   - Understanding DB cleanup after moves: ``cleanup_after_file_move()``
     removes old target entries and rescans affected source files, or
     defers rescanning to the caller for batch efficiency (TD128).
   - Directory move processing: ``collect_directory_file_refs()`` gathers
     refs without updating (for batch pipeline); ``process_directory_file_move()``
     does the full per-file cycle (find → update → retry → cleanup → rescan).
+  - What-if planning: ``plan_moves()`` runs the lookup and target
+    calculation of a move against the index only and returns
+    ``PlannedEdit`` objects; nothing is read from or written to the
+    referring files.
   - Link recalculation inside moved files: ``update_links_within_moved_file()``
     reads the file, filters for relative links, recalculates targets from
     the new location via ``_calculate_updated_relative_path()``, and writes
-    back atomically.
+    back through ``LinkUpdater.write_file()`` (durability, group commit and
+    journal apply).
   - Testing: ``test/automated/unit/1-file-watching-detection/1-0-file-watching-detection/test_reference_lookup.py``.
 - **Threading**: instances are shared by two threads — the watchdog observer
   thread and the ``DirectoryMoveDetector`` worker thread — because
@@ -41,18 +51,25 @@ AI Context
 
 import os
 import re
-import shutil
-import tempfile
 import threading
 import time
 from pathlib import Path
+from typing import Optional
 
 from .database import LinkDatabaseInterface
 from .link_types import LinkType
 from .logging import get_logger
+from .models import PlannedEdit
 from .parser import LinkParser
 from .updater import LinkUpdater
-from .utils import apply_trailing_separator_style, get_relative_path, path_exists_under_root
+from .utils import (
+    apply_trailing_separator_style,
+    get_relative_path,
+    normalize_path,
+    path_exists_under_root,
+    safe_file_read_with_encoding,
+    source_signature,
+)
 
 
 class ReferenceLookup:
@@ -162,6 +179,145 @@ class ReferenceLookup:
         """
         return self.get_path_variations(old_path)
 
+    def plan_moves(self, moves):
+        """Simulate moves and return the link edits they would cause.
+
+        Runs the same lookups as a real move --
+        ``collect_directory_file_refs()`` and ``find_directory_path_references()``
+        -- and ``LinkUpdater.plan_replacements()`` for the target calculation
+        and overlap filter, but never reads or writes referring files.
+        A directory is expanded to the files currently inside it.  Lookups
+        are cached per path for the whole call, so planning many moves that
+        share files or directories queries the database once per path.
+
+        Each move is planned against the current index independently; edits
+        to links *inside* the moved files (outward relative links) and
+        Python module usages beyond the import line are not included.
+
+        Args:
+            moves: Iterable of ``(old_path, new_path)`` project-relative pairs.
+
+        Returns:
+            List of ``PlannedEdit``, ordered by referring file and position.
+        """
+        file_lookups = {}
+        dir_lookups = {}
+        items_by_file = {}
+
+        def add_group(refs, old_path, new_path, moved_path):
+            for ref in refs:
+                items_by_file.setdefault(ref.file_path, []).append(
+                    (ref, old_path, new_path, moved_path)
+                )
+
+        for old_path, new_path in moves:
+            old_path = normalize_path(old_path)
+            new_path = normalize_path(new_path)
+            abs_old = self._resolve_abs_path(old_path)
+
+            file_pairs = [(old_path, new_path)]
+            if os.path.isdir(abs_old):
+                file_pairs = []
+                for root, _, files in os.walk(abs_old):
+                    for name in files:
+                        rel_old = self._get_relative_path(os.path.join(root, name))
+                        file_pairs.append((rel_old, new_path + rel_old[len(old_path) :]))
+                if old_path not in dir_lookups:
+                    dir_lookups[old_path] = self.find_directory_path_references(old_path)
+                refs_by_target = {}
+                for ref in dir_lookups[old_path]:
+                    refs_by_target.setdefault(ref.link_target, []).append(ref)
+                for target, target_refs in refs_by_target.items():
+                    ref_old, ref_new = self.directory_target_move(target, old_path, new_path)
+                    add_group(target_refs, ref_old, ref_new, old_path)
+
+            for old_file, new_file in file_pairs:
+                if old_file not in file_lookups:
+                    file_lookups[old_file] = self.collect_directory_file_refs(old_file, new_file)
+                file_refs, module_refs, _ = file_lookups[old_file]
+                add_group(file_refs, old_file, new_file, old_file)
+                if module_refs:
+                    add_group(module_refs, old_file[:-3], new_file[:-3], old_file)
+
+        plan = []
+        for file_path, items in items_by_file.items():
+            # Same per-file de-duplication as a real update (PD-BUG-098),
+            # plus dropping refs planned twice by overlapping moves.
+            moved_by_ref = {}
+            ref_tuples = []
+            for ref, old_path, new_path, moved_path in items:
+                if id(ref) not in moved_by_ref:
+                    moved_by_ref[id(ref)] = moved_path
+                    ref_tuples.append((ref, old_path, new_path))
+            for ref, new_target in self.updater.plan_replacements(file_path, ref_tuples):
+                plan.append(
+                    PlannedEdit(
+                        file_path=ref.file_path,
+                        line_number=ref.line_number,
+                        column_start=ref.column_start,
+                        column_end=ref.column_end,
+                        old_target=ref.link_target,
+                        new_target=new_target,
+                        link_type=ref.link_type,
+                        moved_path=moved_by_ref[id(ref)],
+                    )
+                )
+        plan.sort(key=lambda edit: (edit.file_path, edit.line_number, edit.column_start))
+        return plan
+
+    def refresh_changed_sources(self, move_groups):
+        """Re-parse referring files edited since they were indexed.
+
+        Compares each referring file's current ``(mtime_ns, size)`` with the
+        signature recorded when it was parsed.  Changed files are rescanned
+        and their references re-queried, so the updater works from fresh
+        line numbers instead of discovering staleness while rewriting and
+        retrying.  Files without a recorded signature are trusted as-is.
+
+        Args:
+            move_groups: List of ``(references, old_path, new_path)`` tuples.
+
+        Returns:
+            The move groups with references from changed files replaced.
+        """
+        changed = set()
+        checked = set()
+        for refs, _, _ in move_groups:
+            for ref in refs:
+                if ref.file_path in checked:
+                    continue
+                checked.add(ref.file_path)
+                recorded = self.link_db.get_source_signature(ref.file_path)
+                if recorded is not None and recorded != source_signature(
+                    self._resolve_abs_path(ref.file_path)
+                ):
+                    changed.add(ref.file_path)
+        if not changed:
+            return move_groups
+
+        self.logger.info("rescanning_changed_sources", changed_file_count=len(changed))
+        for file_path in changed:
+            abs_path = self._resolve_abs_path(file_path)
+            if os.path.exists(abs_path):
+                self.rescan_file_links(abs_path)
+            else:
+                self.link_db.remove_file_links(file_path)
+
+        refreshed = []
+        for refs, old_path, new_path in move_groups:
+            kept = [r for r in refs if r.file_path not in changed]
+            if len(kept) != len(refs):
+                kept.extend(self.find_references(old_path, filter_files=changed))
+            if kept:
+                refreshed.append((kept, old_path, new_path))
+        return refreshed
+
+    def _resolve_abs_path(self, file_path):
+        """Return *file_path* as an absolute path under the project root."""
+        if os.path.isabs(file_path):
+            return file_path
+        return os.path.join(self.project_root, file_path)
+
     def retry_stale_references(self, old_path, new_path, update_stats):
         """Rescan files with stale line numbers and retry reference updates.
 
@@ -268,8 +424,12 @@ class ReferenceLookup:
                 # Then rescan to add updated references
                 self.rescan_file_links(abs_file_path, remove_existing=False)
 
-    def rescan_file_links(self, file_path, remove_existing=True):
-        """Rescan a file and update the link database."""
+    def rescan_file_links(self, file_path, remove_existing=True, incremental=False):
+        """Rescan a file and update the link database.
+
+        With *incremental*, the file was edited in place and only its changed
+        lines are re-parsed (``LinkParser.reparse_file()``).
+        """
         try:
             rel_path = self._get_relative_path(file_path)
 
@@ -277,12 +437,19 @@ class ReferenceLookup:
             if remove_existing:
                 self.link_db.remove_file_links(rel_path)
 
-            # Parse and add new links
-            references = self.parser.parse_file(file_path)
+            # Parse and add new links (stat first: a write racing the parse
+            # then shows up as a changed signature, never as a fresh one)
+            signature = source_signature(file_path)
+            if incremental:
+                references = self.parser.reparse_file(file_path)
+            else:
+                references = self.parser.parse_file(file_path)
             for ref in references:
                 # Update the reference to use relative path
                 ref.file_path = rel_path
                 self.link_db.add_link(ref)
+            if references:
+                self.link_db.set_source_signature(rel_path, signature)
 
             if references:
                 self.logger.info(
@@ -313,7 +480,9 @@ class ReferenceLookup:
             # Remove existing links using the OLD path (since that's what's in the database)
             self.link_db.remove_file_links(old_path)
 
-            # Parse and add new links with the NEW path
+            # Parse and add new links with the NEW path.  Pre-read content is
+            # what is on disk now, so the signature is taken either way first.
+            signature = source_signature(abs_new_path)
             if content is not None:
                 references = self.parser.parse_content(content, abs_new_path)
             else:
@@ -322,6 +491,8 @@ class ReferenceLookup:
                 # Update the reference to use the new relative path
                 ref.file_path = new_path
                 self.link_db.add_link(ref)
+            if references:
+                self.link_db.set_source_signature(new_path, signature)
 
             if references:
                 self.logger.info(
@@ -413,7 +584,6 @@ class ReferenceLookup:
                 pending_old,
                 pending_new,
                 abs_new,
-                backup_enabled=self.updater.backup_enabled,
             )
         return links_updated
 
@@ -520,6 +690,9 @@ class ReferenceLookup:
         errors = 0
 
         references = self.find_references(old_file_path)
+        if references:
+            refreshed = self.refresh_changed_sources([(references, old_file_path, new_file_path)])
+            references = refreshed[0][0] if refreshed else []
         old_targets = self.get_old_path_variations(old_file_path)
 
         # For Python files, also check for module references (without .py extension)
@@ -565,6 +738,29 @@ class ReferenceLookup:
 
         return references_updated, errors
 
+    @staticmethod
+    def directory_target_move(target, old_dir, new_dir):
+        """Return the ``(old, new)`` path pair for a directory-path reference.
+
+        Exact directory targets map to ``old_dir``/``new_dir``; targets inside
+        the directory keep their suffix under ``new_dir``; anything else (e.g.
+        a backslash variant) falls back to a plain string replacement.
+        """
+        old_dir_norm = normalize_path(old_dir)
+        old_dir_prefix = old_dir_norm.rstrip("/") + "/"
+        target_norm = normalize_path(target)
+        if target_norm == old_dir_norm:
+            # Exact directory match — use old_dir / new_dir directly
+            return old_dir, new_dir
+        if target_norm.startswith(old_dir_prefix):
+            # Subdirectory match — replace the prefix
+            suffix = target_norm[len(old_dir_prefix) :]
+            return target, normalize_path(new_dir) + "/" + suffix
+        # Fallback (e.g., backslash variant) — simple string replace
+        if "\\" in target:
+            return target, target.replace(old_dir.replace("/", "\\"), new_dir.replace("/", "\\"))
+        return target, target.replace(old_dir, new_dir)
+
     def find_directory_path_references(self, dir_path):
         """Find all references to a directory path using multiple path variations.
 
@@ -654,19 +850,22 @@ class ReferenceLookup:
         old_file_path: str,
         new_file_path: str,
         abs_new_path: str,
-        backup_enabled: bool = False,
+        write_batch: Optional[list] = None,
     ):
         """Update relative links within a moved file to reflect its new location.
 
         Reads the moved file, parses for relative links, recalculates each
-        link target from the new location, and writes the updated content.
-        Also updates the database via rescan_moved_file_links.
+        link target from the new location, and writes the updated content
+        through ``LinkUpdater.write_file()`` (backups, durability, group
+        commit and journal as for any update).  Also updates the database
+        via rescan_moved_file_links.
 
         Args:
             old_file_path: Relative old path of the moved file.
             new_file_path: Relative new path of the moved file.
             abs_new_path: Absolute path to the file at its new location.
-            backup_enabled: Whether to create a backup before writing.
+            write_batch: Batch from ``LinkUpdater.begin_write_batch()`` to
+                stage the write into; None commits it immediately.
         """
         try:
             self.logger.info(
@@ -676,8 +875,7 @@ class ReferenceLookup:
 
             # Read the file content once — parse from the same content we'll modify
             # (PD-BUG-025: eliminates race condition between parse and read)
-            with open(abs_new_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content, encoding = safe_file_read_with_encoding(abs_new_path)
 
             # Parse from already-read content
             references = self.parser.parse_content(content, abs_new_path)
@@ -727,9 +925,14 @@ class ReferenceLookup:
                         file_path=abs_new_path,
                         references_count=links_updated,
                     )
+                    self.updater.record_dry_run_patch(
+                        abs_new_path, original_content, content, encoding=encoding
+                    )
                     content = original_content
                 else:
-                    self._write_with_backup(abs_new_path, content, backup_enabled)
+                    self.updater.write_file(
+                        abs_new_path, original_content, content, encoding, batch=write_batch
+                    )
 
             # PD-BUG-008: Update DB source path via shared method (same logic
             # as early-return paths above, and as _handle_directory_moved).
@@ -853,34 +1056,6 @@ class ReferenceLookup:
 
         return lines, links_updated
 
-    def _write_with_backup(self, abs_new_path, content, backup_enabled):
-        """Write updated content to file, creating a backup first if enabled."""
-        if backup_enabled:
-            backup_path = f"{abs_new_path}.bak"
-            try:
-                shutil.copy2(abs_new_path, backup_path)
-            except Exception as e:
-                self.logger.warning(
-                    "backup_creation_error",
-                    file_path=abs_new_path,
-                    error=str(e),
-                )
-
-        # Write to temporary file first, then move (atomic operation)
-        temp_path = None
-        try:
-            dir_path = os.path.dirname(abs_new_path)
-            with tempfile.NamedTemporaryFile(
-                mode="w", encoding="utf-8", dir=dir_path, delete=False
-            ) as temp_file:
-                temp_path = temp_file.name
-                temp_file.write(content)
-            shutil.move(temp_path, abs_new_path)
-        except Exception:
-            if temp_path and os.path.exists(temp_path):
-                os.unlink(temp_path)
-            raise
-
     def _calculate_updated_relative_path(
         self, original_target: str, old_file_path: str, new_file_path: str
     ) -> str:
@@ -26,22 +26,27 @@ import os
 import signal
 import time
 from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
 
 from watchdog.observers import Observer
 
 from .config.defaults import DEFAULT_CONFIG
 from .config.settings import LinkWatcherConfig
 from .database import LinkDatabase
+from .dry_run_patch import DryRunPatch, patch_path
 from .handler import LinkMaintenanceHandler
 from .logging import LogTimer, get_logger, with_context
+from .models import PlannedEdit
 from .parser import LinkParser
 from .parsers.base import BaseParser
+from .update_journal import UpdateJournal, journal_path
 from .updater import LinkUpdater
 from .utils import (
     compute_own_output_exclusions,
     get_relative_path,
     is_own_output,
     should_monitor_file,
+    source_signature,
 )
 
 
@@ -101,7 +106,15 @@ class LinkWatcherService:
 
         if config is not None:
             self.updater.set_dry_run(config.dry_run_mode)
+            if config.dry_run_mode:
+                self._open_dry_run_patch(config.dry_run_patch_file)
             self.updater.set_backup_enabled(config.create_backups)
+            self.updater.set_durability(config.update_durability)
+            self.updater.set_group_commit(config.update_group_commit)
+            self.updater.set_worker_threads(config.update_worker_threads)
+            journal_file = journal_path(config.update_journal_file, self.project_root)
+            if journal_file:
+                self.updater.set_journal(UpdateJournal(journal_file))
 
         # Setup signal handlers for graceful shutdown
         if register_signals:
@@ -121,6 +134,11 @@ class LinkWatcherService:
         self.logger.info("service_starting", project_root=str(self.project_root))
 
         try:
+            # Finish update batches interrupted by a previous run before
+            # the watcher or the scan can see half-updated files.
+            if self.updater.journal is not None:
+                self.updater.journal.recover()
+
             # Activate event deferral so events arriving during initial
             # scan are queued until the link DB is fully populated (PD-BUG-053)
             self.handler.begin_event_deferral()
@@ -150,6 +168,9 @@ class LinkWatcherService:
                     total_references=stats["total_references"],
                     total_targets=stats["total_targets"],
                 )
+                if (self.config or DEFAULT_CONFIG).performance_logging:
+                    self.parser.log_prefilter_stats()
+                    self.parser.log_classifier_stats()
 
             # Signal handler that DB is fully populated — replay any
             # events that arrived during the initial scan (PD-BUG-053)
@@ -187,6 +208,9 @@ class LinkWatcherService:
                 self.observer.join()
                 self.logger.debug("file_observer_stopped")
 
+            self.handler.stop()
+            self._open_dry_run_patch(None)
+
             # Log final statistics
             self._print_final_stats()
             self.logger.info("service_stopped")
@@ -200,7 +224,17 @@ class LinkWatcherService:
         monitored_extensions = config.monitored_extensions
         # PD-BUG-107: the daemon's own outputs (log + colocated files)
         # must never be parsed into the link database.
-        own_output = compute_own_output_exclusions(config.log_file, str(self.project_root))
+        own_output = compute_own_output_exclusions(
+            config.log_file,
+            str(self.project_root),
+            extra_files=[
+                journal_path(config.update_journal_file, self.project_root),
+                patch_path(config.dry_run_patch_file, self.project_root),
+            ],
+        )
+        # Non-monitored files are fingerprinted for rename detection only if
+        # the finished scan shows they are referenced (known targets).
+        unmonitored_files = []
 
         for root, dirs, files in os.walk(self.project_root):
             # Skip ignored directories
@@ -220,6 +254,7 @@ class LinkWatcherService:
                     file_path, monitored_extensions, ignored_dirs, str(self.project_root)
                 ):
                     try:
+                        signature = source_signature(file_path)
                         references = self.parser.parse_file(file_path)
                         # Normalize file paths to relative paths before storing
                         relative_file_path = get_relative_path(file_path, str(self.project_root))
@@ -227,6 +262,9 @@ class LinkWatcherService:
                             # Update the reference to use relative path
                             ref.file_path = relative_file_path
                         self.link_db.add_links_batch(references)
+                        if references:
+                            self.link_db.set_source_signature(relative_file_path, signature)
+                        self.handler.remember_file_fingerprint(file_path)
                         scanned_files += 1
 
                         progress_interval = config.scan_progress_interval
@@ -242,6 +280,12 @@ class LinkWatcherService:
                             error=str(e),
                             error_type=type(e).__name__,
                         )
+                elif config.move_detect_fingerprints:
+                    unmonitored_files.append(file_path)
+
+        for file_path in unmonitored_files:
+            if self.handler.is_known_reference_target(file_path):
+                self.handler.remember_file_fingerprint(file_path)
 
         self.link_db.last_scan = time.time()
         self.logger.info("scan_complete", files_scanned=scanned_files, scan_errors=scan_errors)
@@ -277,6 +321,7 @@ class LinkWatcherService:
             "project_root": str(self.project_root),
             "database_stats": self.link_db.get_stats(),
             "handler_stats": self.handler.get_stats(),
+            "move_detection_stats": self.handler.get_move_detection_stats(),
             "last_scan": self.link_db.last_scan,
         }
 
@@ -287,10 +332,31 @@ class LinkWatcherService:
         self._initial_scan()
         self.logger.info("rescan_complete")
 
-    def set_dry_run(self, enabled: bool):
-        """Enable or disable dry run mode."""
+    def set_dry_run(self, enabled: bool, patch_file: Optional[str] = None):
+        """Enable or disable dry run mode.
+
+        Args:
+            enabled: Whether to preview changes instead of writing files.
+            patch_file: Optional patch path (relative to the project root)
+                that receives every planned rewrite as a unified diff,
+                applicable later with ``git apply``.  Ignored when disabling.
+        """
         self.updater.set_dry_run(enabled)
-        self.logger.info("dry_run_toggled", enabled=enabled)
+        self._open_dry_run_patch(patch_file if enabled else None)
+        self.logger.info("dry_run_toggled", enabled=enabled, patch_file=patch_file)
+
+    def _open_dry_run_patch(self, patch_file: Optional[str]):
+        """Replace the updater's DryRunPatch (closing the previous one)."""
+        previous = self.updater.dry_run_patch
+        if previous is not None:
+            previous.close()
+            self.logger.info(
+                "dry_run_patch_closed",
+                patch_file=previous.path,
+                files_written=previous.files_written,
+            )
+        path = patch_path(patch_file, self.project_root)
+        self.updater.set_dry_run_patch(DryRunPatch(path, self.project_root) if path else None)
 
     def add_parser(self, extension: str, parser: BaseParser):
         """Add a custom parser for a specific file extension."""
@@ -298,6 +364,41 @@ class LinkWatcherService:
         # Update handler's monitored extensions
         self.handler.add_monitored_extension(extension)
 
+    def plan_move(self, old_path: str, new_path: str) -> List[PlannedEdit]:
+        """Return the link edits moving *old_path* to *new_path* would make.
+
+        What-if simulation: nothing on disk is moved, read for rewriting,
+        or written.  Paths may be absolute or project-relative, and may
+        name a file or a directory.
+        """
+        return self.plan_moves([(old_path, new_path)])
+
+    def plan_moves(self, moves: Iterable[Tuple[str, str]]) -> List[PlannedEdit]:
+        """Plan several hypothetical moves at once (see ``plan_move()``).
+
+        Lookups are shared across the moves, so estimating a whole
+        restructure costs one database query per distinct path.
+        """
+        relative_moves = [
+            (self._to_relative(old_path), self._to_relative(new_path))
+            for old_path, new_path in moves
+        ]
+        with LogTimer("move_planning", self.logger, moves=len(relative_moves)):
+            plan = self.handler.plan_moves(relative_moves)
+        self.logger.info(
+            "move_planned",
+            moves=len(relative_moves),
+            edits=len(plan),
+            files=len({edit.file_path for edit in plan}),
+        )
+        return plan
+
+    def _to_relative(self, path: str) -> str:
+        """Project-relative form of an absolute or relative *path*."""
+        if os.path.isabs(path):
+            return get_relative_path(path, str(self.project_root))
+        return path
+
     def check_links(self) -> dict:
         """Check all links and return broken ones."""
         self.logger.info("link_check_starting")
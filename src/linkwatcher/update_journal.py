@@ -0,0 +1,287 @@
+"""
+Transaction journal for multi-file link updates.
+
+A move that rewrites N referring files used to commit each file on its
+own (optionally after a full ``.bak`` copy), so a crash in the middle of
+a batch left the project half-updated.  With a journal configured
+(``update_journal_file``), ``LinkUpdater`` stages every rewrite of a
+batch, records them in one append-only JSON-lines entry, fsyncs the
+journal once, and only then renames the staged files into place.
+
+AI Context
+----------
+- **Entry point**: ``UpdateJournal`` -- created by the service when
+  ``update_journal_file`` is set and handed to
+  ``LinkUpdater.set_journal()``.  ``recover()`` runs once at service
+  start, before the initial scan.
+- **Record format** (one JSON object per line):
+  - ``{"op": "begin", "txn": id, "files": [...]}`` -- every file of the
+    batch with its ``encoding``, ``original_sha256``, ``new_sha256``,
+    line-level ``edits`` (``[index, old_line, new_line]``; index ``-1`` marks a
+    whole-content replacement when the line count changed) and the
+    ``temp_path`` of the staged rewrite.
+  - ``{"op": "rollback", "txn": id}`` -- a runtime failure started
+    undoing the batch.
+  - ``{"op": "end", "txn": id}`` -- the batch is fully applied or fully
+    rolled back.  When no transaction is open, the journal is truncated.
+- **Recovery**: a ``begin`` without ``end`` is rolled *forward* (files
+  still at their original hash get the edits; files already at the new
+  hash are left alone), unless a ``rollback`` record exists, in which
+  case files at the new hash are rolled *back*.  Files matching neither
+  hash were edited since and are skipped with a warning.  Staged temp
+  files still next to their targets are deleted.  A torn last
+  line (crash while writing ``begin``) is ignored: nothing was renamed
+  before the ``begin`` record was durable.
+- **Threading**: ``self._lock`` serializes journal appends and the
+  open-transaction count; file restores run outside the lock.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import uuid
+from typing import Dict, List, Optional
+
+from .logging import get_logger
+
+
+def journal_path(journal_file: Optional[str], project_root: str) -> Optional[str]:
+    """Resolve ``update_journal_file`` against the project root.
+
+    Returns None when journaling is disabled.
+    """
+    if not journal_file:
+        return None
+    if os.path.isabs(journal_file):
+        return journal_file
+    return os.path.join(str(project_root), journal_file)
+
+
+def content_hash(text: str) -> str:
+    """Return the SHA-256 hex digest of *text* (UTF-8)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def compute_edits(original: str, new: str) -> List[list]:
+    """Describe the change from *original* to *new* as line edits.
+
+    Link rewrites never add or remove lines, so the common case is a
+    short list of ``[index, old_line, new_line]``.  If the line count
+    differs, a single ``[-1, original, new]`` entry replaces the content.
+    """
+    old_lines = original.splitlines(True)
+    new_lines = new.splitlines(True)
+    if len(old_lines) != len(new_lines):
+        return [[-1, original, new]]
+    return [
+        [i, old, updated]
+        for i, (old, updated) in enumerate(zip(old_lines, new_lines))
+        if old != updated
+    ]
+
+
+def apply_edits(text: str, edits: List[list], reverse: bool = False) -> str:
+    """Apply *edits* to *text* (or undo them when *reverse* is True)."""
+    if edits and edits[0][0] == -1:
+        return edits[0][1] if reverse else edits[0][2]
+    lines = text.splitlines(True)
+    for index, old, new in edits:
+        lines[index] = old if reverse else new
+    return "".join(lines)
+
+
+class UpdateJournal:
+    """Append-only transaction log for batches of file rewrites.
+
+    Args:
+        path: Absolute path of the journal file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._open_txns = 0
+        self.logger = get_logger()
+
+    # --- Transaction lifecycle (called by LinkUpdater) ---
+
+    def begin(self, entries: List[Dict]) -> str:
+        """Durably record a batch of rewrites before any file is replaced.
+
+        *entries* are dicts with ``path``, ``original_sha256``,
+        ``new_sha256`` and ``edits`` (see ``make_entry()``).  Returns the
+        transaction id.
+        """
+        txn = uuid.uuid4().hex
+        with self._lock:
+            self._open_txns += 1
+            self._append({"op": "begin", "txn": txn, "files": entries})
+        self.logger.debug("update_journal_begin", txn=txn, files=len(entries))
+        return txn
+
+    def mark_rollback(self, txn: str):
+        """Record that *txn* is being rolled back."""
+        with self._lock:
+            self._append({"op": "rollback", "txn": txn})
+
+    def end(self, txn: str):
+        """Record that *txn* is complete; truncate when nothing is open."""
+        with self._lock:
+            self._append({"op": "end", "txn": txn})
+            self._open_txns -= 1
+            if self._open_txns == 0:
+                self._truncate()
+
+    @staticmethod
+    def make_entry(abs_path: str, original: str, new: str, encoding: str = "utf-8") -> Dict:
+        """Build the journal entry for rewriting *abs_path* (stored in *encoding*)."""
+        return {
+            "path": abs_path,
+            "encoding": encoding,
+            "original_sha256": content_hash(original),
+            "new_sha256": content_hash(new),
+            "edits": compute_edits(original, new),
+        }
+
+    def restore(self, entry: Dict, forward: bool) -> str:
+        """Bring one file to its new (*forward*) or original state.
+
+        Returns ``"applied"``, ``"already"`` (file is in the target state
+        or missing), or ``"conflict"`` (file matches neither hash).
+        """
+        path = entry["path"]
+        encoding = entry.get("encoding", "utf-8")
+        try:
+            with open(path, "r", encoding=encoding) as f:
+                current = f.read()
+        except FileNotFoundError:
+            return "already"
+
+        current_hash = content_hash(current)
+        target_hash = entry["new_sha256"] if forward else entry["original_sha256"]
+        source_hash = entry["original_sha256"] if forward else entry["new_sha256"]
+        if current_hash == target_hash:
+            return "already"
+        if current_hash != source_hash:
+            return "conflict"
+
+        _atomic_write(path, apply_edits(current, entry["edits"], reverse=not forward), encoding)
+        return "applied"
+
+    # --- Recovery ---
+
+    def recover(self) -> Dict[str, int]:
+        """Finish every transaction left open by a previous run.
+
+        Staged temp files of those transactions that were never renamed
+        into place are deleted.  Returns counts of files ``rolled_forward``, ``rolled_back`` and
+        ``conflicts`` (files edited since, left untouched).
+        """
+        summary = {"rolled_forward": 0, "rolled_back": 0, "conflicts": 0}
+        transactions = self._read_open_transactions()
+        if not transactions:
+            self._truncate()
+            return summary
+
+        for txn, (entries, rolling_back) in transactions.items():
+            for entry in entries:
+                try:
+                    outcome = self.restore(entry, forward=not rolling_back)
+                except Exception as e:
+                    outcome = "conflict"
+                    self.logger.error(
+                        "update_journal_restore_failed",
+                        txn=txn,
+                        file_path=entry.get("path"),
+                        error=str(e),
+                    )
+                if outcome == "applied":
+                    summary["rolled_back" if rolling_back else "rolled_forward"] += 1
+                elif outcome == "conflict":
+                    summary["conflicts"] += 1
+                    self.logger.warning(
+                        "update_journal_conflict",
+                        txn=txn,
+                        file_path=entry.get("path"),
+                    )
+                self._discard_staged_file(entry)
+
+        self.logger.info("update_journal_recovered", transactions=len(transactions), **summary)
+        with self._lock:
+            if self._open_txns == 0:
+                self._truncate()
+        return summary
+
+    def _read_open_transactions(self) -> Dict[str, tuple]:
+        """Return ``{txn: (entries, rolling_back)}`` for transactions without ``end``."""
+        transactions = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return transactions
+
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Torn write: the crash happened before this record was
+                # durable, so none of its files were replaced yet.
+                continue
+            op, txn = record.get("op"), record.get("txn")
+            if op == "begin":
+                transactions[txn] = (record.get("files", []), False)
+            elif op == "rollback" and txn in transactions:
+                transactions[txn] = (transactions[txn][0], True)
+            elif op == "end":
+                transactions.pop(txn, None)
+        return transactions
+
+    def _discard_staged_file(self, entry: Dict):
+        """Delete the entry's staged temp file if the crash left it behind."""
+        temp_path = entry.get("temp_path")
+        if not temp_path:
+            return
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            self.logger.warning(
+                "update_journal_temp_cleanup_failed", file_path=temp_path, error=str(e)
+            )
+            return
+        self.logger.debug("update_journal_temp_removed", file_path=temp_path)
+
+    # --- File helpers (called with self._lock held) ---
+
+    def _append(self, record: Dict):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _truncate(self):
+        if os.path.exists(self.path):
+            with open(self.path, "w", encoding="utf-8"):
+                pass
+
+
+def _atomic_write(path: str, content: str, encoding: str = "utf-8"):
+    """Replace *path* with *content* via a temp file in the same directory."""
+    temp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="w", encoding=encoding, dir=os.path.dirname(path), delete=False
+        ) as temp_file:
+            temp_path = temp_file.name
+            temp_file.write(content)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_path, path)
+    except Exception:
+        if temp_path and os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
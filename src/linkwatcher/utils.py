@@ -6,7 +6,8 @@ This module contains common utility functions used across the system.
 AI Context
 ----------
 - **Role**: Stateless pure-function library for path manipulation and
-  file-classification heuristics.  No classes, no instance state — every
+  file-classification heuristics.  No classes (besides the
+  ``BinaryFileError`` exception), no instance state — every
   function is a free function importable by any module.
 - **High-traffic functions and primary callers**:
   - ``normalize_path()`` — canonical forward-slash form.
@@ -16,15 +17,32 @@ AI Context
     Called by handler.py, service.py, validator.py.
   - ``get_relative_path()`` — absolute-to-project-relative conversion.
     Called by database.py, handler.py, service.py, reference_lookup.py.
+    Resolves each absolute project root once (``_resolved_root()``) and slices
+    normalized absolute paths under it as strings; ``normalize_path()`` is
+    LRU-cached.  Both caches are process-wide and never invalidated.
   - ``looks_like_file_path()`` / ``looks_like_directory_path()`` —
     heuristic classifiers for parser-extracted text.
-    Called by parsers/base.py (``BaseParser``).
+    Called by parsers/base.py (``BaseParser``).  Both, and
+    ``looks_like_regex_or_glob()``, are bounded process-wide
+    ``lru_cache`` memos (``_CLASSIFIER_CACHE_SIZE``); hit/miss counts come
+    from ``classifier_cache_stats()``.
   - ``safe_file_read()`` — multi-encoding file reader with fallback.
-    Called by database.py, reference_lookup.py, validator.py.
+    Called by parsers/base.py.  ``safe_file_read_with_encoding()`` also
+    returns the detected encoding so rewrites keep it; called by
+    updater.py and reference_lookup.py.  One ``read()`` per file: BOM and
+    NUL sniffing happen on the bytes, decodings are tried in memory, and
+    binary files raise ``BinaryFileError``.
+  - ``sniff_file_encodings()`` / ``iter_text_chunks()`` — the same
+    sniffing on the first 8 KiB only, plus a chunked text reader, for
+    oversize files parsed in windows (``BaseParser.parse_windows()``).
   - ``should_ignore_directory()`` — basename-level dir filter.
     Called by handler.py, service.py.
   - ``find_line_number()`` — linear search for text in line list.
     Called by validator.py.
+  - ``content_digest()`` — identity of parsed content for offset-based
+    patching.  Called by parsers/base.py and updater.py.
+  - ``source_signature()`` — ``(mtime_ns, size)`` change signature.
+    Called by service.py and reference_lookup.py.
 - **Common tasks**:
   - Adding a new utility: add a free function here, import where needed.
     No registration or wiring required.
@@ -38,10 +56,13 @@ AI Context
   noted in 0.1.1 state file as missing).
 """
 
+import codecs
+import hashlib
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 
 def should_monitor_file(
@@ -103,7 +124,9 @@ def should_ignore_directory(dir_path: str, ignored_dirs: Set[str]) -> bool:
     return dir_name in ignored_dirs
 
 
-def compute_own_output_exclusions(log_file: Optional[str], project_root: str) -> dict:
+def compute_own_output_exclusions(
+    log_file: Optional[str], project_root: str, extra_files: Iterable[str] = ()
+) -> dict:
     """Build the daemon's own-output exclusion registry (PD-BUG-107).
 
     The daemon must never index or react to files it writes itself:
@@ -131,7 +154,8 @@ def compute_own_output_exclusions(log_file: Optional[str], project_root: str) ->
     Future extensions that write additional daemon outputs to other
     locations register them by adding entries to the returned registry
     (``dirs`` for directories, ``file_stems`` for ``(dir, base, ext)``
-    rotation families).
+    rotation families).  Single daemon-written files (e.g. the update
+    journal) are passed as *extra_files* and registered as file stems.
 
     Returns:
         Registry dict ``{"dirs": set[str], "file_stems": set[tuple]}``
@@ -139,6 +163,11 @@ def compute_own_output_exclusions(log_file: Optional[str], project_root: str) ->
         is no file logging.
     """
     registry = {"dirs": set(), "file_stems": set()}
+    for extra_file in extra_files:
+        if extra_file:
+            abs_extra = os.path.normcase(os.path.abspath(extra_file))
+            base, ext = os.path.splitext(os.path.basename(abs_extra))
+            registry["file_stems"].add((os.path.dirname(abs_extra), base, ext))
     if not log_file:
         return registry
     abs_log = os.path.normcase(os.path.abspath(log_file))
@@ -175,10 +204,14 @@ def is_own_output(path: str, registry: dict) -> bool:
     return False
 
 
+@lru_cache(maxsize=65536)
 def normalize_path(path: str) -> str:
     """
     Normalize a path for consistent comparisons.
 
+    Pure string function, so results are LRU-cached: the same paths are
+    normalized over and over by the database, handler and resolver.
+
     Args:
         path: Path to normalize
 
@@ -260,15 +293,42 @@ def get_relative_path(abs_path: str, project_root: str) -> str:
     Returns:
         Relative path from project root
     """
+    root = _resolved_root(project_root)
+    # Fast path: an already-normalized absolute path spelled under the
+    # resolved root is sliced as a string, without touching the disk.  Paths
+    # under the root are taken literally (an in-tree symlink keeps its
+    # in-tree spelling); anything else (relative, "..", a differently
+    # spelled root) goes through Path.resolve() as before.
+    if os.path.isabs(abs_path) and os.path.normpath(abs_path) == abs_path:
+        if abs_path == root:
+            return "."
+        prefix = root if root.endswith(os.sep) else root + os.sep
+        if abs_path.startswith(prefix):
+            return abs_path[len(prefix) :].replace("\\", "/")
     try:
         abs_path_obj = Path(abs_path).resolve()
-        project_root_obj = Path(project_root).resolve()
-        return str(abs_path_obj.relative_to(project_root_obj)).replace("\\", "/")
+        return str(abs_path_obj.relative_to(root)).replace("\\", "/")
     except ValueError:
         # Path is outside project root
         return abs_path.replace("\\", "/")
 
 
+def _resolved_root(project_root: str) -> str:
+    """Return ``Path(project_root).resolve()`` as a string.
+
+    Absolute roots are resolved once per process; relative roots depend on
+    the working directory and are resolved on every call.
+    """
+    if os.path.isabs(project_root):
+        return _resolve_absolute_root(project_root)
+    return str(Path(project_root).resolve())
+
+
+@lru_cache(maxsize=16)
+def _resolve_absolute_root(project_root: str) -> str:
+    return str(Path(project_root).resolve())
+
+
 _COMMON_EXTENSIONS = frozenset(
     {
         ".md",
@@ -311,6 +371,12 @@ _COMMON_EXTENSIONS = frozenset(
 )
 
 
+# Entries per path-classifier memo (looks_like_*).  Parsers hand the same
+# candidate strings (``README.md``, ``../config.yaml``) to the classifiers
+# thousands of times per scan; the results are pure functions of the text.
+_CLASSIFIER_CACHE_SIZE = 16384
+
+
 # TD243: Module-level compiled patterns for looks_like_regex_or_glob — called
 # from every parser-extracted string, so per-call re.search cache lookups add up.
 _RE_CHAR_CLASS = re.compile(r"\[[\w\-]+\]")
@@ -318,6 +384,7 @@ _RE_REGEX_ESCAPE_QUANT = re.compile(r"\\[dswDSW](?:[+*?{]|$)")
 _RE_ESCAPED_METACHAR = re.compile(r"\\[\.\[\]\(\)\{\}\+\*\?\^\$]")
 
 
+@lru_cache(maxsize=_CLASSIFIER_CACHE_SIZE)
 def looks_like_regex_or_glob(text: str) -> bool:
     """Detect strings that contain glob or regex meta-characters.
 
@@ -370,6 +437,7 @@ def looks_like_regex_or_glob(text: str) -> bool:
     return False
 
 
+@lru_cache(maxsize=_CLASSIFIER_CACHE_SIZE)
 def looks_like_file_path(text: str) -> bool:
     """
     Check if a string looks like a file path.
@@ -426,6 +494,7 @@ def looks_like_file_path(text: str) -> bool:
     return False
 
 
+@lru_cache(maxsize=_CLASSIFIER_CACHE_SIZE)
 def looks_like_directory_path(text: str) -> bool:
     """
     Check if a string looks like a directory path (no file extension required).
@@ -470,6 +539,24 @@ def looks_like_directory_path(text: str) -> bool:
     return True
 
 
+def classifier_cache_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Return hit/miss counts of the memoized path classifiers.
+
+    The memos are process-wide ``lru_cache``s of ``_CLASSIFIER_CACHE_SIZE``
+    entries each; counts accumulate until ``cache_clear()``.
+    """
+    stats = {}
+    for classifier in (looks_like_file_path, looks_like_directory_path, looks_like_regex_or_glob):
+        info = classifier.cache_info()
+        stats[classifier.__name__] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+        }
+    return stats
+
+
 def find_line_number(lines: list, search_text: str) -> int:
     """
     Find the line number containing specific text.
@@ -487,34 +574,157 @@ def find_line_number(lines: list, search_text: str) -> int:
     return 0
 
 
-def safe_file_read(file_path: str, encoding: str = "utf-8") -> str:
+class BinaryFileError(IOError):
+    """Raised by ``safe_file_read()`` for content that is not text."""
+
+
+# UTF-16/32 byte-order marks -> endian-specific codec.  The codecs keep the
+# BOM as U+FEFF at the start of the text, so writing the text back with the
+# same codec reproduces it (as plain "utf-8" already does for a UTF-8 BOM).
+# UTF-32 LE must be tested before UTF-16 LE (same first two bytes).
+_UNICODE_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+# Bytes inspected for NUL when sniffing binary content.
+_BINARY_SNIFF_BYTES = 8192
+
+
+def candidate_encodings(head: bytes, file_path: str, encoding: str = "utf-8") -> List[str]:
     """
-    Safely read a file with fallback encodings.
+    Return the decodings to try, in order, for a file starting with *head*.
+
+    A UTF-16/32 BOM selects its codec alone; otherwise a NUL byte in
+    *head* marks the file as binary.
+
+    Raises:
+        BinaryFileError if the file looks binary
+    """
+    for bom, bom_encoding in _UNICODE_BOMS:
+        if head.startswith(bom):
+            return [bom_encoding]
+    if b"\x00" in head[:_BINARY_SNIFF_BYTES]:
+        raise BinaryFileError(f"Binary content in {file_path}")
+    return list(dict.fromkeys([encoding, "utf-8", "latin-1", "cp1252"]))
+
+
+def sniff_file_encodings(file_path: str, encoding: str = "utf-8") -> List[str]:
+    """
+    Return ``candidate_encodings()`` for *file_path* from its first bytes only.
+
+    Used where the file is too large to read whole (see
+    ``iter_text_chunks()``).
+
+    Raises:
+        BinaryFileError if the file looks binary
+        OSError if the file cannot be opened
+    """
+    with open(file_path, "rb") as f:
+        head = f.read(_BINARY_SNIFF_BYTES)
+    return candidate_encodings(head, file_path, encoding)
+
+
+def iter_text_chunks(file_path: str, encoding: str, chunk_chars: int) -> Iterator[str]:
+    """
+    Yield the decoded text of *file_path* in chunks of *chunk_chars*.
+
+    Line endings are translated to ``"\n"`` (a ``"\r\n"`` pair is never
+    split across chunks).  Raises ``UnicodeDecodeError`` part-way through
+    if *encoding* does not fit the file.
+    """
+    with open(file_path, "r", encoding=encoding) as f:
+        while True:
+            chunk = f.read(chunk_chars)
+            if not chunk:
+                return
+            yield chunk
+
+
+def safe_file_read_with_encoding(file_path: str, encoding: str = "utf-8") -> Tuple[str, str]:
+    """
+    Read a text file once and decode it with fallback encodings.
+
+    The bytes are read in a single call; a UTF-16/32 BOM selects its codec
+    directly, otherwise a NUL byte near the start marks the file as binary.
+    Decodings are then tried on the in-memory buffer in the order
+    *encoding*, utf-8, latin-1, cp1252.  Line endings are translated to
+    ``"\\n"`` exactly as a text-mode read would.
 
     Args:
         file_path: Path to file to read
         encoding: Primary encoding to try
 
     Returns:
-        File content as string
+        ``(content, encoding)`` -- write the file back with that encoding
+        (in text mode) to preserve it.
 
     Raises:
+        BinaryFileError if the file looks binary
         IOError if file cannot be read with any encoding
     """
-    encodings = [encoding, "utf-8", "latin-1", "cp1252"]
+    try:
+        with open(file_path, "rb") as f:
+            data = f.read()
+    except Exception as e:
+        raise IOError(f"Could not read file {file_path}: {e}")
 
-    for enc in encodings:
+    for enc in candidate_encodings(data[:_BINARY_SNIFF_BYTES], file_path, encoding):
         try:
-            with open(file_path, "r", encoding=enc) as f:
-                return f.read()
+            content = data.decode(enc)
         except UnicodeDecodeError:
             continue
-        except Exception as e:
-            raise IOError(f"Could not read file {file_path}: {e}")
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content, enc
 
     raise IOError(f"Could not decode file {file_path} with any encoding")
 
 
+def safe_file_read(file_path: str, encoding: str = "utf-8") -> str:
+    """
+    Safely read a file with fallback encodings.
+
+    See ``safe_file_read_with_encoding()``; this returns the content only.
+
+    Args:
+        file_path: Path to file to read
+        encoding: Primary encoding to try
+
+    Returns:
+        File content as string
+
+    Raises:
+        BinaryFileError if the file looks binary
+        IOError if file cannot be read with any encoding
+    """
+    return safe_file_read_with_encoding(file_path, encoding)[0]
+
+
+def source_signature(file_path: str) -> Optional[Tuple[int, int]]:
+    """
+    Return a cheap change signature ``(mtime_ns, size)`` for *file_path*.
+
+    Returns None if the file cannot be stat'd.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def content_digest(content: str) -> str:
+    """
+    Return a short digest identifying decoded file *content*.
+
+    Used to check that parse-time character offsets still apply to the
+    content the updater reads back.
+    """
+    return hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
 def is_file_size_within_limit(file_path: str, max_size_mb: int) -> bool:
     """
     Check whether a file's size is within the configured megabyte limit.
@@ -11,6 +11,12 @@ Test Cases:
 - BM-007: Database lookup throughput
 - BM-008: Database update throughput
 - BM-004: Updater throughput
+- BM-011: Batch updater throughput, serial vs thread-pooled (1k files)
+- BM-012: Python package rename (500 modules, single-scan module matcher)
+- BM-013: Path utilities on 100k paths (get_relative_path, normalize_path)
+- BM-014: Python parser engines, regex vs tokenize (stdlib modules)
+- BM-015: Shared line prefilter skip ratio and speedup (benchmark corpus + stdlib)
+- BM-016: Initial scan with vs without the path-classifier memos
 
 Split from test_benchmark.py (TD254): operation-level benchmarks (BM-003/005/006)
 live in level2-operation/test_operation_benchmarks.py. Shared helpers are factory
@@ -19,13 +25,21 @@ fixtures in performance/conftest.py.
 Timing uses time.perf_counter() for monotonic, sub-microsecond resolution.
 """
 
+import os
+import re
 import time
+from pathlib import Path
 
 import pytest
 from watchdog.events import FileMovedEvent
 
-from linkwatcher import LinkDatabase, LinkParser, LinkWatcherService
+from linkwatcher import LinkDatabase, LinkParser, LinkWatcherService, utils
 from linkwatcher.models import LinkReference
+from linkwatcher.parsers import MarkdownParser
+from linkwatcher.parsers import base as parsers_base
+from linkwatcher.parsers.python import PythonParser
+from linkwatcher.updater import LinkUpdater
+from linkwatcher.utils import classifier_cache_stats, get_relative_path, normalize_path
 
 pytestmark = [
     pytest.mark.feature("cross-cutting"),
@@ -238,3 +252,382 @@ class TestUpdaterBenchmark:
         # Verify a sample was actually updated
         sample = (temp_project_dir / "src_000.md").read_text()
         assert "moved/target.txt" in sample
+
+    def test_bm_011_batch_update_serial_vs_parallel(self, tmp_path):
+        """
+        BM-011: Batch updater throughput, serial vs thread-pooled
+
+        Rewrites 1,000 referring files (one per moved target, as produced by
+        a directory move) through update_references_batch() once with
+        worker_threads=1 and once with worker_threads=8, on separate but
+        identical trees.  Both runs must produce identical stats; the
+        parallel run must stay within the same budget.
+        Expected: each run <10s.
+        """
+        num_files = 1000
+
+        def build_tree(root):
+            root.mkdir()
+            move_groups = []
+            for i in range(num_files):
+                src = root / f"ref_{i:04d}.md"
+                src.write_text(
+                    f"# Ref {i}\n\n" + "Filler line.\n" * 40 + "See [doc](old/doc.md).\n"
+                )
+                ref = LinkReference(str(src), 43, 4, 20, "doc", "old/doc.md", "markdown")
+                move_groups.append(([ref], "old/doc.md", "new/doc.md"))
+            return move_groups
+
+        def run(root, workers):
+            move_groups = build_tree(root)
+            updater = LinkUpdater(str(root))
+            updater.set_backup_enabled(False)
+            updater.set_worker_threads(workers)
+            start = time.perf_counter()
+            stats = updater.update_references_batch(move_groups)
+            return stats, time.perf_counter() - start
+
+        # Warmup on a small throwaway tree
+        warm_root = tmp_path / "warm"
+        warm_root.mkdir()
+        warm_file = warm_root / "w.md"
+        warm_file.write_text("See [doc](old/doc.md).\n")
+        LinkUpdater(str(warm_root)).update_references_batch(
+            [
+                (
+                    [LinkReference(str(warm_file), 1, 4, 20, "doc", "old/doc.md", "markdown")],
+                    "old/doc.md",
+                    "new/doc.md",
+                )
+            ]
+        )
+
+        serial_stats, serial_time = run(tmp_path / "serial", 1)
+        parallel_stats, parallel_time = run(tmp_path / "parallel", 8)
+
+        print(f"\nBatch updater throughput ({num_files} files):")
+        print(f"  Serial:   {serial_time:.3f}s ({num_files / serial_time:.0f} files/sec)")
+        print(f"  Parallel: {parallel_time:.3f}s ({num_files / parallel_time:.0f} files/sec)")
+        print(f"  Speedup:  {serial_time / parallel_time:.2f}x")
+
+        for stats in (serial_stats, parallel_stats):
+            assert stats["files_updated"] == num_files
+            assert stats["references_updated"] == num_files
+            assert stats["errors"] == 0
+            assert stats["stale_files"] == []
+        assert "new/doc.md" in (tmp_path / "parallel" / "ref_0999.md").read_text()
+        assert serial_time < 10, f"Serial batch took {serial_time:.2f}s (expected <10s)"
+        assert parallel_time < 10, f"Parallel batch took {parallel_time:.2f}s (expected <10s)"
+
+    def test_bm_012_python_package_rename(self, tmp_path):
+        """
+        BM-012: Python package rename (500 modules)
+
+        Moves a package of 500 modules (src/pkg -> src/lib) through
+        update_references_batch().  Each of 20 referring files imports every
+        module and calls into it, so Phase 2 (PD-BUG-045) has 500 module
+        renames per file.  The single-scan matcher is compared against the
+        former one-regex-per-module loop on the same content; both must
+        produce identical text.
+        Expected: batch <10s.
+        """
+        num_modules = 500
+        num_files = 20
+        modules = [f"mod_{i:03d}" for i in range(num_modules)]
+        content = "".join(f"import src.pkg.{m}\n" for m in modules) + "\n"
+        content += "".join(f"src.pkg.{m}.run()\n" for m in modules)
+
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        parser = LinkParser()
+        refs_by_module = {m: [] for m in modules}
+        for i in range(num_files):
+            src = tmp_path / f"user_{i:02d}.py"
+            src.write_text(content)
+            for ref in parser.parse_file(str(src)):
+                refs_by_module[ref.link_target.rsplit("/", 1)[-1]].append(ref)
+        move_groups = [(refs_by_module[m], f"src/pkg/{m}.py", f"src/lib/{m}.py") for m in modules]
+
+        updater = LinkUpdater(str(tmp_path))
+        updater.set_backup_enabled(False)
+        start = time.perf_counter()
+        stats = updater.update_references_batch(move_groups)
+        batch_time = time.perf_counter() - start
+
+        # Phase 2 in isolation: one scan vs one regex per module
+        renames = {f"src.pkg.{m}": f"src.lib.{m}" for m in modules}
+        start = time.perf_counter()
+        single_scan = updater._rename_module_usages(content, renames)
+        single_time = time.perf_counter() - start
+        start = time.perf_counter()
+        per_module = content
+        for old_module, new_module in renames.items():
+            per_module = re.sub(
+                r"(?<![.\w])" + re.escape(old_module) + r"(?!\w)", new_module, per_module
+            )
+        per_module_time = time.perf_counter() - start
+
+        print(f"\nPython package rename ({num_modules} modules, {num_files} files):")
+        print(f"  Batch:             {batch_time:.3f}s")
+        print(f"  Phase 2 single:    {single_time * 1000:.1f}ms per file")
+        print(f"  Phase 2 per-module: {per_module_time * 1000:.1f}ms per file")
+
+        assert single_scan == per_module
+        assert stats["files_updated"] == num_files
+        assert stats["references_updated"] == num_files * num_modules
+        assert stats["errors"] == 0
+        assert (tmp_path / "user_00.py").read_text() == content.replace("src.pkg.", "src.lib.")
+        assert batch_time < 10, f"Package rename took {batch_time:.2f}s (expected <10s)"
+
+
+class TestPathUtilsBenchmark:
+    """Benchmark tests for the path helpers in utils.py."""
+
+    @pytest.mark.performance
+    def test_bm_013_path_utils_100k(self, tmp_path):
+        """
+        BM-013: get_relative_path / normalize_path on 100k paths
+
+        get_relative_path() on 100k absolute paths under the project root,
+        compared with the former implementation that resolved both the path
+        and the root with Path.resolve() on every call.  normalize_path()
+        on 100k calls over 10k distinct paths (the repeat pattern of scans
+        and move handling), cached vs the unwrapped function.  Outputs must
+        be identical.
+        Expected: get_relative_path at least 5x faster than the resolve()
+        baseline.
+        """
+        root = str(tmp_path.resolve())
+        abs_paths = [
+            os.path.join(root, f"dir_{i % 100:02d}", f"sub_{i % 7}", f"file_{i:05d}.md")
+            for i in range(100_000)
+        ]
+
+        start = time.perf_counter()
+        fast = [get_relative_path(p, root) for p in abs_paths]
+        fast_time = time.perf_counter() - start
+        start = time.perf_counter()
+        baseline = [
+            str(Path(p).resolve().relative_to(Path(root).resolve())).replace("\\", "/")
+            for p in abs_paths
+        ]
+        baseline_time = time.perf_counter() - start
+
+        rel_paths = [f"./dir_{i % 100:02d}\\sub_{i % 7}//file_{i:04d}.md" for i in range(10_000)]
+        normalize_path.cache_clear()
+        start = time.perf_counter()
+        cached = [normalize_path(p) for _ in range(10) for p in rel_paths]
+        cached_time = time.perf_counter() - start
+        uncached_fn = normalize_path.__wrapped__
+        start = time.perf_counter()
+        uncached = [uncached_fn(p) for _ in range(10) for p in rel_paths]
+        uncached_time = time.perf_counter() - start
+
+        print("\nPath utilities (100k calls):")
+        print(f"  get_relative_path: {fast_time:.3f}s (resolve() baseline {baseline_time:.3f}s)")
+        print(f"  normalize_path:    {cached_time:.3f}s (uncached {uncached_time:.3f}s)")
+
+        assert fast == baseline
+        assert cached == uncached
+        assert (
+            fast_time * 5 < baseline_time
+        ), f"get_relative_path took {fast_time:.3f}s vs {baseline_time:.3f}s baseline"
+
+
+class TestPythonParserEngineBenchmark:
+    """Benchmark the two PythonParser engines on a large real codebase."""
+
+    @pytest.mark.performance
+    def test_bm_014_python_parser_engines(self):
+        """
+        BM-014: PythonParser regex vs tokenize engine
+
+        Parses up to 300 top-level modules of the running interpreter's
+        standard library (several MB of real-world Python) with both
+        engines.  Every reference from either engine must slice exactly its
+        link text out of its line.
+        Expected: the tokenize engine within 8x of the regex engine (the
+        stdlib tokenizer is pure Python before 3.12 and C-based after).
+        """
+        stdlib_dir = os.path.dirname(os.__file__)
+        sources = []
+        for path in sorted(Path(stdlib_dir).glob("*.py"))[:300]:
+            try:
+                sources.append((str(path), path.read_text(encoding="utf-8")))
+            except (OSError, UnicodeDecodeError):
+                continue
+        total_mb = sum(len(content) for _, content in sources) / (1024 * 1024)
+
+        timings = {}
+        for engine in ("regex", "tokenize"):
+            parser = PythonParser(engine=engine)
+            start = time.perf_counter()
+            results = [parser.parse_content(content, path) for path, content in sources]
+            timings[engine] = time.perf_counter() - start
+
+            count = 0
+            for (path, content), references in zip(sources, results):
+                lines = content.split("\n")
+                for ref in references:
+                    line = lines[ref.line_number - 1]
+                    assert line[ref.column_start : ref.column_end] == ref.link_text, (
+                        engine,
+                        path,
+                        ref.line_number,
+                    )
+                count += len(references)
+            assert count > 0, f"{engine} engine found no references"
+
+        print(f"\nPythonParser engines ({len(sources)} stdlib modules, {total_mb:.1f} MB):")
+        print(f"  regex:    {timings['regex']:.3f}s")
+        print(f"  tokenize: {timings['tokenize']:.3f}s")
+
+        assert (
+            timings["tokenize"] < timings["regex"] * 8
+        ), f"tokenize engine took {timings['tokenize']:.3f}s vs {timings['regex']:.3f}s"
+
+
+class TestLinePrefilterBenchmark:
+    """Benchmark the shared line prefilter used by the line-by-line parsers."""
+
+    @pytest.mark.performance
+    def test_bm_015_line_prefilter(self, temp_project_dir, benchmark_files, monkeypatch):
+        """
+        BM-015: Line prefilter skip ratio and speedup
+
+        Parses the BM-001 markdown corpus and up to 300 top-level stdlib
+        modules with the prefilter active, then again with a pattern that
+        admits every line.  References must be identical either way.
+        Expected: some lines skipped for both corpora, and the filtered
+        passes together no slower than the unfiltered ones (1.25x noise
+        allowance).
+        """
+        markdown = [
+            (str(path), path.read_text(encoding="utf-8"))
+            for path in benchmark_files(temp_project_dir, 100)
+            if path.suffix == ".md"
+        ]
+        stdlib_dir = os.path.dirname(os.__file__)
+        python = []
+        for path in sorted(Path(stdlib_dir).glob("*.py"))[:300]:
+            try:
+                python.append((str(path), path.read_text(encoding="utf-8")))
+            except (OSError, UnicodeDecodeError):
+                continue
+
+        def run(parser_cls, sources):
+            # Best of three: the markdown corpus parses in milliseconds
+            elapsed = []
+            for _ in range(3):
+                parser = parser_cls()
+                start = time.perf_counter()
+                results = [
+                    [
+                        (r.line_number, r.column_start, r.link_target)
+                        for r in parser.parse_content(c, p)
+                    ]
+                    for p, c in sources
+                ]
+                elapsed.append(time.perf_counter() - start)
+            return results, min(elapsed), parser.prefilter_stats
+
+        measured = {}
+        for name, parser_cls, sources in (
+            ("markdown", MarkdownParser, markdown),
+            ("python", PythonParser, python),
+        ):
+            filtered, filtered_time, stats = run(parser_cls, sources)
+            with monkeypatch.context() as m:
+                m.setattr(parsers_base, "PATH_TRIGGER_PATTERN", re.compile(r"^", re.MULTILINE))
+                unfiltered, unfiltered_time, all_stats = run(parser_cls, sources)
+            assert all_stats["skipped"] == 0
+            assert filtered == unfiltered, f"{name}: prefilter changed the references"
+            measured[name] = (stats["skipped"] / stats["lines"], filtered_time, unfiltered_time)
+
+        print("\nLine prefilter:")
+        for name, (ratio, filtered_time, unfiltered_time) in measured.items():
+            print(
+                f"  {name:<8} skipped {ratio:.1%} of lines; "
+                f"{filtered_time:.3f}s filtered vs {unfiltered_time:.3f}s unfiltered"
+            )
+
+        for name, (ratio, _, _) in measured.items():
+            assert ratio > 0, f"{name}: prefilter skipped no lines"
+        # The markdown corpus parses in milliseconds, so time is compared in total
+        filtered_total = sum(filtered for _, filtered, _ in measured.values())
+        unfiltered_total = sum(unfiltered for _, _, unfiltered in measured.values())
+        assert (
+            filtered_total < unfiltered_total * 1.25
+        ), f"{filtered_total:.3f}s filtered vs {unfiltered_total:.3f}s unfiltered"
+
+
+class TestPathClassifierMemoBenchmark:
+    """Benchmark the looks_like_* memos on a full initial scan."""
+
+    @pytest.mark.performance
+    def test_bm_016_initial_scan_classifier_memo(self, tmp_path, monkeypatch):
+        """
+        BM-016: Initial scan with vs without the path-classifier memos
+
+        Scans 400 markdown and 100 Python files whose links mostly point at
+        a handful of shared targets (README.md, ../config.yaml, ...) -- the
+        recurrence the memos exploit -- once with the classifiers' uncached
+        ``__wrapped__`` functions patched in, then with cleared memos.  The
+        resulting link databases must match.
+        Expected: memo hit rate above 50%, and the memoized scan not slower
+        beyond noise (1.5x allowance; parsing is only part of a scan, so
+        the timings are reported rather than gated tightly).
+        """
+        shared = ["README.md", "../config.yaml", "docs/guide.md", "src/app/main.py", "CHANGELOG.md"]
+        for i in range(400):
+            links = "\n".join(
+                f"- See [{name}]({name}) and `{name}` for details." for name in shared
+            )
+            (tmp_path / f"doc_{i:03d}.md").write_text(
+                f"# Doc {i}\n\n{links}\n- Own page: [next](doc_{(i + 1) % 400:03d}.md)\n"
+            )
+        for i in range(100):
+            (tmp_path / f"mod_{i:03d}.py").write_text(
+                "".join(f'PATH_{j} = "{name}"  # see {name}\n' for j, name in enumerate(shared))
+            )
+
+        def scan():
+            # Best of three, so file-system caching does not favour either side
+            elapsed = []
+            for _ in range(3):
+                service = LinkWatcherService(str(tmp_path))
+                start = time.perf_counter()
+                service._initial_scan()
+                elapsed.append(time.perf_counter() - start)
+            return service.link_db.get_stats(), min(elapsed)
+
+        with monkeypatch.context() as m:
+            m.setattr(parsers_base, "looks_like_file_path", utils.looks_like_file_path.__wrapped__)
+            m.setattr(
+                parsers_base,
+                "looks_like_directory_path",
+                utils.looks_like_directory_path.__wrapped__,
+            )
+            m.setattr(utils, "looks_like_regex_or_glob", utils.looks_like_regex_or_glob.__wrapped__)
+            uncached_stats, uncached_time = scan()
+
+        for classifier in (
+            utils.looks_like_file_path,
+            utils.looks_like_directory_path,
+            utils.looks_like_regex_or_glob,
+        ):
+            classifier.cache_clear()
+        cached_stats, cached_time = scan()
+
+        counts = classifier_cache_stats()["looks_like_file_path"]
+        hit_rate = counts["hits"] / (counts["hits"] + counts["misses"])
+
+        print("\nInitial scan, path-classifier memos (500 files):")
+        print(f"  uncached: {uncached_time:.3f}s")
+        print(f"  memoized: {cached_time:.3f}s")
+        print(f"  looks_like_file_path hit rate: {hit_rate:.1%} ({counts['size']} entries)")
+
+        assert cached_stats == uncached_stats
+        assert hit_rate > 0.5, f"hit rate {hit_rate:.1%}"
+        assert (
+            cached_time < uncached_time * 1.5
+        ), f"memoized scan {cached_time:.3f}s vs uncached {uncached_time:.3f}s"
@@ -10,6 +10,7 @@ Test Cases:
 - BM-003: Initial scan performance
 - BM-005: Validation mode performance
 - BM-006: Delete+create correlation timing
+- BM-010: Bulk delete+create correlation (10k-file trace)
 
 Split from test_benchmark.py (TD254): component-level benchmarks (BM-001/002/004/007/008)
 live in level1-component/test_component_benchmarks.py. Shared helpers are factory
@@ -206,3 +207,72 @@ class TestCorrelationBenchmark:
         # performance-test-tracking.md (single source of truth for tolerance basis).
         assert avg_ms < 5, f"Average correlation {avg_ms:.2f}ms (expected <5ms)"
         assert match_rate == 100, f"Match rate {match_rate:.0f}% (expected 100%)"
+
+    @pytest.mark.performance
+    def test_bm_010_bulk_correlation_trace(self, temp_project_dir):
+        """
+        BM-010: Bulk delete+create correlation (10k-file trace)
+
+        Replays an IDE-style bulk refactor: 10,000 deletes are buffered first,
+        then the 10,000 matching creates arrive in reverse order.  With the
+        (basename, size) index each create inspects only its own candidates,
+        so total time grows linearly instead of with deletes x creates
+        (the former linear scan took ~34s for this trace).
+        """
+        num_files = 10000
+        src_dir = temp_project_dir / "src_tree"
+        dest_dir = temp_project_dir / "dest_tree"
+        src_dir.mkdir()
+        dest_dir.mkdir()
+
+        pairs = []
+        for i in range(num_files):
+            src = src_dir / f"module_{i:05d}.md"
+            src.write_text(f"# Module {i}\n" + "x" * (i % 97))
+            pairs.append((src, dest_dir / src.name))
+
+        detector = MoveDetector(
+            on_move_detected=lambda old, new: None,
+            on_true_delete=lambda path: None,
+            delay=600.0,
+        )
+
+        # Warmup on a throwaway detector instance
+        warmup = MoveDetector(lambda o, n: None, lambda p: None, delay=600.0)
+        warm_src = temp_project_dir / "warm.md"
+        warm_src.write_text("warm")
+        warmup.buffer_delete("warm.md", str(warm_src))
+        warm_dest = dest_dir / "warm.md"
+        warm_src.rename(warm_dest)
+        warmup.match_created_file("dest_tree/warm.md", str(warm_dest))
+        warmup._stopped = True
+        warmup._wake.set()
+
+        start = time.perf_counter()
+        for src, _dest in pairs:
+            detector.buffer_delete(f"src_tree/{src.name}", str(src))
+        buffer_time = time.perf_counter() - start
+
+        for src, dest in pairs:
+            src.rename(dest)
+
+        matched = 0
+        start = time.perf_counter()
+        for _src, dest in reversed(pairs):
+            if detector.match_created_file(f"dest_tree/{dest.name}", str(dest)) is not None:
+                matched += 1
+        match_time = time.perf_counter() - start
+
+        detector._stopped = True
+        detector._wake.set()
+
+        print(f"\nBulk correlation trace ({num_files} files):")
+        print(f"  Buffer deletes: {buffer_time:.3f}s")
+        print(f"  Match creates: {match_time:.3f}s")
+        print(f"  Per create: {match_time / num_files * 1e6:.1f}us")
+        print(f"  Matched: {matched}/{num_files}")
+
+        assert matched == num_files, f"Matched {matched}/{num_files} (expected all)"
+        assert (
+            match_time < 10
+        ), f"Matching {num_files} creates took {match_time:.2f}s (expected <10s)"
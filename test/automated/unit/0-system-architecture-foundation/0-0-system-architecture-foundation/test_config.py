@@ -456,6 +456,12 @@ class TestLinkWatcherConfig:
         issues = config.validate()
         assert any("move_detect_delay must be positive" in issue for issue in issues)
 
+    def test_validate_invalid_move_detect_min_delay(self):
+        """Test validation with invalid move_detect_min_delay."""
+        config = LinkWatcherConfig(move_detect_min_delay=0)
+        issues = config.validate()
+        assert any("move_detect_min_delay must be positive" in issue for issue in issues)
+
     def test_validate_invalid_dir_move_max_timeout(self):
         """Test validation with invalid dir_move_max_timeout."""
         config = LinkWatcherConfig(dir_move_max_timeout=-1)
@@ -468,6 +474,75 @@ class TestLinkWatcherConfig:
         issues = config.validate()
         assert any("dir_move_settle_delay must be positive" in issue for issue in issues)
 
+    def test_validate_invalid_dir_move_worker_threads(self):
+        """Test validation with invalid dir_move_worker_threads."""
+        config = LinkWatcherConfig(dir_move_worker_threads=0)
+        issues = config.validate()
+        assert any("dir_move_worker_threads must be positive" in issue for issue in issues)
+
+    def test_validate_invalid_update_durability(self):
+        """Test validation with an unknown update_durability mode."""
+        config = LinkWatcherConfig(update_durability="paranoid")
+        issues = config.validate()
+        assert any("update_durability must be one of" in issue for issue in issues)
+
+    def test_validate_invalid_python_parser_engine(self):
+        """Test validation with an unknown python_parser_engine."""
+        config = LinkWatcherConfig(python_parser_engine="ast")
+        issues = config.validate()
+        assert any("python_parser_engine must be one of" in issue for issue in issues)
+
+    def test_link_parser_applies_python_parser_engine(self):
+        """Test that LinkParser builds the PythonParser with the configured engine."""
+        from linkwatcher.parser import LinkParser
+
+        parser = LinkParser(LinkWatcherConfig(python_parser_engine="tokenize"))
+        assert parser.parsers[".py"].engine == "tokenize"
+
+    def test_service_applies_update_durability_and_group_commit(self, temp_project_dir):
+        """Test that the service wires durability settings into the updater."""
+        from linkwatcher.service import LinkWatcherService
+
+        config = LinkWatcherConfig(update_durability="strict", update_group_commit=True)
+        service = LinkWatcherService(str(temp_project_dir), config=config)
+        assert service.updater.durability == "strict"
+        assert service.updater.group_commit is True
+
+    def test_service_sets_up_update_journal(self, temp_project_dir):
+        """Test that update_journal_file attaches a journal under the project root."""
+        from linkwatcher.service import LinkWatcherService
+
+        config = LinkWatcherConfig(update_journal_file=".linkwatcher-journal.jsonl")
+        service = LinkWatcherService(str(temp_project_dir), config=config)
+        assert service.updater.journal is not None
+        assert service.updater.journal.path == str(
+            service.project_root / ".linkwatcher-journal.jsonl"
+        )
+        assert service.handler._is_own_output(service.updater.journal.path)
+
+        default_service = LinkWatcherService(str(temp_project_dir))
+        assert default_service.updater.journal is None
+
+    def test_service_opens_dry_run_patch(self, temp_project_dir):
+        """Test that dry_run_patch_file attaches a patch writer in dry-run mode only."""
+        from linkwatcher.service import LinkWatcherService
+
+        config = LinkWatcherConfig(dry_run_mode=True, dry_run_patch_file="moves.patch")
+        service = LinkWatcherService(str(temp_project_dir), config=config)
+        assert service.updater.dry_run_patch.path == str(service.project_root / "moves.patch")
+        assert service.handler._is_own_output(service.updater.dry_run_patch.path)
+
+        live = LinkWatcherConfig(dry_run_patch_file="moves.patch")
+        assert LinkWatcherService(str(temp_project_dir), config=live).updater.dry_run_patch is None
+
+    def test_service_applies_update_worker_threads_to_updater(self, temp_project_dir):
+        """Test that update_worker_threads sizes the updater's file pool."""
+        from linkwatcher.service import LinkWatcherService
+
+        config = LinkWatcherConfig(update_worker_threads=6)
+        service = LinkWatcherService(str(temp_project_dir), config=config)
+        assert service.updater.worker_threads == 6
+
     def test_validate_multiple_issues(self):
         """Test validation with multiple issues."""
         config = LinkWatcherConfig(
@@ -498,6 +573,23 @@ class TestMoveDetectionConfigWiring:
         handler = LinkMaintenanceHandler(db, parser, updater, str(temp_project_dir), config=config)
         assert handler._move_detector._delay == 25.0
 
+    def test_handler_uses_config_move_detect_min_delay(self, temp_project_dir):
+        """Test that handler passes move_detect_min_delay as the adaptive floor."""
+        from linkwatcher.database import LinkDatabase
+        from linkwatcher.handler import LinkMaintenanceHandler
+        from linkwatcher.parser import LinkParser
+        from linkwatcher.updater import LinkUpdater
+
+        config = LinkWatcherConfig(move_detect_delay=8.0, move_detect_min_delay=0.5)
+        db = LinkDatabase()
+        parser = LinkParser()
+        updater = LinkUpdater(str(temp_project_dir))
+        handler = LinkMaintenanceHandler(db, parser, updater, str(temp_project_dir), config=config)
+        stats = handler.get_move_detection_stats()
+        assert stats["min_delay"] == 0.5
+        assert stats["max_delay"] == 8.0
+        assert stats["current_delay"] == 8.0
+
     def test_handler_uses_config_dir_move_timeouts(self, temp_project_dir):
         """Test that handler passes dir move timeouts from config to DirectoryMoveDetector."""
         from linkwatcher.database import LinkDatabase
@@ -505,13 +597,17 @@ class TestMoveDetectionConfigWiring:
         from linkwatcher.parser import LinkParser
         from linkwatcher.updater import LinkUpdater
 
-        config = LinkWatcherConfig(dir_move_max_timeout=120.0, dir_move_settle_delay=2.0)
+        config = LinkWatcherConfig(
+            dir_move_max_timeout=120.0, dir_move_settle_delay=2.0, dir_move_worker_threads=2
+        )
         db = LinkDatabase()
         parser = LinkParser()
         updater = LinkUpdater(str(temp_project_dir))
         handler = LinkMaintenanceHandler(db, parser, updater, str(temp_project_dir), config=config)
         assert handler._dir_move_detector._max_timeout == 120.0
         assert handler._dir_move_detector._settle_delay == 2.0
+        assert handler._dir_move_detector._pool._max_workers == 2
+        handler.stop()
 
     def test_handler_uses_defaults_without_config(self, temp_project_dir):
         """Test that handler uses DEFAULT_CONFIG values when no config provided."""
@@ -734,7 +830,7 @@ class TestConfigurationIntegration:
         """Test loading partial configuration (not all fields specified)."""
         partial_config_data = {
             "monitored_extensions": [".md", ".txt"],
-            "log_level": "WARNING"
+            "log_level": "WARNING",
             # Other fields should use defaults
         }
 
@@ -988,6 +988,34 @@ class TestGetSourceFiles:
         assert "injected.md" not in link_database.get_source_files()
 
 
+class TestSourceSignatures:
+    """Tests for the parse-time (mtime_ns, size) signatures per source file."""
+
+    def test_signature_follows_source_lifecycle(self, link_database):
+        ref = LinkReference("docs/a.md", 1, 0, 10, "t.txt", "t.txt", "markdown")
+        link_database.add_link(ref)
+        link_database.set_source_signature("docs\\a.md", (123, 45))
+
+        assert link_database.get_source_signature("docs/a.md") == (123, 45)
+
+        link_database.update_source_path("docs/a.md", "guide/a.md")
+        assert link_database.get_source_signature("docs/a.md") is None
+        assert link_database.get_source_signature("guide/a.md") == (123, 45)
+
+        link_database.remove_file_links("guide/a.md")
+        assert link_database.get_source_signature("guide/a.md") is None
+
+    def test_none_forgets_and_clear_drops_all(self, link_database):
+        link_database.set_source_signature("a.md", (1, 2))
+        link_database.set_source_signature("b.md", (3, 4))
+
+        link_database.set_source_signature("a.md", None)
+        assert link_database.get_source_signature("a.md") is None
+
+        link_database.clear()
+        assert link_database.get_source_signature("b.md") is None
+
+
 class TestReplacePathPart:
     """Tests for _replace_path_part segment-boundary logic (TD179)."""
 
@@ -73,6 +73,7 @@ class TestLinkWatcherService:
         assert "project_root" in status
         assert "database_stats" in status
         assert "handler_stats" in status
+        assert "move_detection_stats" in status
         assert "last_scan" in status
 
         assert status["running"] is False
@@ -115,6 +116,20 @@ class TestLinkWatcherService:
         service.set_dry_run(False)
         assert service.updater.dry_run is False
 
+    def test_set_dry_run_with_patch_file(self, temp_project_dir):
+        """set_dry_run(True, patch_file) streams planned rewrites to a patch."""
+        service = LinkWatcherService(str(temp_project_dir))
+
+        service.set_dry_run(True, patch_file="moves.patch")
+        patch = service.updater.dry_run_patch
+        assert patch.path == str(service.project_root / "moves.patch")
+
+        # Disabling dry run closes the patch and detaches it
+        service.set_dry_run(False, patch_file="ignored.patch")
+        assert service.updater.dry_run_patch is None
+        assert patch._file.closed
+        assert not (service.project_root / "ignored.patch").exists()
+
     def test_init_applies_config_dry_run_mode(self, temp_project_dir):
         """Service constructor must propagate config.dry_run_mode to the updater (TD235)."""
         config = LinkWatcherConfig(dry_run_mode=True)
@@ -248,6 +263,18 @@ class TestLinkWatcherService:
         service._signal_handler(signal.SIGINT, None)
         assert service.running is False
 
+    def test_stop_shuts_down_directory_move_detector(self, temp_project_dir):
+        """Test that stop() releases the directory move detector's threads."""
+        service = LinkWatcherService(str(temp_project_dir), register_signals=False)
+        detector = service.handler._dir_move_detector
+
+        service.running = True
+        service.stop()
+
+        detector._scheduler.join(timeout=2.0)
+        assert not detector._scheduler.is_alive()
+        assert detector._pool._shutdown
+
     def test_signal_handler_skipped_when_disabled(self, temp_project_dir):
         """Test that signal handlers are not registered when register_signals=False."""
         import signal
@@ -713,3 +740,64 @@ class TestOwnOutputScanExclusion:
             "log history"
         )
         assert "readme.md" in sources, "sanity: normal project files must still be scanned"
+
+
+class TestPlanMove:
+    """Tests for plan_move()/plan_moves() — what-if move simulation."""
+
+    def _project(self, root):
+        (root / "docs").mkdir()
+        (root / "docs" / "guide.md").write_text("# Guide\n")
+        (root / "docs" / "api.md").write_text("# API\n")
+        (root / "README.md").write_text(
+            "See [guide](docs/guide.md) and [api](docs/api.md).\n\nAll docs: [docs](docs/).\n"
+        )
+        (root / "notes.md").write_text("Back to [guide](docs/guide.md).\n")
+        service = LinkWatcherService(str(root))
+        service._initial_scan()
+        return service
+
+    def _snapshot(self, root):
+        return {p: p.read_bytes() for p in root.rglob("*") if p.is_file()}
+
+    def test_plan_file_move_touches_nothing(self, temp_project_dir):
+        service = self._project(temp_project_dir)
+        before = self._snapshot(temp_project_dir)
+
+        plan = service.plan_move("docs/guide.md", "manual/guide.md")
+
+        assert [(e.file_path, e.old_target, e.new_target) for e in plan] == [
+            ("README.md", "docs/guide.md", "manual/guide.md"),
+            ("notes.md", "docs/guide.md", "manual/guide.md"),
+        ]
+        assert all(e.moved_path == "docs/guide.md" for e in plan)
+        assert self._snapshot(temp_project_dir) == before
+
+    def test_plan_directory_move_includes_files_and_directory_links(self, temp_project_dir):
+        service = self._project(temp_project_dir)
+
+        plan = service.plan_move(str(temp_project_dir / "docs"), "manual")
+
+        readme = [(e.old_target, e.new_target) for e in plan if e.file_path == "README.md"]
+        assert readme == [
+            ("docs/guide.md", "manual/guide.md"),
+            ("docs/api.md", "manual/api.md"),
+            ("docs/", "manual/"),
+        ]
+        assert (temp_project_dir / "docs" / "guide.md").exists()
+
+    def test_batch_planning_reuses_lookups(self, temp_project_dir):
+        service = self._project(temp_project_dir)
+        lookup = service.handler._ref_lookup
+
+        with patch.object(
+            lookup, "collect_directory_file_refs", wraps=lookup.collect_directory_file_refs
+        ) as collect:
+            plan = service.plan_moves(
+                [("docs/guide.md", "a/guide.md"), ("docs", "b"), ("docs/api.md", "c/api.md")]
+            )
+
+        assert collect.call_count == 2  # docs/guide.md and docs/api.md, once each
+        # The first move of a reference wins when moves overlap
+        notes = [e for e in plan if e.file_path == "notes.md"]
+        assert [e.new_target for e in notes] == ["a/guide.md"]
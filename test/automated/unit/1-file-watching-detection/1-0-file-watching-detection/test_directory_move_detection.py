@@ -13,7 +13,9 @@ because the stale detection compared slash-notation link_target against
 dot-notation line content.
 """
 
+import os
 import shutil
+import threading
 import time
 
 import pytest
@@ -390,10 +392,6 @@ class TestDirectoryDeleteBuffering:
             "docs/api.md" in f for f in pending.unmatched
         ), f"docs/api.md should be in unmatched, got: {pending.unmatched}"
 
-        # Clean up timer to avoid test warnings
-        if pending.max_timer:
-            pending.max_timer.cancel()
-
     def test_directory_delete_creates_pending_dir_move(self, setup):
         """PendingDirMove tracks correct metadata."""
         handler, link_db, tmp_path, docs_dir = setup
@@ -407,10 +405,6 @@ class TestDirectoryDeleteBuffering:
         assert pending.matched_count == 0
         assert pending.total_expected == len(pending.unmatched)
 
-        # Clean up timer
-        if pending.max_timer:
-            pending.max_timer.cancel()
-
     def test_empty_directory_no_directory_buffering(self, setup):
         """Directory with no known files is NOT routed to _handle_directory_deleted.
 
@@ -465,10 +459,6 @@ class TestDirectoryDeleteBuffering:
                 "/"
             ), f"rel_within_dir should not start with '/', got: {repr(rel_within)} for {known_file}"
 
-        # Clean up timer
-        if pending.max_timer:
-            pending.max_timer.cancel()
-
     def test_single_file_delete_not_treated_as_directory(self, setup):
         """Regression: single file delete must NOT trigger directory move detection.
 
@@ -1463,3 +1453,244 @@ class TestDirectoryMovePhase15CounterPropagation:
             f"Expected handler.stats['links_updated'] == 1 (single Phase 1.5 "
             f"update, no double-counting), got {stats.get('links_updated')}"
         )
+
+
+class TestDirectoryMovePhase15ParallelRewrite:
+    """Phase 1.5 rewrites run on a bounded thread pool (update_worker_threads).
+
+    Each moved file is rewritten independently; counts are aggregated and a
+    failure in one file must not abort the rewrites of the others.
+    """
+
+    def _setup_moved_docs(self, tmp_path, file_count):
+        (tmp_path / "external.md").write_text("# External\n")
+        src_dir = tmp_path / "docs"
+        src_dir.mkdir()
+        for i in range(file_count):
+            (src_dir / f"inner{i}.md").write_text(f"# Inner {i}\n\nSee [ext](../external.md).\n")
+        return src_dir
+
+    def _move_docs(self, tmp_path, service, src_dir):
+        sub_dir = tmp_path / "sub"
+        sub_dir.mkdir()
+        new_docs = sub_dir / "docs"
+        src_dir.rename(new_docs)
+        service.handler.on_moved(DirMovedEvent(str(src_dir), str(new_docs)))
+        return new_docs
+
+    def test_all_moved_files_rewritten_and_counts_aggregated(self, tmp_path):
+        from linkwatcher.config import LinkWatcherConfig
+
+        src_dir = self._setup_moved_docs(tmp_path, 12)
+        service = LinkWatcherService(
+            str(tmp_path), config=LinkWatcherConfig(update_worker_threads=4)
+        )
+        service._initial_scan()
+
+        new_docs = self._move_docs(tmp_path, service, src_dir)
+
+        for i in range(12):
+            content = (new_docs / f"inner{i}.md").read_text()
+            assert "../../external.md" in content
+        stats = service.handler.get_stats()
+        assert stats["links_updated"] == 12
+        assert stats["errors"] == 0
+
+    def test_rewrites_are_journaled_as_one_batch(self, tmp_path):
+        from unittest.mock import patch
+
+        from linkwatcher.config import LinkWatcherConfig
+
+        src_dir = self._setup_moved_docs(tmp_path, 6)
+        service = LinkWatcherService(
+            str(tmp_path),
+            config=LinkWatcherConfig(update_worker_threads=3, update_journal_file="journal.jsonl"),
+        )
+        service._initial_scan()
+        journal = service.updater.journal
+
+        with patch.object(journal, "begin", wraps=journal.begin) as begin:
+            new_docs = self._move_docs(tmp_path, service, src_dir)
+
+        phase_1_5 = [
+            entries
+            for (entries,), _ in begin.call_args_list
+            if all("inner" in entry["path"] for entry in entries)
+        ]
+        assert len(phase_1_5) == 1
+        assert sorted(os.path.basename(entry["path"]) for entry in phase_1_5[0]) == [
+            f"inner{i}.md" for i in range(6)
+        ]
+        for i in range(6):
+            assert "../../external.md" in (new_docs / f"inner{i}.md").read_text()
+        assert not list(new_docs.glob("tmp*"))
+        assert service.handler.get_stats()["links_updated"] == 6
+
+    def test_uncommitted_rewrite_counts_as_error(self, tmp_path):
+        from unittest.mock import patch
+
+        from linkwatcher.config import LinkWatcherConfig
+
+        src_dir = self._setup_moved_docs(tmp_path, 4)
+        service = LinkWatcherService(
+            str(tmp_path),
+            config=LinkWatcherConfig(update_worker_threads=2, update_group_commit=True),
+        )
+        service._initial_scan()
+        real_replace = os.replace
+
+        def flaky_replace(src, dst):
+            if str(dst).endswith("inner2.md"):
+                raise PermissionError("locked")
+            return real_replace(src, dst)
+
+        with patch("linkwatcher.updater.os.replace", side_effect=flaky_replace):
+            new_docs = self._move_docs(tmp_path, service, src_dir)
+
+        assert "](../external.md)" in (new_docs / "inner2.md").read_text()
+        stats = service.handler.get_stats()
+        assert stats["links_updated"] == 3
+        assert stats["errors"] == 1
+
+    def test_failure_in_one_file_does_not_abort_others(self, tmp_path):
+        from unittest.mock import patch
+
+        from linkwatcher.config import LinkWatcherConfig
+
+        src_dir = self._setup_moved_docs(tmp_path, 6)
+        service = LinkWatcherService(
+            str(tmp_path), config=LinkWatcherConfig(update_worker_threads=3)
+        )
+        service._initial_scan()
+
+        ref_lookup = service.handler._ref_lookup
+        original = ref_lookup.update_links_within_moved_file
+
+        def flaky(old_path, new_path, abs_new_path, write_batch=None):
+            if new_path.endswith("inner3.md"):
+                raise RuntimeError("simulated rewrite failure")
+            return original(old_path, new_path, abs_new_path, write_batch=write_batch)
+
+        with patch.object(ref_lookup, "update_links_within_moved_file", side_effect=flaky):
+            new_docs = self._move_docs(tmp_path, service, src_dir)
+
+        for i in range(6):
+            content = (new_docs / f"inner{i}.md").read_text()
+            expected = "../external.md" if i == 3 else "../../external.md"
+            assert f"]({expected})" in content
+        stats = service.handler.get_stats()
+        assert stats["links_updated"] == 5
+        assert stats["errors"] == 1
+
+
+class TestDirectoryMoveScheduler:
+    """Deadlines run on one scheduler thread and processing on a bounded pool.
+
+    Many concurrent pending directory moves must not spawn a timer or
+    processing thread per directory, while keeping the all-matched,
+    settle and max-timeout completion paths.
+    """
+
+    def _make_detector(self, tmp_path, **kwargs):
+        from unittest.mock import MagicMock
+
+        from linkwatcher.dir_move_detector import DirectoryMoveDetector
+
+        moves = []
+        deletes = []
+        lock = threading.Lock()
+
+        def on_dir_move(old_dir, new_dir):
+            with lock:
+                moves.append((old_dir, new_dir))
+
+        def on_true_file_delete(file_path):
+            with lock:
+                deletes.append(file_path)
+
+        detector = DirectoryMoveDetector(
+            link_db=MagicMock(),
+            project_root=str(tmp_path),
+            on_dir_move=on_dir_move,
+            on_true_file_delete=on_true_file_delete,
+            **kwargs,
+        )
+        # Basenames are unique per directory so first-match inference is
+        # unambiguous across the pending directories.
+        detector.get_files_under_directory = lambda d: {
+            f"{d}/{os.path.basename(d)}-{name}" for name in ("a.md", "b.md")
+        }
+        return detector, moves, deletes
+
+    def test_thousand_pending_moves_use_bounded_threads(self, tmp_path):
+        # max_timeout is long enough that only the all-matched and settle
+        # paths complete these moves; the timeout path is covered below.
+        detector, moves, deletes = self._make_detector(
+            tmp_path, max_timeout=120.0, settle_delay=0.3, max_workers=4
+        )
+        threads_before = threading.active_count()
+
+        for i in range(1000):
+            assert detector.handle_directory_deleted(f"old/d{i}")
+        assert len(detector.pending_dir_moves) == 1000
+
+        # Even: all files matched (immediate); odd: one match (settle)
+        for i in range(1000):
+            assert detector.match_created_file(f"new/d{i}/d{i}-a.md", "")
+            if i % 2 == 0:
+                assert detector.match_created_file(f"new/d{i}/d{i}-b.md", "")
+
+        peak_threads = threading.active_count()
+        deadline = time.time() + 30.0
+        while (len(moves) < 1000 or len(deletes) < 500) and time.time() < deadline:
+            peak_threads = max(peak_threads, threading.active_count())
+            time.sleep(0.05)
+        detector.stop()
+
+        assert not detector.pending_dir_moves
+        assert peak_threads - threads_before <= 4
+        assert len(moves) == 1000
+        assert set(moves) == {(f"old/d{i}", f"new/d{i}") for i in range(1000)}
+        # Settled moves resolve their unmatched b.md (gone from disk) as a
+        # true delete.
+        assert sorted(deletes) == sorted(f"old/d{i}/d{i}-b.md" for i in range(1, 1000, 2))
+
+    def test_max_timeout_without_match_is_true_delete(self, tmp_path):
+        detector, moves, deletes = self._make_detector(
+            tmp_path, max_timeout=0.3, settle_delay=0.3, max_workers=2
+        )
+
+        for i in range(50):
+            detector.handle_directory_deleted(f"old/d{i}")
+
+        deadline = time.time() + 10.0
+        while len(deletes) < 100 and time.time() < deadline:
+            time.sleep(0.05)
+        detector.stop()
+
+        assert moves == []
+        assert not detector.pending_dir_moves
+        assert sorted(deletes) == sorted(
+            f"old/d{i}/d{i}-{name}" for i in range(50) for name in ("a.md", "b.md")
+        )
+
+    def test_settle_deadline_pushed_back_by_later_matches(self, tmp_path):
+        detector, moves, deletes = self._make_detector(tmp_path, max_timeout=30.0, settle_delay=0.5)
+        detector.get_files_under_directory = lambda d: {"old/a.md", "old/b.md", "old/c.md"}
+
+        detector.handle_directory_deleted("old")
+        assert detector.match_created_file("new/a.md", "")
+        time.sleep(0.3)
+        assert detector.match_created_file("new/b.md", "")
+        time.sleep(0.3)
+        # 0.6s after the first match but only 0.3s after the last one
+        assert moves == []
+        assert "old" in detector.pending_dir_moves
+
+        deadline = time.time() + 5.0
+        while not moves and time.time() < deadline:
+            time.sleep(0.05)
+        detector.stop()
+
+        assert moves == [("old", "new")]
+        assert deletes == ["old/c.md"]
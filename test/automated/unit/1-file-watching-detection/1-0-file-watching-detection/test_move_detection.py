@@ -7,6 +7,7 @@ detected from paired delete+create events and that references are updated.
 """
 
 import threading
+import time
 from unittest.mock import patch
 
 import pytest
@@ -690,7 +691,7 @@ class TestIgnoredDirectoryEventBoundary:
         reference target — the exact condition that re-armed PD-BUG-105."""
         handler = project_setup["handler"]
         inside_target = project_setup["inside_target"]
-        assert handler._is_known_reference_target(str(inside_target)), (
+        assert handler.is_known_reference_target(str(inside_target)), (
             "Precondition failed: the file inside the ignored zone must be a "
             "known reference target (referenced by audits/report.md) for these "
             "regression tests to exercise the PD-BUG-046 bypass"
@@ -1351,3 +1352,251 @@ class TestNormalConditionLogLevels:
 
         assert "directory_deleted" not in warned
         assert "directory_deleted" in informed
+
+
+class TestMoveDetectorMatchIndex:
+    """MoveDetector indexes pending deletes by (basename, size) so a create
+    only inspects same-name candidates instead of scanning every pending delete."""
+
+    @pytest.fixture
+    def detector(self):
+        from linkwatcher.move_detector import MoveDetector
+
+        det = MoveDetector(on_move_detected=lambda o, n: None, on_true_delete=lambda p: None)
+        yield det
+        det._stopped = True
+        det._wake.set()
+
+    def test_exact_size_preferred_over_unknown_size(self, detector, tmp_path):
+        # Unknown size (file already gone at delete time) buffered first
+        detector.buffer_delete("a/notes.txt", str(tmp_path / "a" / "notes.txt"))
+        sized = tmp_path / "b" / "notes.txt"
+        sized.parent.mkdir()
+        sized.write_text("12345")
+        detector.buffer_delete("b/notes.txt", str(sized))
+        sized.unlink()
+
+        created = tmp_path / "c" / "notes.txt"
+        created.parent.mkdir()
+        created.write_text("abcde")
+
+        assert detector.match_created_file("c/notes.txt", str(created)) == "b/notes.txt"
+        assert detector.match_created_file("c/notes.txt", str(created)) == "a/notes.txt"
+
+    def test_size_mismatch_not_matched(self, detector, tmp_path):
+        old = tmp_path / "old.txt"
+        old.write_text("short")
+        detector.buffer_delete("old.txt", str(old))
+        old.unlink()
+
+        created = tmp_path / "sub" / "old.txt"
+        created.parent.mkdir()
+        created.write_text("a much longer body")
+
+        assert detector.match_created_file("sub/old.txt", str(created)) is None
+        assert "old.txt" in detector._pending
+
+    def test_index_emptied_after_match_and_rebuffer(self, detector, tmp_path):
+        detector.buffer_delete("x/file.md", str(tmp_path / "x" / "file.md"))
+        detector.buffer_delete("x/file.md", str(tmp_path / "x" / "file.md"))
+        created = tmp_path / "file.md"
+        created.write_text("")
+
+        assert detector.match_created_file("file.md", str(created)) == "x/file.md"
+        assert detector._pending == {}
+        assert detector._by_name == {}
+
+
+class TestFingerprintRenameDetection:
+    """A delete+create pair with different basenames but identical content
+    (a rename such as guide.md -> user-guide.md) is correlated through the
+    content fingerprint index instead of breaking every link."""
+
+    @pytest.fixture
+    def detector(self):
+        from linkwatcher.move_detector import MoveDetector
+
+        det = MoveDetector(on_move_detected=lambda o, n: None, on_true_delete=lambda p: None)
+        yield det
+        det._stopped = True
+        det._wake.set()
+
+    def _rename(self, tmp_path, detector, old_name, new_name):
+        old = tmp_path / old_name
+        detector.buffer_delete(old_name, str(old))
+        new = tmp_path / new_name
+        old.rename(new)
+        return detector.match_created_file(new_name, str(new))
+
+    def test_rename_matched_by_fingerprint(self, detector, tmp_path):
+        guide = tmp_path / "guide.md"
+        guide.write_text("# Guide\n\nUnique body " + "x" * 10000)
+        detector.remember_fingerprint("guide.md", str(guide))
+
+        assert self._rename(tmp_path, detector, "guide.md", "user-guide.md") == "guide.md"
+        assert detector._by_fingerprint == {}
+
+    def test_rename_without_fingerprint_not_matched(self, detector, tmp_path):
+        (tmp_path / "guide.md").write_text("# Guide\n")
+
+        assert self._rename(tmp_path, detector, "guide.md", "user-guide.md") is None
+
+    def test_duplicate_content_is_ambiguous(self, detector, tmp_path):
+        for name in ("guide.md", "copy.md"):
+            (tmp_path / name).write_text("# Same content\n")
+            detector.remember_fingerprint(name, str(tmp_path / name))
+
+        assert self._rename(tmp_path, detector, "guide.md", "user-guide.md") is None
+
+    def test_rename_over_known_file_drops_its_fingerprint(self, detector, tmp_path):
+        for name, body in (("draft.md", "# Draft\n"), ("guide.md", "# Guide\n")):
+            (tmp_path / name).write_text(body)
+            detector.remember_fingerprint(name, str(tmp_path / name))
+        replaced = detector._fingerprints["guide.md"]
+
+        detector.rename_fingerprint("draft.md", "guide.md")
+
+        assert list(detector._fingerprints) == ["guide.md"]
+        assert replaced not in detector._fingerprint_counts
+        assert sum(detector._fingerprint_counts.values()) == 1
+
+    def test_disabled_fingerprints_skip_index(self, tmp_path):
+        from linkwatcher.move_detector import MoveDetector
+
+        det = MoveDetector(lambda o, n: None, lambda p: None, fingerprints=False)
+        try:
+            guide = tmp_path / "guide.md"
+            guide.write_text("# Guide\n")
+            det.remember_fingerprint("guide.md", str(guide))
+            assert det._fingerprints == {}
+            assert self._rename(tmp_path, det, "guide.md", "user-guide.md") is None
+        finally:
+            det._stopped = True
+            det._wake.set()
+
+    def test_renamed_file_references_updated(self, tmp_path):
+        from linkwatcher.service import LinkWatcherService
+
+        (tmp_path / "guide.md").write_text("# Guide\n\nHow to use the tool.\n")
+        index = tmp_path / "index.md"
+        index.write_text("# Index\n\nRead the [guide](guide.md).\n")
+
+        service = LinkWatcherService(str(tmp_path))
+        service._initial_scan()
+        handler = service.handler
+
+        (tmp_path / "guide.md").rename(tmp_path / "user-guide.md")
+        handler.on_deleted(FileDeletedEvent(str(tmp_path / "guide.md")))
+        handler.on_created(FileCreatedEvent(str(tmp_path / "user-guide.md")))
+
+        assert "[guide](user-guide.md)" in index.read_text()
+        assert handler.get_stats()["files_moved"] == 1
+
+
+class TestAdaptiveMoveDetectDelay:
+    """The expiry window adapts to the observed delete->create latency,
+    bounded by min_delay and the configured delay (maximum)."""
+
+    def _stop(self, det):
+        det._stopped = True
+        det._wake.set()
+
+    def test_window_shrinks_to_min_after_fast_matches(self, tmp_path):
+        from linkwatcher.move_detector import ADAPTIVE_MIN_SAMPLES, MoveDetector
+
+        det = MoveDetector(lambda o, n: None, lambda p: None, delay=10.0, min_delay=0.5)
+        try:
+            (tmp_path / "dest").mkdir()
+            for i in range(ADAPTIVE_MIN_SAMPLES):
+                src = tmp_path / f"f{i}.txt"
+                src.write_text("content")
+                det.buffer_delete(src.name, str(src))
+                src.rename(tmp_path / "dest" / src.name)
+                assert det.match_created_file(f"dest/{src.name}", str(tmp_path / "dest" / src.name))
+
+            stats = det.get_stats()
+            assert stats["current_delay"] == 0.5
+            assert stats["matches"] == ADAPTIVE_MIN_SAMPLES
+            assert stats["hit_rate"] == 1.0
+            assert stats["latency_p99_ms"] is not None
+
+            det.buffer_delete("late.txt", str(tmp_path / "late.txt"))
+            timestamp, *_rest, expiry = det._pending["late.txt"]
+            assert expiry == pytest.approx(timestamp + 0.5)
+        finally:
+            self._stop(det)
+
+    def test_late_match_grows_the_window_back(self, tmp_path):
+        """A create pairing with a delete that expired too early widens the
+        window, which then holds until ADAPTIVE_MIN_SAMPLES new matches."""
+        from linkwatcher.move_detector import ADAPTIVE_MIN_SAMPLES, MoveDetector
+
+        expired = threading.Event()
+        det = MoveDetector(lambda o, n: None, lambda p: expired.set(), delay=10.0, min_delay=0.05)
+        dest = tmp_path / "dest"
+        dest.mkdir()
+
+        def fast_move(name):
+            src = tmp_path / name
+            src.write_text("content")
+            det.buffer_delete(name, str(src))
+            src.rename(dest / name)
+            assert det.match_created_file(f"dest/{name}", str(dest / name))
+
+        try:
+            for i in range(ADAPTIVE_MIN_SAMPLES):
+                fast_move(f"f{i}.txt")
+            # Near the floor; a loaded machine can add a few ms of latency.
+            assert det.get_stats()["current_delay"] < 0.15
+
+            slow = tmp_path / "slow.txt"
+            slow.write_text("slow move")
+            det.buffer_delete("slow.txt", str(slow))
+            slow.unlink()
+            assert expired.wait(timeout=5)
+            time.sleep(0.1)
+            (dest / "slow.txt").write_text("slow move")
+
+            assert det.match_created_file("dest/slow.txt", str(dest / "slow.txt")) is None
+
+            stats = det.get_stats()
+            assert stats["late_matches"] == 1
+            grown = stats["current_delay"]
+            assert grown >= 0.3
+            for i in range(ADAPTIVE_MIN_SAMPLES - 1):
+                fast_move(f"g{i}.txt")
+            assert det.get_stats()["current_delay"] == grown
+        finally:
+            self._stop(det)
+
+    def test_no_adaptation_without_min_delay(self, tmp_path):
+        from linkwatcher.move_detector import ADAPTIVE_MIN_SAMPLES, MoveDetector
+
+        det = MoveDetector(lambda o, n: None, lambda p: None, delay=10.0)
+        try:
+            for i in range(ADAPTIVE_MIN_SAMPLES):
+                det.buffer_delete(f"a{i}.md", str(tmp_path / f"a{i}.md"))
+                created = tmp_path / "sub" / f"a{i}.md"
+                created.parent.mkdir(exist_ok=True)
+                created.write_text("")
+                det.match_created_file(f"sub/a{i}.md", str(created))
+
+            assert det.get_stats()["current_delay"] == 10.0
+        finally:
+            self._stop(det)
+
+    def test_true_deletes_counted_in_hit_rate(self, tmp_path):
+        from linkwatcher.move_detector import MoveDetector
+
+        expired = threading.Event()
+        det = MoveDetector(lambda o, n: None, lambda p: expired.set(), delay=0.1)
+        try:
+            det.buffer_delete("gone.md", str(tmp_path / "gone.md"))
+            assert expired.wait(timeout=5)
+
+            stats = det.get_stats()
+            assert stats["true_deletes"] == 1
+            assert stats["matches"] == 0
+            assert stats["hit_rate"] == 0.0
+        finally:
+            self._stop(det)
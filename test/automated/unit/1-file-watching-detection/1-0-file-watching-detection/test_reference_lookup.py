@@ -17,6 +17,7 @@ import pytest
 
 from linkwatcher.models import LinkReference
 from linkwatcher.reference_lookup import ReferenceLookup
+from linkwatcher.updater import LinkUpdater
 
 pytestmark = [
     pytest.mark.feature("1.1.1"),
@@ -35,6 +36,8 @@ def mock_db():
     db = MagicMock()
     db.get_references_to_file.return_value = []
     db.get_references_to_directory.return_value = []
+    # No recorded parse-time signatures: refresh_changed_sources() trusts refs.
+    db.get_source_signature.return_value = None
     return db
 
 
@@ -280,6 +283,51 @@ class TestRetryStaleReferences:
         # Should not raise — just logs warning
 
 
+class TestRefreshChangedSources:
+    """Tests for refresh_changed_sources() — upfront stale detection."""
+
+    @pytest.fixture
+    def real_lookup(self, temp_dir):
+        from linkwatcher.database import LinkDatabase
+        from linkwatcher.parser import LinkParser
+        from linkwatcher.updater import LinkUpdater
+
+        updater = LinkUpdater(str(temp_dir))
+        updater.set_backup_enabled(False)
+        return ReferenceLookup(LinkDatabase(), LinkParser(), updater, str(temp_dir))
+
+    def _index(self, lookup, temp_dir, name, content):
+        path = temp_dir / name
+        path.write_text(content)
+        lookup.rescan_file_links(str(path))
+        return path
+
+    def test_unchanged_sources_are_passed_through(self, real_lookup, temp_dir):
+        self._index(real_lookup, temp_dir, "a.md", "See [x](old.md).\n")
+        refs = real_lookup.find_references("old.md")
+        groups = [(refs, "old.md", "new.md")]
+
+        with patch.object(real_lookup, "rescan_file_links") as rescan:
+            assert real_lookup.refresh_changed_sources(groups) is groups
+        rescan.assert_not_called()
+
+    def test_changed_source_is_reparsed_before_update(self, real_lookup, temp_dir):
+        edited = self._index(real_lookup, temp_dir, "edited.md", "See [x](old.md).\n")
+        self._index(real_lookup, temp_dir, "same.md", "See [y](old.md).\n")
+        refs = real_lookup.find_references("old.md")
+        # Edit after indexing: the link moves down two lines
+        edited.write_text("# Added heading\n\nSee [x](old.md).\n")
+
+        groups = real_lookup.refresh_changed_sources([(refs, "old.md", "new.md")])
+
+        fresh = {r.file_path: r.line_number for r in groups[0][0]}
+        assert fresh == {"edited.md": 3, "same.md": 1}
+        stats = real_lookup.updater.update_references(groups[0][0], "old.md", "new.md")
+        assert stats["stale_files"] == []
+        assert stats["files_updated"] == 2
+        assert "[x](new.md)" in edited.read_text()
+
+
 # ---------------------------------------------------------------------------
 # Database Cleanup After File Move
 # ---------------------------------------------------------------------------
@@ -365,6 +413,14 @@ class TestRescanFileLinks:
         lookup.rescan_file_links(abs_path, remove_existing=False)
         mock_db.remove_file_links.assert_not_called()
 
+    def test_incremental_rescan_uses_reparse_file(self, lookup, mock_db, mock_parser, temp_dir):
+        """Edits in place re-parse through LinkParser.reparse_file()."""
+        mock_parser.reparse_file.return_value = []
+        abs_path = str(temp_dir / "test.md")
+        lookup.rescan_file_links(abs_path, incremental=True)
+        mock_parser.reparse_file.assert_called_once_with(abs_path)
+        mock_parser.parse_file.assert_not_called()
+
     def test_rescan_error_handled_gracefully(self, lookup, mock_parser, temp_dir):
         """Parse errors are caught and logged, not raised."""
         mock_parser.parse_file.side_effect = Exception("parse error")
@@ -662,6 +718,14 @@ class TestBug120TrailingSeparatorPreserved:
 class TestUpdateLinksWithinMovedFile:
     """Tests for update_links_within_moved_file() — content rewriting."""
 
+    @pytest.fixture(autouse=True)
+    def writer(self, mock_updater, temp_dir):
+        """Route the mock updater's write_file() to a real LinkUpdater."""
+        writer = LinkUpdater(str(temp_dir))
+        writer.set_backup_enabled(False)
+        mock_updater.write_file.side_effect = writer.write_file
+        return writer
+
     def test_same_directory_skips_update(self, lookup, mock_parser, temp_dir):
         """File moved within same directory skips link updates."""
         f = temp_dir / "file.md"
@@ -769,8 +833,9 @@ class TestUpdateLinksWithinMovedFile:
         )
         assert result == 0
 
-    def test_backup_created_when_enabled(self, lookup, mock_parser, temp_dir):
-        """Backup file is created when backup_enabled=True and links are updated."""
+    def test_backup_created_when_enabled(self, lookup, mock_parser, writer, temp_dir):
+        """Backup file is created when the updater has backups enabled."""
+        writer.set_backup_enabled(True)
         f = temp_dir / "file.md"
         f.write_text("# Test\n\n[link](../shared/data.md)\n")
 
@@ -789,13 +854,33 @@ class TestUpdateLinksWithinMovedFile:
         )
         mock_parser.parse_content.return_value = [ref]
 
-        lookup.update_links_within_moved_file(
-            "src/file.md", "src/deep/file.md", str(f), backup_enabled=True
-        )
+        lookup.update_links_within_moved_file("src/file.md", "src/deep/file.md", str(f))
 
         backup_path = Path(str(f) + ".bak")
         assert backup_path.exists()
 
+    def test_write_goes_through_updater_journal_and_durability(
+        self, lookup, mock_parser, writer, temp_dir
+    ):
+        """The rewrite uses the updater's write path: journaled, fsynced."""
+        from linkwatcher.update_journal import UpdateJournal
+
+        f, original = self._redepth_scenario(mock_parser, temp_dir)
+        journal = UpdateJournal(str(temp_dir / "journal.jsonl"))
+        writer.set_journal(journal)
+        writer.durability = "strict"
+
+        with patch.object(journal, "begin", wraps=journal.begin) as begin, patch(
+            "linkwatcher.updater.os.fsync", wraps=os.fsync
+        ) as fsync:
+            lookup.update_links_within_moved_file("src/file.md", "src/deep/file.md", str(f))
+
+        (entries,) = begin.call_args[0]
+        assert [entry["path"] for entry in entries] == [str(f)]
+        assert fsync.call_count >= 2  # temp file + directory
+        assert "../../shared/data.md" in f.read_text()
+        assert not list(temp_dir.glob("tmp*"))
+
     def _redepth_scenario(self, mock_parser, temp_dir):
         """Set up the standard re-depth scenario: file.md links to ../shared/data.md."""
         f = temp_dir / "file.md"
@@ -823,15 +908,25 @@ class TestUpdateLinksWithinMovedFile:
         mock_updater.dry_run = True
         f, original = self._redepth_scenario(mock_parser, temp_dir)
 
-        lookup.update_links_within_moved_file(
-            "src/file.md", "src/deep/file.md", str(f), backup_enabled=True
-        )
+        lookup.update_links_within_moved_file("src/file.md", "src/deep/file.md", str(f))
 
         content = f.read_text()
         assert content == original
         assert "../../shared/data.md" not in content
         assert not Path(str(f) + ".bak").exists()
 
+    def test_dry_run_records_patch(self, lookup, mock_parser, mock_updater, temp_dir):
+        """Dry-run hands the previewed rewrite to the updater's dry-run patch."""
+        mock_updater.dry_run = True
+        f, original = self._redepth_scenario(mock_parser, temp_dir)
+
+        lookup.update_links_within_moved_file("src/file.md", "src/deep/file.md", str(f))
+
+        abs_path, before, after = mock_updater.record_dry_run_patch.call_args[0]
+        assert abs_path == str(f)
+        assert before == original
+        assert "../../shared/data.md" in after
+
     def test_dry_run_rescans_original_content(self, lookup, mock_parser, mock_updater, temp_dir):
         """In dry-run the DB rescan must index the on-disk (original) content,
         not the previewed rewrite (PD-BUG-116)."""
@@ -914,3 +1009,11 @@ class TestGetRelativePath:
         result = lookup._get_relative_path(abs_path)
         assert "src" in result or "file.py" in result
         assert not os.path.isabs(result)
+
+    def test_dot_segments_and_outside_paths_match_resolve(self, lookup, temp_dir):
+        """Paths that skip the string fast path still resolve as before."""
+        root = temp_dir.resolve()
+        assert lookup._get_relative_path(str(root / "src" / ".." / "a.md")) == "a.md"
+        assert lookup._get_relative_path(str(root)) == "."
+        outside = str(root.parent / "elsewhere.md")
+        assert lookup._get_relative_path(outside) == outside.replace("\\", "/")
@@ -4,9 +4,9 @@ Tests for the Dart parser.
 This module tests Dart-specific link parsing functionality.
 """
 
-
 import pytest
 
+from linkwatcher.link_types import LinkType
 from linkwatcher.parsers.dart import DartParser
 
 pytestmark = [
@@ -556,3 +556,22 @@ class Config {
 
         # Should return empty list without crashing
         assert references == []
+
+
+class TestDartParserWholeBufferScan:
+    """parse_content() scans the whole buffer and maps offsets via LineIndex."""
+
+    def test_statement_lines_skip_other_extractors(self):
+        parser = DartParser()
+        content = "import 'a/b.dart'; // see c.dart\npart 'p.dart';\nfinal f = 'assets/x.png';\n"
+        refs = parser.parse_content(content, "main.dart")
+        assert [(r.line_number, r.column_start, r.link_target) for r in refs] == [
+            (1, 8, "a/b.dart"),
+            (2, 6, "p.dart"),
+            (3, 11, "assets/x.png"),
+        ]
+
+    def test_import_does_not_span_lines(self):
+        parser = DartParser()
+        refs = parser.parse_content("import\n'lib/util.dart';\n", "main.dart")
+        assert [(r.line_number, r.link_type) for r in refs] == [(2, LinkType.DART_QUOTED)]
@@ -9,6 +9,7 @@ import pytest
 
 from linkwatcher.parsers.generic import GenericParser
 from linkwatcher.utils import (
+    classifier_cache_stats,
     looks_like_directory_path,
     looks_like_file_path,
     looks_like_regex_or_glob,
@@ -485,3 +486,47 @@ class TestBug095PathDetectorsRejectRegexAndGlob:
         assert looks_like_file_path("doc/foo/bar.md") is True
         assert looks_like_file_path("config.yaml") is True
         assert looks_like_directory_path("doc/foo/bar") is True
+
+
+class TestPathClassifierMemo:
+    """The looks_like_* classifiers are bounded, process-wide LRU memos."""
+
+    def test_repeated_lookups_hit_the_memo(self):
+        looks_like_file_path.cache_clear()
+        looks_like_regex_or_glob.cache_clear()
+
+        results = [looks_like_file_path("../config.yaml") for _ in range(5)]
+
+        assert results == [True] * 5
+        stats = classifier_cache_stats()["looks_like_file_path"]
+        assert (stats["hits"], stats["misses"], stats["size"]) == (4, 1, 1)
+        # The inner glob check only runs on the outer miss
+        assert classifier_cache_stats()["looks_like_regex_or_glob"]["misses"] == 1
+
+    def test_memo_is_bounded(self):
+        for classifier in (looks_like_file_path, looks_like_directory_path):
+            assert classifier.cache_info().maxsize is not None
+
+    def test_memoized_results_match_uncached_classifier(self):
+        samples = ["README.md", "doc/x/", "*.md", "Hello from move-target-2.ps1", "", "a/b"]
+        for classifier in (looks_like_file_path, looks_like_directory_path):
+            for text in samples:
+                assert classifier(text) == classifier.__wrapped__(text), (classifier, text)
+
+
+class TestGenericParserWholeBufferScan:
+    """parse_content() scans the whole buffer and maps offsets via LineIndex."""
+
+    def test_positions_and_per_line_order(self):
+        parser = GenericParser()
+        content = 'first\nsee docs/a.txt and "conf/b.yaml"\r\n  load tools/c.py\n"q/dir" here'
+        refs = parser.parse_content(content, "notes.txt")
+        assert [(r.line_number, r.column_start, r.column_end, r.link_target) for r in refs] == [
+            (2, 20, 31, "conf/b.yaml"),
+            (3, 7, 17, "tools/c.py"),
+            (4, 1, 6, "q/dir"),
+        ]
+
+    def test_quotes_do_not_pair_across_lines(self):
+        parser = GenericParser()
+        assert parser.parse_content('key = "docs\nsrc/app" other', "notes.txt") == []
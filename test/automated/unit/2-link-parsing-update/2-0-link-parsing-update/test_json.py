@@ -5,9 +5,11 @@ This module tests JSON-specific link parsing functionality.
 Implements JP test cases from comprehensive test documentation.
 """
 
+import json
+
 import pytest
 
-from linkwatcher.parsers.json_parser import JsonParser
+from linkwatcher.parsers.json_parser import JsonParser, iter_json_strings
 
 pytestmark = [
     pytest.mark.feature("2.1.1"),
@@ -706,3 +708,111 @@ class TestJsonParserCompoundStrings:
         references = parser.parse_content(json_content, "settings.json")
         targets = [ref.link_target for ref in references]
         assert len(targets) == 0
+
+
+class TestJsonStringScanner:
+    """iter_json_strings(): positioned string values straight from the source text."""
+
+    def test_yields_values_with_paths_and_positions(self):
+        content = '{\n  "a": {"b": ["x.md", 1, "y.md"]},\n  "c": "z.md"\n}'
+        values = list(iter_json_strings([content]))
+        assert values == [
+            ("x.md", ".a.b[0]", 2, 15, False),
+            ("y.md", ".a.b[2]", 2, 26, False),
+            ("z.md", ".c", 3, 8, False),
+        ]
+
+    def test_keys_are_not_yielded(self):
+        values = list(iter_json_strings(['{"docs/key.md": "docs/value.md"}']))
+        assert [v[0] for v in values] == ["docs/value.md"]
+
+    def test_escaped_values_are_decoded_and_flagged(self):
+        values = list(iter_json_strings(['["a\\\\b.txt", "c\\u0041.txt"]']))
+        assert values[0][0] == "a\\b.txt" and values[0][4] is True
+        assert values[1][0] == "cA.txt" and values[1][4] is True
+
+    def test_tokens_split_across_chunks(self):
+        content = '{"list": ["docs/readme.md", 12345, true, "src/app.py"]}\n'
+        expected = list(iter_json_strings([content]))
+        chunks = [content[i : i + 3] for i in range(0, len(content), 3)]
+        assert list(iter_json_strings(chunks)) == expected
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "",
+            '{"a": 1,}',
+            '{"a": 1} // comment',
+            '["a" "b"]',
+            '{"a" 1}',
+            "[1]]",
+            '"unterminated',
+            '\ufeff{"a": "b.txt"}',
+        ],
+    )
+    def test_rejects_what_json_loads_rejects(self, content):
+        with pytest.raises(json.JSONDecodeError):
+            json.loads(content)
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_strings([content]))
+
+
+class TestJsonParserScannerPositions:
+    """parse_content() locates values by scanner position, not by text search."""
+
+    def test_value_mentioned_earlier_in_a_key_gets_its_own_line(self):
+        parser = JsonParser()
+        content = '{\n  "docs/guide.md": {\n    "path": "docs/guide.md"\n  }\n}'
+        references = parser.parse_content(content, "registry.json")
+        assert [(r.line_number, r.column_start) for r in references] == [(3, 13)]
+
+    def test_same_value_twice_on_one_line(self):
+        parser = JsonParser()
+        references = parser.parse_content('{"a": "x/y.txt", "b": "x/y.txt"}', "min.json")
+        assert [r.column_start for r in references] == [7, 23]
+
+    def test_parse_stream_matches_parse_content(self):
+        parser = JsonParser()
+        content = '{\n  "files": ["docs/a.md", "docs/b.md"],\n  "dir": "src/pkg"\n}\n'
+        chunks = [content[i : i + 5] for i in range(0, len(content), 5)]
+        streamed = parser.parse_stream(chunks, "big.json")
+        parsed = parser.parse_content(content, "big.json")
+        assert [(r.line_number, r.column_start, r.link_target) for r in streamed] == [
+            (r.line_number, r.column_start, r.link_target) for r in parsed
+        ]
+
+    def test_parse_stream_split_at_every_offset(self):
+        """Numbers, keywords and strings cut at any chunk boundary still parse."""
+        parser = JsonParser()
+        content = (
+            '{"a": [1.5, -2e+10, 3E-2, 0, true, null], "b": {"c": "docs/x.md"},\n'
+            ' "d": ["src/app.py", 12.25e3, false, "doc/y.md"]}\n'
+        )
+        expected = [
+            (r.line_number, r.column_start, r.link_target)
+            for r in parser.parse_content(content, "big.json")
+        ]
+        assert len(expected) == 3
+        for cut in range(1, len(content)):
+            streamed = parser.parse_stream([content[:cut], content[cut:]], "big.json")
+            assert [(r.line_number, r.column_start, r.link_target) for r in streamed] == expected
+        for size in (1, 2, 3, 5):
+            chunks = [content[i : i + size] for i in range(0, len(content), size)]
+            assert len(parser.parse_stream(chunks, "big.json")) == 3
+
+    def test_number_cut_before_fraction_digits(self):
+        values = list(iter_json_strings(['{"a": [1.', '5, "doc/x.md"]}']))
+        assert values == [("doc/x.md", ".a[1]", 1, 13, False)]
+
+    def test_oversize_file_with_utf8_bom(self, temp_project_dir, monkeypatch):
+        from linkwatcher.parsers import json_parser
+
+        monkeypatch.setattr(json_parser, "_STREAM_CHUNK_CHARS", 4)
+        json_file = temp_project_dir / "big.json"
+        json_file.write_bytes('﻿{"path": "docs/a.md",\n "n": 1.5}'.encode("utf-8"))
+
+        references = JsonParser().parse_oversize_file(str(json_file))
+
+        assert [(r.line_number, r.column_start, r.link_target) for r in references] == [
+            (1, 11, "docs/a.md")
+        ]
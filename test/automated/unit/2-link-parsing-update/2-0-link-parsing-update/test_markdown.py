@@ -4,8 +4,11 @@ Tests for the Markdown parser.
 This module tests markdown-specific link parsing functionality.
 """
 
+from unittest.mock import patch
+
 import pytest
 
+from linkwatcher.link_types import LinkType
 from linkwatcher.parsers.markdown import MarkdownParser
 
 pytestmark = [
@@ -1426,3 +1429,36 @@ class TestMarkdownParserBarePathProseFiltering:
         references = parser.parse_content(content, "test.md")
         targets = [r.link_target for r in references]
         assert targets == ["target.md"], f"Unexpected refs: {targets}"
+
+
+class TestMarkdownParserTriggerGating:
+    """parse_content() only runs the extractors whose marker characters occur."""
+
+    def test_marker_free_lines_skip_all_extractors(self):
+        parser = MarkdownParser()
+        content = "# Title\n\nPlain prose without any path markers\n"
+        with patch.object(
+            parser, "_extract_standalone_refs", side_effect=AssertionError
+        ), patch.object(parser, "_extract_bare_paths", side_effect=AssertionError):
+            assert parser.parse_content(content, "test.md") == []
+
+    def test_every_pattern_still_fires_on_a_mixed_line(self):
+        parser = MarkdownParser()
+        content = (
+            '[a](docs/a.md) <a href="web/b.html">b</a> "src/c.py" "conf/dir" '
+            "`lib/d.md` `tools/bin` notes.txt @team/e/f.md doc/x/y\n"
+            "[ref]: docs/ref.md\n"
+        )
+        found = {(r.link_type, r.link_target) for r in parser.parse_content(content, "test.md")}
+        assert found == {
+            (LinkType.MARKDOWN, "docs/a.md"),
+            (LinkType.HTML_ANCHOR, "web/b.html"),
+            (LinkType.MARKDOWN_QUOTED, "src/c.py"),
+            (LinkType.MARKDOWN_QUOTED_DIR, "conf/dir"),
+            (LinkType.MARKDOWN_BACKTICK, "lib/d.md"),
+            (LinkType.MARKDOWN_BACKTICK_DIR, "tools/bin"),
+            (LinkType.MARKDOWN_STANDALONE, "notes.txt"),
+            (LinkType.MARKDOWN_AT_PREFIX, "team/e/f.md"),
+            (LinkType.MARKDOWN_BARE_PATH, "doc/x/y"),
+            (LinkType.MARKDOWN_REFERENCE, "docs/ref.md"),
+        }
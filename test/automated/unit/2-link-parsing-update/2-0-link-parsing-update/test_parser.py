@@ -4,11 +4,14 @@ Tests for the main LinkParser class.
 This module tests the parser coordination and file type delegation.
 """
 
+from unittest.mock import patch
 
 import pytest
 
 from linkwatcher.models import LinkReference
 from linkwatcher.parser import LinkParser
+from linkwatcher.parsers import GenericParser, MarkdownParser
+from linkwatcher.parsers.base import stamp_offsets
 
 pytestmark = [
     pytest.mark.feature("2.1.1"),
@@ -285,15 +288,15 @@ class TestLinkParserMaxFileSize:
         assert "target.txt" in targets
 
     def test_oversize_file_is_skipped(self, temp_project_dir):
-        """A file larger than max_file_size_mb returns [] without invoking the parser."""
+        """An oversize file whose parser cannot stream it returns [] without parsing."""
         from linkwatcher.config.settings import LinkWatcherConfig
 
         config = LinkWatcherConfig(max_file_size_mb=1)
         parser = LinkParser(config)
 
-        big_file = temp_project_dir / "big.md"
+        big_file = temp_project_dir / "big.yaml"
         # Write ~1.5 MB of content with a link inside — would normally yield references
-        body = "# Big\n\n[Link](target.txt)\n" + ("padding " * (1024 * 200))
+        body = "main: target.txt\n" + ("padding: value\n" * (1024 * 100))
         big_file.write_text(body, encoding="utf-8")
         assert big_file.stat().st_size > 1 * 1024 * 1024
 
@@ -301,6 +304,123 @@ class TestLinkParserMaxFileSize:
 
         assert references == []
 
+    def test_oversize_markdown_file_is_parsed_in_windows(self, temp_project_dir):
+        """Line-oriented parsers index oversize files window by window."""
+        from linkwatcher.config.settings import LinkWatcherConfig
+
+        config = LinkWatcherConfig(max_file_size_mb=1)
+        parser = LinkParser(config)
+
+        big_file = temp_project_dir / "big.md"
+        padding = "padding text without links\n" * 60000
+        big_file.write_text(
+            "# Big\n\n[Link](target.txt)\n" + padding + "See [end](last.txt).\n",
+            encoding="utf-8",
+        )
+        assert big_file.stat().st_size > 1 * 1024 * 1024
+
+        references = parser.parse_file(str(big_file))
+
+        assert [(r.link_target, r.line_number, r.column_start) for r in references] == [
+            ("target.txt", 3, 0),
+            ("last.txt", 60004, 4),
+        ]
+
+    @pytest.mark.parametrize("parser_cls", [MarkdownParser, GenericParser])
+    def test_parse_windows_matches_whole_file_parse(self, temp_project_dir, parser_cls):
+        """Small windows report the same references as one parse_content() call."""
+        doc = temp_project_dir / "doc.md"
+        lines = []
+        for i in range(200):
+            lines.append(f"Line {i} see [doc](docs/file{i}.md) and 'src/mod{i}.py'.")
+            lines.append("plain prose")
+        doc.write_text("---\ntitle: Doc\n---\n" + "\n".join(lines) + "\n", encoding="utf-8")
+        parser = parser_cls()
+
+        def key(refs):
+            return [(r.link_target, r.line_number, r.column_start, r.column_end) for r in refs]
+
+        expected = key(parser.parse_content(doc.read_text(encoding="utf-8"), str(doc)))
+        assert key(parser.parse_windows(str(doc), window_chars=300)) == expected
+
+    @pytest.mark.parametrize("window_chars", [60, 150, 400, 1000])
+    def test_mermaid_block_straddling_windows_stays_skipped(self, temp_project_dir, window_chars):
+        """Fence state carries across windows (PD-BUG-055 mermaid skipping)."""
+        doc = temp_project_dir / "doc.md"
+        diagram = "".join(f'  click N{i} "docs/node{i}.md"\n' for i in range(20))
+        doc.write_text(
+            "# Doc\n\nSee [a](docs/a.md).\n"
+            + "filler prose\n" * 20
+            + "```mermaid\n"
+            + diagram
+            + "```\n"
+            + "```python\nx = 'src/code.py'\n```\n"
+            + "After [b](docs/b.md).\n",
+            encoding="utf-8",
+        )
+        parser = MarkdownParser()
+        expected = parser.parse_content(doc.read_text(encoding="utf-8"), str(doc))
+        assert "docs/node0.md" not in [r.link_target for r in expected]
+
+        references = parser.parse_windows(str(doc), window_chars=window_chars)
+
+        assert [(r.link_target, r.line_number) for r in references] == [
+            (r.link_target, r.line_number) for r in expected
+        ]
+
+    @pytest.mark.parametrize("window_chars", [60, 400, 2000])
+    def test_leading_mermaid_fence_stays_skipped_across_windows(
+        self, temp_project_dir, window_chars
+    ):
+        """A mermaid fence on line 1 (no frontmatter) opens the block for later windows."""
+        doc = temp_project_dir / "doc.md"
+        doc.write_text(
+            "```mermaid\n"
+            + "".join(f"A --> B[x](d{i}.md)\n" for i in range(400))
+            + "```\n"
+            + "After [b](docs/b.md).\n",
+            encoding="utf-8",
+        )
+        parser = MarkdownParser()
+
+        references = parser.parse_windows(str(doc), window_chars=window_chars)
+
+        assert [r.link_target for r in references] == ["docs/b.md"]
+
+    def test_oversize_json_file_is_streamed(self, temp_project_dir):
+        """Oversize .json files are parsed in chunks instead of being skipped."""
+        from linkwatcher.config.settings import LinkWatcherConfig
+
+        config = LinkWatcherConfig(max_file_size_mb=1)
+        parser = LinkParser(config)
+
+        big_file = temp_project_dir / "big.json"
+        padding = ",\n".join(f'  "k{i}": "{"x" * 40}"' for i in range(30000))
+        big_file.write_text('{\n  "main": "target.txt",\n' + padding + "\n}\n", encoding="utf-8")
+        assert big_file.stat().st_size > 1 * 1024 * 1024
+
+        references = parser.parse_file(str(big_file))
+
+        assert [(r.link_target, r.line_number) for r in references] == [("target.txt", 2)]
+
+    def test_binary_file_is_skipped(self, temp_project_dir):
+        """Files with a NUL byte in their head are skipped without decoding."""
+        parser = LinkParser()
+        binary_file = temp_project_dir / "data.md"
+        binary_file.write_bytes(b"[a](target.txt)\x00\x01\x02" * 10)
+
+        assert parser.parse_file(str(binary_file)) == []
+
+    def test_utf16_file_is_parsed(self, temp_project_dir):
+        """A BOM selects the decoding, so UTF-16 files are not mistaken for binary."""
+        parser = LinkParser()
+        utf16_file = temp_project_dir / "doc.md"
+        utf16_file.write_bytes("# Doc\n\nSee [a](target.txt).\n".encode("utf-16"))
+
+        references = parser.parse_file(str(utf16_file))
+
+        assert [(r.link_target, r.line_number) for r in references] == [("target.txt", 3)]
+
     def test_size_check_disabled_when_zero(self, temp_project_dir):
         """max_file_size_mb=0 disables the check; oversized files still parse."""
         from linkwatcher.config.settings import LinkWatcherConfig
@@ -387,3 +507,189 @@ class TestLinkParserParseContent:
         references = parser.parse_content("anything", "file.boom")
 
         assert references == []
+
+
+class TestLinePrefilter:
+    """Tests for the shared line prefilter (BaseParser._prefiltered_lines)."""
+
+    def test_only_trigger_lines_are_yielded(self):
+        parser = MarkdownParser()
+        content = "plain\nsee docs/a.md\nmore prose\n\n'quoted'\nend"
+
+        lines = list(parser._prefiltered_lines(content))
+
+        assert lines == [(2, "see docs/a.md"), (5, "'quoted'")]
+        assert parser.prefilter_stats == {"lines": 6, "skipped": 4}
+
+    def test_dot_needs_an_extension_character(self):
+        parser = MarkdownParser()
+        content = "A sentence.\nfile.txt\n<tag>\n"
+
+        assert [n for n, _ in parser._prefiltered_lines(content)] == [2, 3]
+
+    def test_python_docstring_state_survives_skipped_lines(self):
+        from linkwatcher.parsers import PythonParser
+
+        content = 'x = 1\n"""\nplain text\nsee docs/guide.md\n"""\ny = 2\n'
+
+        references = PythonParser().parse_content(content, "mod.py")
+
+        assert [(r.link_target, r.line_number) for r in references] == [("docs/guide.md", 4)]
+
+    def test_link_parser_reports_skip_ratio(self, temp_project_dir):
+        parser = LinkParser()
+        md_file = temp_project_dir / "doc.md"
+        md_file.write_text("# Title\n\nprose\n\nSee [a](a.md).\n", encoding="utf-8")
+        parser.parse_file(str(md_file))
+
+        assert parser.get_prefilter_stats() == {
+            "MarkdownParser": {"lines": 6, "skipped": 5},
+        }
+        with patch.object(parser.logger.performance, "log_metric") as log_metric:
+            parser.log_prefilter_stats()
+        log_metric.assert_called_once_with(
+            "parser_prefilter_skip_ratio", 0.833, parser="MarkdownParser", lines=6, skipped=5
+        )
+
+
+def _ref_keys(references):
+    return sorted(
+        (r.line_number, r.column_start, r.column_end, r.link_target, r.offset) for r in references
+    )
+
+
+class TestIncrementalReparse:
+    """Tests for BaseParser.reparse_content() and LinkParser.reparse_file()."""
+
+    MARKDOWN = (
+        "---\n"
+        "related: docs/meta.md\n"
+        "---\n"
+        "# Title\n"
+        "\n"
+        "See [a](docs/a.md).\n"
+        "\n"
+        "```mermaid\n"
+        "graph TD; A[docs/hidden.md]\n"
+        "```\n"
+        "\n"
+        "Then [b](docs/b.md).\n"
+    )
+
+    def _reparse(self, parser, old, new, file_path):
+        _, snapshot = parser.reparse_content(old, file_path)
+        references, _ = parser.reparse_content(new, file_path, snapshot)
+        expected = stamp_offsets(parser.parse_content(new, file_path), new)
+        assert _ref_keys(references) == _ref_keys(expected)
+        return references
+
+    def test_inserted_line_shifts_later_references(self):
+        parser = MarkdownParser()
+        new = self.MARKDOWN.replace("# Title\n", "# Title\n\nAlso `src/c.py`.\n")
+
+        with patch.object(parser, "parse_content", wraps=parser.parse_content) as parse:
+            references = self._reparse(parser, self.MARKDOWN, new, "doc.md")
+            reparsed = parse.call_args_list[1].args[0]
+
+        assert reparsed == "Also `src/c.py`.\n"
+        assert [(r.link_target, r.line_number) for r in references] == [
+            ("docs/meta.md", 2),
+            ("src/c.py", 6),
+            ("docs/a.md", 8),
+            ("docs/b.md", 14),
+        ]
+
+    def test_removed_lines_shift_later_references(self):
+        parser = MarkdownParser()
+        new = self.MARKDOWN.replace("See [a](docs/a.md).\n\n", "")
+
+        references = self._reparse(parser, self.MARKDOWN, new, "doc.md")
+
+        assert [r.line_number for r in references if r.link_target == "docs/b.md"] == [10]
+
+    @pytest.mark.parametrize(
+        "old_text, new_text",
+        [
+            pytest.param("related: docs/meta.md", "related: docs/other.md", id="frontmatter"),
+            pytest.param("A[docs/hidden.md]", "A[docs/shown.md]", id="inside-mermaid"),
+            pytest.param("```mermaid", "```text", id="fence-language"),
+            pytest.param("# Title\n", "# Title\n```\n", id="opened-fence"),
+        ],
+    )
+    def test_block_state_edits_match_full_parse(self, old_text, new_text):
+        parser = MarkdownParser()
+        new = self.MARKDOWN.replace(old_text, new_text)
+
+        self._reparse(parser, self.MARKDOWN, new, "doc.md")
+
+    def test_edit_inside_leading_mermaid_fence_matches_full_parse(self):
+        """A fence on line 1 (no frontmatter) still opens the block."""
+        parser = MarkdownParser()
+        old = "```mermaid\n# T\n\n- [P](p.md)\nold line\n```\nAfter [b](docs/b.md).\n"
+        new = old.replace("old line", "See [x](docs/a.md) here")
+
+        references = self._reparse(parser, old, new, "doc.md")
+
+        assert [r.link_target for r in references] == ["docs/b.md"]
+
+    @pytest.mark.parametrize(
+        "old_text, new_text",
+        [
+            pytest.param("'./lib/a.ps1'", "'./lib/z.ps1'", id="plain-line"),
+            pytest.param("'./in/comment.ps1'", "'./in/other.ps1'", id="block-comment"),
+            pytest.param("'./in/here.ps1'", "'./in/there.ps1'", id="here-string"),
+            pytest.param("<#\n", "\n", id="removed-comment-start"),
+        ],
+    )
+    def test_powershell_edits_match_full_parse(self, old_text, new_text):
+        from linkwatcher.parsers import PowerShellParser
+
+        old = (
+            ". './lib/a.ps1'\n"
+            "<#\n"
+            "  './in/comment.ps1'\n"
+            "#>\n"
+            '$text = @"\n'
+            "  './in/here.ps1'\n"
+            '"@\n'
+            "Import-Module './lib/b.psm1'\n"
+        )
+
+        self._reparse(PowerShellParser(), old, old.replace(old_text, new_text), "s.ps1")
+
+    def test_generic_edit_reparses_changed_line_only(self):
+        parser = GenericParser()
+        old = "".join(f"line {i} see 'dir/f{i}.txt'\n" for i in range(50))
+        new = old.replace("dir/f25.txt", "dir/g25.txt")
+
+        with patch.object(parser, "parse_content", wraps=parser.parse_content) as parse:
+            references = self._reparse(parser, old, new, "notes.txt")
+            reparsed = parse.call_args_list[1].args[0]
+
+        assert reparsed == "line 25 see 'dir/g25.txt'"
+        assert references[25].link_target == "dir/g25.txt"
+
+    def test_link_parser_reparse_file_reuses_snapshot(self, temp_project_dir):
+        parser = LinkParser()
+        md_file = temp_project_dir / "doc.md"
+        md_file.write_text(self.MARKDOWN, encoding="utf-8")
+        md_parser = parser.parsers[".md"]
+
+        first = parser.reparse_file(str(md_file))
+        md_file.write_text(self.MARKDOWN.replace("docs/b.md", "docs/c.md"), encoding="utf-8")
+        with patch.object(md_parser, "parse_content", wraps=md_parser.parse_content) as parse:
+            second = parser.reparse_file(str(md_file))
+
+        assert len(first) == len(second) == 3
+        parse.assert_called_once_with("Then [b](docs/c.md).", str(md_file))
+        assert second[-1].link_target == "docs/c.md"
+
+    def test_link_parser_reparse_file_without_incremental_parser(self, temp_project_dir):
+        parser = LinkParser()
+        yaml_file = temp_project_dir / "conf.yaml"
+        yaml_file.write_text("path: docs/a.md\n", encoding="utf-8")
+
+        references = parser.reparse_file(str(yaml_file))
+
+        assert [r.link_target for r in references] == ["docs/a.md"]
+        assert parser._snapshots == {}
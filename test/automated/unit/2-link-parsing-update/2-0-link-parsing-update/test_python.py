@@ -534,3 +534,79 @@ class TestDocstringColumnPositions:
             assert "`" not in ref.link_target, "backtick captured into target: {!r}".format(
                 ref.link_target
             )
+
+
+class TestPythonParserTokenizeEngine:
+    """engine="tokenize": positions come from stdlib tokenize tokens."""
+
+    @staticmethod
+    def _refs(content):
+        references = PythonParser(engine="tokenize").parse_content(content, "mod.py")
+        lines = content.split("\n")
+        for ref in references:
+            line = lines[ref.line_number - 1]
+            assert line[ref.column_start : ref.column_end] == ref.link_text
+        return references
+
+    def test_rejects_unknown_engine(self):
+        with pytest.raises(ValueError):
+            PythonParser(engine="ast")
+
+    def test_quoted_comment_docstring_and_import_types(self):
+        content = (
+            "import src.utils.helpers\n"
+            "import os.path\n"
+            '"""Module docs in doc/guide.md and doc/api/."""\n'
+            'CONFIG = "config/settings.yaml"  # see docs/notes.md\n'
+            'DATA = "data/raw"\n'
+        )
+        found = {(r.link_type, r.link_target, r.line_number) for r in self._refs(content)}
+        assert found == {
+            (LinkType.PYTHON_IMPORT, "src/utils/helpers", 1),
+            (LinkType.PYTHON_DOCSTRING, "doc/guide.md", 3),
+            (LinkType.PYTHON_DOCSTRING_DIR, "doc/api/", 3),
+            (LinkType.PYTHON_QUOTED, "config/settings.yaml", 4),
+            (LinkType.PYTHON_COMMENT, "docs/notes.md", 4),
+            (LinkType.PYTHON_QUOTED_DIR, "data/raw", 5),
+        }
+
+    def test_multiline_docstring_lines_and_columns(self):
+        content = 'def f():\n    """Summary.\n\n    Reads templates/base.html.\n    """\n'
+        refs = self._refs(content)
+        assert [(r.line_number, r.column_start) for r in refs] == [(4, 10)]
+
+    def test_quote_between_string_literals_is_not_a_path(self):
+        """The regex engine pairs the closing and opening quotes of two
+        literals (``"src" / "pkg"`` -> ``" / "``); tokens keep them apart."""
+        content = 'path = root / "src" / "pkg" / "mod.py"\n'
+        assert [r.link_target for r in self._refs(content)] == ["mod.py"]
+
+    def test_hash_inside_string_is_not_a_comment(self):
+        content = 'TITLE = "# Heading with notes.md mention"\n'
+        assert not any(r.link_type == LinkType.PYTHON_COMMENT for r in self._refs(content))
+
+    def test_nested_quoted_path_inside_string(self):
+        content = """payload = '{"legacy": "docs/old.txt"}'\n"""
+        assert [r.link_target for r in self._refs(content)] == ["docs/old.txt"]
+
+    def test_quoted_path_inside_triple_quoted_string(self):
+        content = (
+            "def render():\n"
+            '    """Usage:\n'
+            "\n"
+            '        $config = "config/settings.yaml"\n'
+            "        load 'data/my file.json' first\n"
+            '    """\n'
+        )
+        found = [(r.link_type, r.link_target, r.line_number) for r in self._refs(content)]
+        assert found == [
+            (LinkType.PYTHON_QUOTED, "config/settings.yaml", 4),
+            (LinkType.PYTHON_QUOTED, "data/my file.json", 5),
+        ]
+
+    def test_untokenizable_source_falls_back_to_regex_engine(self):
+        content = 'x = """never closed docs/a.md\n'
+        tokenize_refs = PythonParser(engine="tokenize").parse_content(content, "mod.py")
+        regex_refs = PythonParser().parse_content(content, "mod.py")
+        assert [r.link_target for r in tokenize_refs] == [r.link_target for r in regex_refs]
+        assert "docs/a.md" in [r.link_target for r in tokenize_refs]
@@ -5,11 +5,21 @@ This module tests the file updating functionality when links need
 to be changed due to file moves or renames.
 """
 
+import os
+import re
+import shutil
+import subprocess
+from unittest.mock import patch
+
 import pytest
 
+from linkwatcher.dry_run_patch import DryRunPatch
 from linkwatcher.link_types import LinkType
 from linkwatcher.models import LinkReference
+from linkwatcher.path_resolver import PathResolver
+from linkwatcher.update_journal import UpdateJournal, content_hash
 from linkwatcher.updater import LinkUpdater, UpdateResult
+from linkwatcher.utils import safe_file_read_with_encoding
 
 pytestmark = [
     pytest.mark.feature("2.2.1"),
@@ -286,10 +296,10 @@ Also a reference to "old.txt" in quotes.
         original_write = updater._write_file_safely
         write_called = False
 
-        def mock_write(file_path, content):
+        def mock_write(file_path, content, encoding="utf-8", original=None):
             nonlocal write_called
             write_called = True
-            return original_write(file_path, content)
+            return original_write(file_path, content, encoding, original=original)
 
         updater._write_file_safely = mock_write
 
@@ -832,6 +842,600 @@ class TestUpdateReferencesBatch:
         assert "new.md" in good_file.read_text()
 
 
+class TestWriteDurabilityAndGroupCommit:
+    """Tests for durability modes and group-commit staging of batch writes."""
+
+    def _make_batch(self, temp_project_dir, count):
+        move_groups = []
+        files = []
+        for i in range(count):
+            test_file = temp_project_dir / f"doc{i}.md"
+            test_file.write_text("See [a](old.md).\n")
+            ref = LinkReference(str(test_file), 1, 5, 13, "a", "old.md", "markdown")
+            move_groups.append(([ref], "old.md", "new.md"))
+            files.append(test_file)
+        return move_groups, files
+
+    def test_set_durability_rejects_unknown_mode(self):
+        updater = LinkUpdater()
+        assert updater.durability == "fast"
+        updater.set_durability("strict")
+        assert updater.durability == "strict"
+        with pytest.raises(ValueError):
+            updater.set_durability("paranoid")
+
+    @pytest.mark.parametrize(
+        "mode, expected_fsyncs",
+        [("fast", 0), ("safe", 1), ("strict", 2)],
+    )
+    def test_durability_mode_controls_fsync(self, temp_project_dir, mode, expected_fsyncs):
+        updater = LinkUpdater(str(temp_project_dir))
+        updater.set_backup_enabled(False)
+        updater.set_durability(mode)
+        move_groups, files = self._make_batch(temp_project_dir, 1)
+
+        with patch("linkwatcher.updater.os.fsync") as fsync:
+            stats = updater.update_references_batch(move_groups)
+
+        assert stats["files_updated"] == 1
+        assert "new.md" in files[0].read_text()
+        assert fsync.call_count == expected_fsyncs
+
+    def test_group_commit_stages_then_renames_batch(self, temp_project_dir):
+        updater = LinkUpdater(str(temp_project_dir))
+        updater.set_backup_enabled(False)
+        updater.set_group_commit(True)
+        move_groups, files = self._make_batch(temp_project_dir, 5)
+
+        replaced_during_staging = []
+        original_stage = updater._stage_temp_file
+
+        def stage(file_path, content, encoding="utf-8"):
+            replaced_during_staging.append(any("new.md" in f.read_text() for f in files))
+            return original_stage(file_path, content, encoding)
+
+        with patch.object(updater, "_stage_temp_file", side_effect=stage):
+            stats = updater.update_references_batch(move_groups)
+
+        assert replaced_during_staging == [False] * 5
+        assert stats["files_updated"] == 5
+        assert stats["references_updated"] == 5
+        assert all("new.md" in f.read_text() for f in files)
+        assert updater._staged_writes is None
+        assert not list(temp_project_dir.glob("tmp*"))
+
+    def test_group_commit_strict_fsyncs_each_directory_once(self, temp_project_dir):
+        updater = LinkUpdater(str(temp_project_dir))
+        updater.set_backup_enabled(False)
+        updater.set_group_commit(True)
+        updater.set_durability("strict")
+        move_groups, _ = self._make_batch(temp_project_dir, 4)
+
+        with patch.object(updater, "_fsync_directory") as fsync_dir:
+            updater.update_references_batch(move_groups)
+
+        fsync_dir.assert_called_once_with(str(temp_project_dir))
+
+    def test_group_commit_rename_failure_counts_as_error(self, temp_project_dir):
+        updater = LinkUpdater(str(temp_project_dir))
+        updater.set_backup_enabled(False)
+        updater.set_group_commit(True)
+        move_groups, files = self._make_batch(temp_project_dir, 3)
+        real_replace = os.replace
+
+        def flaky_replace(src, dst):
+            if str(dst).endswith("doc1.md"):
+                raise PermissionError("locked")
+            return real_replace(src, dst)
+
+        with patch("linkwatcher.updater.os.replace", side_effect=flaky_replace):
+            stats = updater.update_references_batch(move_groups)
+
+        assert stats["files_updated"] == 2
+        assert stats["references_updated"] == 2
+        assert stats["errors"] == 1
+        assert "old.md" in files[1].read_text()
+        assert not list(temp_project_dir.glob("tmp*"))
+
+    def test_group_commit_skipped_in_dry_run(self, temp_project_dir):
+        updater = LinkUpdater(str(temp_project_dir))
+        updater.set_group_commit(True)
+        updater.set_dry_run(True)
+        move_groups, files = self._make_batch(temp_project_dir, 2)
+
+        stats = updater.update_references(move_groups[0][0], "old.md", "new.md")
+
+        assert stats["files_updated"] == 1
+        assert "old.md" in files[0].read_text()
+        assert updater._staged_writes is None
+
+
+class TestParallelBatchUpdates:
+    """Tests for the thread-pooled per-file update path (set_worker_threads)."""
+
+    def _make_mixed_batch(self, temp_project_dir):
+        """Return move groups mixing updated, stale and failing files."""
+        move_groups = []
+        for i in range(20):
+            test_file = temp_project_dir / f"doc{i:02d}.md"
+            if i % 5 == 0:
+                # Stale: target no longer on the indexed line
+                test_file.write_text("Rewritten by hand.\n")
+            else:
+                test_file.write_text("See [a](old.md).\n")
+            ref = LinkReference(str(test_file), 1, 5, 13, "a", "old.md", "markdown")
+            move_groups.append(([ref], "old.md", "new.md"))
+        missing = LinkReference(
+            str(temp_project_dir / "missing.md"), 1, 5, 13, "a", "old.md", "markdown"
+        )
+        move_groups.append(([missing], "old.md", "new.md"))
+        return move_groups
+
+    def test_parallel_stats_match_serial(self, tmp_path):
+        serial_dir = tmp_path / "serial"
+        parallel_dir = tmp_path / "parallel"
+        serial_dir.mkdir()
+        parallel_dir.mkdir()
+
+        serial = LinkUpdater(str(serial_dir))
+        serial.set_backup_enabled(False)
+        serial_stats = serial.update_references_batch(self._make_mixed_batch(serial_dir))
+
+        parallel = LinkUpdater(str(parallel_dir))
+        parallel.set_backup_enabled(False)
+        parallel.set_worker_threads(8)
+        parallel_stats = parallel.update_references_batch(self._make_mixed_batch(parallel_dir))
+
+        assert parallel_stats["files_updated"] == serial_stats["files_updated"] == 16
+        assert parallel_stats["references_updated"] == serial_stats["references_updated"] == 16
+        assert parallel_stats["errors"] == serial_stats["errors"] == 1
+        # stale_files keeps input order regardless of completion order
+        assert [os.path.basename(p) for p in parallel_stats["stale_files"]] == [
+            "doc00.md",
+            "doc05.md",
+            "doc10.md",
+            "doc15.md",
+        ]
+        for i in range(20):
+            expected = "Rewritten by hand.\n" if i % 5 == 0 else "See [a](new.md).\n"
+            assert (parallel_dir / f"doc{i:02d}.md").read_text() == expected
+
+    def test_parallel_respects_dry_run(self, temp_project_dir):
+        updater = LinkUpdater(str(temp_project_dir))
+        updater.set_worker_threads(4)
+        updater.set_dry_run(True)
+        move_groups = self._make_mixed_batch(temp_project_dir)
+
+        stats = updater.update_references_batch(move_groups)
+
+        # Dry run reports every file as updated without touching disk
+        assert stats["files_updated"] == 21
+        assert stats["errors"] == 0
+        assert (temp_project_dir / "doc01.md").read_text() == "See [a](old.md).\n"
+
+    def test_parallel_with_group_commit(self, temp_project_dir):
+        updater = LinkUpdater(str(temp_project_dir))
+        updater.set_backup_enabled(False)
+        updater.set_worker_threads(4)
+        updater.set_group_commit(True)
+        move_groups = self._make_mixed_batch(temp_project_dir)
+
+        with patch.object(
+            updater, "_commit_staged_writes", wraps=updater._commit_staged_writes
+        ) as commit:
+            stats = updater.update_references_batch(move_groups)
+
+        assert stats["files_updated"] == 16
+        assert len(commit.call_args[0][0]) == 16
+        assert (temp_project_dir / "doc01.md").read_text() == "See [a](new.md).\n"
+        assert not list(temp_project_dir.glob("tmp*"))
+
+    def test_duplicate_file_keys_fall_back_to_serial(self, temp_project_dir):
+        updater = LinkUpdater(str(temp_project_dir))
+        updater.set_backup_enabled(False)
+        updater.set_worker_threads(4)
+        test_file = temp_project_dir / "index.md"
+        test_file.write_text("- [A](dir/a.md)\n- [B](dir/b.md)\n")
+
+        # Same file referenced by relative and absolute path
+        ref_a = LinkReference("index.md", 1, 3, 14, "A", "dir/a.md", "markdown")
+        ref_b = LinkReference(str(test_file), 2, 3, 14, "B", "dir/b.md", "markdown")
+        stats = updater.update_references_batch(
+            [([ref_a], "dir/a.md", "new/a.md"), ([ref_b], "dir/b.md", "new/b.md")]
+        )
+
+        assert stats["files_updated"] == 2
+        assert test_file.read_text() == "- [A](new/a.md)\n- [B](new/b.md)\n"
+
+
+class TestDryRunPatch:
+    """Tests for streaming dry-run output as a unified diff (DryRunPatch)."""
+
+    def _make_tree(self, root, count):
+        root.mkdir()
+        move_groups = []
+        for i in range(count):
+            test_file = root / f"doc{i:02d}.md"
+            # Odd files end without a trailing newline
+            test_file.write_text(f"# Doc {i}\n\nSee [a](old.md)." + ("\n" if i % 2 == 0 else ""))
+            ref = LinkReference(str(test_file), 3, 4, 14, "a", "old.md", "markdown")
+            move_groups.append(([ref], "old.md", "new.md"))
+        return move_groups
+
+    def _dry_run_updater(self, root, workers=1):
+        updater = LinkUpdater(str(root))
+        updater.set_dry_run(True)
+        updater.set_worker_threads(workers)
+        patch_file = root.parent / f"{root.name}.patch"
+        updater.set_dry_run_patch(DryRunPatch(str(patch_file), str(root)))
+        return updater, patch_file
+
+    def test_patch_streams_diffs_without_touching_files(self, tmp_path):
+        move_groups = self._make_tree(tmp_path / "tree", 4)
+        updater, patch_file = self._dry_run_updater(tmp_path / "tree")
+
+        stats = updater.update_references_batch(move_groups)
+        updater.dry_run_patch.close()
+
+        assert stats["files_updated"] == 4
+        assert all("old.md" in (tmp_path / "tree" / f"doc{i:02d}.md").read_text() for i in range(4))
+        patch = patch_file.read_text()
+        assert patch.count("diff --git a/doc") == 4
+        assert "diff --git a/doc00.md b/doc00.md\n--- a/doc00.md\n+++ b/doc00.md\n" in patch
+        assert "-See [a](old.md).\n\\ No newline at end of file\n" in patch
+        assert "+See [a](new.md).\n" in patch
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not available")
+    def test_patch_applies_with_git_apply(self, tmp_path):
+        live_groups = self._make_tree(tmp_path / "live", 6)
+        live = LinkUpdater(str(tmp_path / "live"))
+        live.set_backup_enabled(False)
+        live.update_references_batch(live_groups)
+
+        dry_groups = self._make_tree(tmp_path / "dry", 6)
+        updater, patch_file = self._dry_run_updater(tmp_path / "dry", workers=4)
+        updater.update_references_batch(dry_groups)
+        updater.dry_run_patch.close()
+
+        subprocess.run(
+            ["git", "apply", str(patch_file)],
+            cwd=tmp_path / "dry",
+            check=True,
+            capture_output=True,
+        )
+        for i in range(6):
+            name = f"doc{i:02d}.md"
+            assert (tmp_path / "dry" / name).read_text() == (tmp_path / "live" / name).read_text()
+
+    def _git_apply(self, patch_file, cwd):
+        for args in (["--check"], []):
+            subprocess.run(
+                ["git", "apply", *args, str(patch_file)], cwd=cwd, check=True, capture_output=True
+            )
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not available")
+    @pytest.mark.parametrize(
+        "raw, codec",
+        [
+            pytest.param(b"# Doc\r\n\r\nSee [a](old.md).\r\nEnd\r\n", "utf-8", id="crlf"),
+            pytest.param(b"# Doc\r\nSee [a](old.md).\nEnd", "utf-8", id="mixed-endings"),
+            pytest.param("# Café\nSee [a](old.md).\n".encode("latin-1"), "latin-1", id="latin-1"),
+            pytest.param("\ufeff# Doc\r\nSee [a](old.md).\r\n".encode(), "utf-8", id="utf-8-bom"),
+            pytest.param(
+                "\ufeff# Doc\nSee [a](old.md).\n".encode("utf-16-le"), "utf-16-le", id="utf-16"
+            ),
+        ],
+    )
+    def test_patch_keeps_line_endings_and_encoding(self, tmp_path, raw, codec):
+        """The patch must apply to the on-disk bytes and keep CRLF and the encoding."""
+        root = tmp_path / "tree"
+        root.mkdir()
+        test_file = root / "doc.md"
+        test_file.write_bytes(raw)
+        line = 1 + raw.decode(codec).replace("\r\n", "\n").split("\n").index("See [a](old.md).")
+        ref = LinkReference(str(test_file), line, 4, 14, "a", "old.md", "markdown")
+        updater, patch_file = self._dry_run_updater(root)
+
+        updater.update_references_batch([([ref], "old.md", "new.md")])
+        updater.dry_run_patch.close()
+
+        assert test_file.read_bytes() == raw
+        self._git_apply(patch_file, root)
+        assert test_file.read_bytes() == raw.replace("old.md".encode(codec), "new.md".encode(codec))
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not available")
+    def test_repeated_rewrites_of_one_file_apply_in_order(self, tmp_path):
+        root = tmp_path / "tree"
+        root.mkdir()
+        test_file = root / "index.md"
+        test_file.write_bytes(b"- [A](dir/a.md) [B](dir/b.md)\r\n- [C](dir/c.md)\r\n")
+        updater, patch_file = self._dry_run_updater(root)
+
+        for line, col, target in ((1, 6, "dir/a.md"), (1, 20, "dir/b.md"), (2, 6, "dir/c.md")):
+            ref = LinkReference(str(test_file), line, col, col + 8, "x", target, "markdown")
+            updater.update_references([ref], target, target.replace("dir/", "new/"))
+        updater.dry_run_patch.close()
+
+        assert patch_file.read_bytes().count(b"diff --git a/index.md") == 3
+        self._git_apply(patch_file, root)
+        assert test_file.read_bytes() == b"- [A](new/a.md) [B](new/b.md)\r\n- [C](new/c.md)\r\n"
+
+    def test_overlapping_rewrites_are_not_merged(self, tmp_path):
+        root = tmp_path / "tree"
+        root.mkdir()
+        test_file = root / "doc.md"
+        test_file.write_text("See [a](old.md).\n")
+        patch = DryRunPatch(str(tmp_path / "out.patch"), str(root))
+
+        patch.write(str(test_file), "See [a](old.md).\n", "See [a](new.md).\n")
+        patch.write(str(test_file), "See [a](old.md).\n", "See [a](other.md).\n")
+        patch.close()
+
+        assert patch.files_written == 1
+        assert b"+See [a](new.md)." in (tmp_path / "out.patch").read_bytes()
+
+    def test_planned_text_is_spilled_not_held(self, tmp_path):
+        root = tmp_path / "tree"
+        root.mkdir()
+        test_file = root / "doc.md"
+        original = "See [a](old.md) and [b](other.md).\n" + "filler line\n" * 2000
+        test_file.write_text(original)
+        patch = DryRunPatch(str(tmp_path / "out.patch"), str(root))
+
+        patch.write(str(test_file), original, original.replace("old.md", "new.md"))
+        planned = patch._planned[str(test_file)]
+        held = [getattr(planned, slot) for slot in planned.__slots__]
+        assert all(not isinstance(value, str) or len(value) < 200 for value in held)
+        assert os.path.isfile(planned.spill_path)
+
+        patch.write(str(test_file), original, original.replace("other.md", "b.md"))
+        spill_dir = os.path.dirname(planned.spill_path)
+        patch.close()
+
+        assert patch.files_written == 2
+        assert not os.path.exists(spill_dir)
+        assert test_file.read_text() == original
+        diffs = (tmp_path / "out.patch").read_text().split("diff --git")
+        assert "+See [a](new.md) and [b](b.md)." in diffs[2]
+
+    def test_dry_run_without_patch_still_skips(self, temp_project_dir):
+        test_file = temp_project_dir / "doc.md"
+        test_file.write_text("See [a](old.md).\n")
+        updater = LinkUpdater(str(temp_project_dir))
+        updater.set_dry_run(True)
+        ref = LinkReference(str(test_file), 1, 4, 14, "a", "old.md", "markdown")
+
+        with patch.object(updater, "_apply_replacements") as apply:
+            stats = updater.update_references([ref], "old.md", "new.md")
+
+        apply.assert_not_called()
+        assert stats["files_updated"] == 1
+
+
+class TestUpdateJournalTransactions:
+    """Tests for journaled multi-file batches (set_journal / UpdateJournal)."""
+
+    def _make_batch(self, temp_project_dir, count):
+        move_groups = []
+        files = []
+        for i in range(count):
+            test_file = temp_project_dir / f"doc{i}.md"
+            test_file.write_text(f"# Doc {i}\n\nSee [a](old.md).\n")
+            ref = LinkReference(str(test_file), 3, 5, 13, "a", "old.md", "markdown")
+            move_groups.append(([ref], "old.md", "new.md"))
+            files.append(test_file)
+        return move_groups, files
+
+    def _journaled_updater(self, temp_project_dir):
+        updater = LinkUpdater(str(temp_project_dir))
+        journal = UpdateJournal(str(temp_project_dir / "journal.jsonl"))
+        updater.set_journal(journal)
+        return updater, journal
+
+    def test_journaled_batch_replaces_backups(self, temp_project_dir):
+        updater, journal = self._journaled_updater(temp_project_dir)
+        updater.set_backup_enabled(True)
+        move_groups, files = self._make_batch(temp_project_dir, 3)
+
+        with patch.object(journal, "begin", wraps=journal.begin) as begin:
+            stats = updater.update_references_batch(move_groups)
+
+        assert stats["files_updated"] == 3
+        assert stats["errors"] == 0
+        assert all("[a](new.md)" in f.read_text() for f in files)
+        assert not list(temp_project_dir.glob("*.bak"))
+        # One journal record for the whole batch, truncated once committed
+        entries = begin.call_args[0][0]
+        assert [e["edits"] for e in entries] == [
+            [[2, "See [a](old.md).\n", "See [a](new.md).\n"]]
+        ] * 3
+        assert (temp_project_dir / "journal.jsonl").read_text() == ""
+
+    def test_rename_failure_rolls_back_whole_batch(self, temp_project_dir):
+        updater, _ = self._journaled_updater(temp_project_dir)
+        move_groups, files = self._make_batch(temp_project_dir, 3)
+        real_replace = os.replace
+
+        def flaky_replace(src, dst):
+            if str(dst).endswith("doc2.md"):
+                raise PermissionError("locked")
+            return real_replace(src, dst)
+
+        with patch("linkwatcher.updater.os.replace", side_effect=flaky_replace):
+            stats = updater.update_references_batch(move_groups)
+
+        assert stats["files_updated"] == 0
+        assert stats["references_updated"] == 0
+        assert stats["errors"] == 3
+        assert all("[a](old.md)" in f.read_text() for f in files)
+        assert not list(temp_project_dir.glob("tmp*"))
+        assert (temp_project_dir / "journal.jsonl").read_text() == ""
+
+    def test_journal_entry_uses_text_the_update_was_computed_from(self, temp_project_dir):
+        updater, journal = self._journaled_updater(temp_project_dir)
+        move_groups, files = self._make_batch(temp_project_dir, 2)
+
+        with patch.object(journal, "begin", wraps=journal.begin) as begin, patch(
+            "linkwatcher.updater.safe_file_read_with_encoding",
+            wraps=safe_file_read_with_encoding,
+        ) as read:
+            updater.update_references_batch(move_groups)
+
+        # One read per file; the journal entry does not re-read it.
+        assert read.call_count == 2
+        entries = begin.call_args[0][0]
+        assert [e["original_sha256"] for e in entries] == [
+            content_hash(f"# Doc {i}\n\nSee [a](old.md).\n") for i in range(2)
+        ]
+
+    def test_recover_removes_staged_temp_files(self, temp_project_dir):
+        updater, journal = self._journaled_updater(temp_project_dir)
+        move_groups, files = self._make_batch(temp_project_dir, 3)
+
+        # Crash after the begin record is durable, before any rename.
+        with patch.object(updater, "_commit_staged_writes", side_effect=SystemExit):
+            with pytest.raises(SystemExit):
+                updater.update_references_batch(move_groups)
+        assert len(list(temp_project_dir.glob("tmp*"))) == 3
+
+        summary = UpdateJournal(str(temp_project_dir / "journal.jsonl")).recover()
+
+        assert summary == {"rolled_forward": 3, "rolled_back": 0, "conflicts": 0}
+        assert all("[a](new.md)" in f.read_text() for f in files)
+        assert not list(temp_project_dir.glob("tmp*"))
+
+    def _interrupted_journal(self, temp_project_dir, rollback=False):
+        """Write an open transaction whose first file was already replaced."""
+        journal = UpdateJournal(str(temp_project_dir / "journal.jsonl"))
+        _, files = self._make_batch(temp_project_dir, 3)
+        entries = []
+        for f in files:
+            original = f.read_text()
+            entries.append(
+                journal.make_entry(str(f), original, original.replace("old.md", "new.md"))
+            )
+        txn = journal.begin(entries)
+        files[0].write_text(files[0].read_text().replace("old.md", "new.md"))
+        if rollback:
+            journal.mark_rollback(txn)
+        return files
+
+    def test_recover_rolls_forward_open_transaction(self, temp_project_dir):
+        files = self._interrupted_journal(temp_project_dir)
+
+        summary = UpdateJournal(str(temp_project_dir / "journal.jsonl")).recover()
+
+        assert summary == {"rolled_forward": 2, "rolled_back": 0, "conflicts": 0}
+        assert all("[a](new.md)" in f.read_text() for f in files)
+        assert (temp_project_dir / "journal.jsonl").read_text() == ""
+
+    def test_recover_rolls_back_after_rollback_record(self, temp_project_dir):
+        files = self._interrupted_journal(temp_project_dir, rollback=True)
+
+        summary = UpdateJournal(str(temp_project_dir / "journal.jsonl")).recover()
+
+        assert summary == {"rolled_forward": 0, "rolled_back": 1, "conflicts": 0}
+        assert all("[a](old.md)" in f.read_text() for f in files)
+
+    def test_recover_skips_edited_files_and_torn_records(self, temp_project_dir):
+        files = self._interrupted_journal(temp_project_dir)
+        files[1].write_text("Edited by hand.\n")
+        with open(temp_project_dir / "journal.jsonl", "a", encoding="utf-8") as f:
+            f.write('{"op": "begin", "txn": "torn", "fil')
+
+        summary = UpdateJournal(str(temp_project_dir / "journal.jsonl")).recover()
+
+        assert summary == {"rolled_forward": 1, "rolled_back": 0, "conflicts": 1}
+        assert files[1].read_text() == "Edited by hand.\n"
+        assert "[a](new.md)" in files[2].read_text()
+
+
+class TestOffsetSpanPatching:
+    """Tests for the offset-based fast path (_apply_span_patches)."""
+
+    def _parsed_refs(self, test_file):
+        from linkwatcher.parser import LinkParser
+
+        refs = LinkParser().parse_file(str(test_file))
+        return [r for r in refs if r.link_target == "old.md"]
+
+    def _spied_updater(self, temp_project_dir):
+        """Updater whose fast-path results are recorded (None = fell back)."""
+        updater = LinkUpdater(str(temp_project_dir))
+        updater.set_backup_enabled(False)
+        results = []
+        real = updater._apply_span_patches
+
+        def spy(*args):
+            result = real(*args)
+            results.append(result)
+            return result
+
+        updater._apply_span_patches = spy
+        return updater, results
+
+    def test_parsed_references_carry_offsets(self, temp_project_dir):
+        test_file = temp_project_dir / "doc.md"
+        test_file.write_bytes("# Title\r\n\nSee [a](old.md) and [b](old.md).\n".encode("utf-8"))
+
+        refs = self._parsed_refs(test_file)
+
+        text = test_file.read_text(encoding="utf-8")
+        assert len(refs) == 2
+        for ref in refs:
+            assert ref.content_hash is not None
+            span = text[ref.offset : ref.offset + ref.column_end - ref.column_start]
+            assert span == text.split("\n")[ref.line_number - 1][ref.column_start : ref.column_end]
+            assert "old.md" in span
+
+    def test_fast_path_matches_line_based_result(self, temp_project_dir):
+        body = "".join(f"Line {i} with [link](other{i}.md)\n" for i in range(2000))
+        content = body + "See [a](old.md) and `old.md`.\n" + body + "End [z](old.md)"
+        fast_file = temp_project_dir / "fast.md"
+        slow_file = temp_project_dir / "slow.md"
+        fast_file.write_text(content)
+        slow_file.write_text(content)
+        fast_refs = self._parsed_refs(fast_file)
+        slow_refs = self._parsed_refs(slow_file)
+        for ref in slow_refs:
+            ref.offset = None
+        updater, results = self._spied_updater(temp_project_dir)
+
+        updater.update_references(fast_refs, "old.md", "new.md")
+        updater.update_references(slow_refs, "old.md", "new.md")
+
+        assert results == [UpdateResult.UPDATED, None]
+        assert fast_file.read_text() == slow_file.read_text()
+        assert fast_file.read_text().count("new.md") == 3
+        assert "old.md" not in fast_file.read_text()
+
+    def test_changed_file_falls_back_to_line_based_path(self, temp_project_dir):
+        test_file = temp_project_dir / "doc.md"
+        test_file.write_text("See [a](old.md).\n")
+        refs = self._parsed_refs(test_file)
+        test_file.write_text("See [a](old.md).\nAppended after the scan.\n")
+        updater, results = self._spied_updater(temp_project_dir)
+
+        stats = updater.update_references(refs, "old.md", "new.md")
+
+        assert results == [None]
+        assert stats["files_updated"] == 1
+        assert test_file.read_text() == "See [a](new.md).\nAppended after the scan.\n"
+
+    def test_stale_content_is_detected_on_fast_path(self, temp_project_dir):
+        test_file = temp_project_dir / "doc.md"
+        test_file.write_text("See [a](old.md).\n")
+        refs = self._parsed_refs(test_file)
+        refs[0].link_target = "gone.md"
+        updater, results = self._spied_updater(temp_project_dir)
+
+        stats = updater.update_references(refs, "gone.md", "new.md")
+
+        assert results == [UpdateResult.STALE]
+        assert stats["stale_files"] == [str(test_file)]
+        assert test_file.read_text() == "See [a](old.md).\n"
+
+
 class TestPythonImportIdempotency:
     """TD251: _replace_at_position must be idempotent for PYTHON_IMPORT refs.
 
@@ -905,6 +1509,108 @@ class TestPythonImportIdempotency:
         assert "y = src.utils.a" in result, "standalone occurrence should be replaced"
 
 
+class TestModuleRenameMatcher:
+    """Phase 2 matches every renamed module in one scan (_module_rename_regex)."""
+
+    def test_all_renames_applied_in_one_pass(self):
+        updater = LinkUpdater()
+        renames = {f"pkg.mod{i}": f"lib.mod{i}" for i in range(50)}
+        content = "".join(f"pkg.mod{i}.run()\n" for i in range(50))
+
+        with patch("linkwatcher.updater.re.compile", wraps=re.compile) as compile_:
+            result = updater._rename_module_usages(content, renames)
+
+        assert result == "".join(f"lib.mod{i}.run()\n" for i in range(50))
+        assert compile_.call_count == 1
+
+    def test_boundaries_and_longest_match(self):
+        updater = LinkUpdater()
+        renames = {"utils": "core", "utils.helpers": "shared.helpers"}
+        content = "utils.helpers.f(); utils.g(); src.utils.h(); myutils.i()\n"
+
+        result = updater._rename_module_usages(content, renames)
+
+        assert result == "shared.helpers.f(); core.g(); src.utils.h(); myutils.i()\n"
+
+    def test_chained_renames_are_not_applied_twice(self):
+        """A→B and B→C in the same file must not turn A into C."""
+        updater = LinkUpdater()
+
+        result = updater._rename_module_usages("a.x\nb.x\n", {"a.x": "b.x", "b.x": "c.x"})
+
+        assert result == "b.x\nc.x\n"
+
+    def test_matcher_is_reused_for_the_same_module_set(self):
+        updater = LinkUpdater()
+        renames = {"pkg.a": "lib.a", "pkg.b": "lib.b"}
+
+        first = updater._module_rename_regex(renames)
+        second = updater._module_rename_regex(dict(reversed(list(renames.items()))))
+
+        assert first is second
+
+
+class TestPathResolutionMemo:
+    """Per-batch PathResolver memo and calculate_new_targets()."""
+
+    @staticmethod
+    def _ref(file_path, target):
+        return LinkReference(file_path, 1, 0, len(target), target, target, LinkType.MARKDOWN)
+
+    def test_shared_inputs_resolve_once_per_batch(self, temp_project_dir):
+        resolver = PathResolver(str(temp_project_dir))
+        refs = [self._ref(f"docs/page{i}.md", "../old/file.md") for i in range(20)]
+
+        results = resolver.calculate_new_targets(refs, "old/file.md", "new/file.md")
+
+        assert results == ["../new/file.md"] * 20
+        assert resolver.memo_stats == {"hits": 19, "misses": 1}
+
+    def test_memo_is_keyed_on_source_directory(self, temp_project_dir):
+        resolver = PathResolver(str(temp_project_dir))
+        refs = [self._ref("a/x.md", "../old.md"), self._ref("a/b/y.md", "../old.md")]
+
+        results = resolver.calculate_new_targets(refs, "old.md", "a/new.md")
+
+        assert results == ["new.md", "../old.md"]
+        assert resolver.memo_stats["hits"] == 0
+
+    def test_memo_is_dropped_when_the_batch_ends(self, temp_project_dir):
+        resolver = PathResolver(str(temp_project_dir))
+        ref = self._ref("readme.md", "old.md")
+
+        resolver.calculate_new_targets([ref], "old.md", "new.md")
+        resolver.calculate_new_target(ref, "old.md", "new.md")
+
+        assert resolver._memo is None
+        assert resolver.memo_stats == {"hits": 0, "misses": 1}
+
+    def test_batch_update_shares_the_memo_across_files(self, temp_project_dir):
+        updater = LinkUpdater(str(temp_project_dir))
+        updater.set_backup_enabled(False)
+        (temp_project_dir / "docs").mkdir()
+        refs = []
+        for i in range(5):
+            page = temp_project_dir / "docs" / f"page{i}.md"
+            page.write_text("See [x](../old/file.md).\n")
+            refs.append(
+                LinkReference(f"docs/page{i}.md", 1, 4, 24, "x", "../old/file.md", "markdown")
+            )
+
+        with patch.object(
+            updater.path_resolver,
+            "_calculate_new_target_uncached",
+            wraps=updater.path_resolver._calculate_new_target_uncached,
+        ) as uncached:
+            stats = updater.update_references_batch([(refs, "old/file.md", "new/file.md")])
+
+        assert stats["files_updated"] == 5
+        assert uncached.call_count == 1
+        assert (temp_project_dir / "docs" / "page3.md").read_text() == (
+            "See [x](../new/file.md).\n"
+        )
+
+
 class TestOverlappingReferenceCorruption:
     """PD-BUG-098 regression: when multiple LinkReferences on the same line have
     overlapping column ranges (one strictly contained in another), the descending-
@@ -1082,6 +1788,27 @@ class TestOverlappingReferenceCorruption:
             updated == 'See "new-a.txt" and also "new-b.txt" please.\n'
         ), f"Non-overlapping refs lost an update: {updated!r}"
 
+    def test_plan_replacements_applies_overlap_filter_without_reading(self, temp_project_dir):
+        """plan_replacements() resolves targets and drops contained refs
+        like a real update, but never touches the (here missing) file."""
+        updater = LinkUpdater(project_root=str(temp_project_dir))
+        file_path = "docs/index.md"
+        outer = self._make_ref(file_path, 1, 4, 21, "tools/report.txt/old.md")
+        inner = self._make_ref(file_path, 1, 15, 21, "old.md")
+        other = self._make_ref(file_path, 2, 0, 9, "other.txt")
+
+        planned = updater.plan_replacements(
+            file_path,
+            [
+                (outer, "docs/tools/report.txt/old.md", "docs/tools/report.txt/new.md"),
+                (inner, "docs/old.md", "docs/new.md"),
+                (other, "docs/old.md", "docs/new.md"),
+            ],
+        )
+
+        assert planned == [(outer, "tools/report.txt/new.md")]
+        assert not (temp_project_dir / "docs").exists()
+
     def test_invalid_columns_fallback_no_unbounded_replace(self, temp_project_dir):
         """Secondary risk: when column positions are invalid, the fallback at
         `_replace_at_position` previously called the unbounded `line.replace(old,
@@ -1543,3 +2270,72 @@ class TestTrailingSlashPreservation:
 
         assert md_file.read_text(encoding="utf-8") == original, "no-op move rewrote the file"
         assert stats["files_updated"] == 0
+
+
+class TestFileEncodingRoundTrip:
+    """Files are read once with BOM/NUL sniffing and written back in their own encoding."""
+
+    def _update(self, temp_project_dir, test_file, content):
+        updater = LinkUpdater(str(temp_project_dir))
+        updater.set_backup_enabled(False)
+        column = content.index("old.md")
+        line = content[:column].count("\n") + 1
+        column -= content.rfind("\n", 0, column) + 1
+        ref = LinkReference(str(test_file), line, column, column + 6, "a", "old.md", "markdown")
+        return updater.update_references([ref], "old.md", "new.md")
+
+    def test_read_detects_bom_and_fallback_encodings(self, temp_project_dir):
+        from linkwatcher.utils import safe_file_read_with_encoding
+
+        utf16 = temp_project_dir / "utf16.md"
+        utf16.write_bytes(b"\xff\xfe" + "a\r\nb".encode("utf-16-le"))
+        latin = temp_project_dir / "latin.md"
+        latin.write_bytes("caf\xe9\n".encode("latin-1"))
+        plain = temp_project_dir / "plain.md"
+        plain.write_text("ok\n", encoding="utf-8")
+
+        assert safe_file_read_with_encoding(str(utf16)) == ("\ufeffa\nb", "utf-16-le")
+        assert safe_file_read_with_encoding(str(latin)) == ("caf\xe9\n", "latin-1")
+        assert safe_file_read_with_encoding(str(plain)) == ("ok\n", "utf-8")
+
+    def test_read_rejects_binary_content(self, temp_project_dir):
+        from linkwatcher.utils import BinaryFileError, safe_file_read
+
+        binary = temp_project_dir / "image.md"
+        binary.write_bytes(b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR")
+
+        with pytest.raises(BinaryFileError):
+            safe_file_read(str(binary))
+
+    def test_latin1_file_is_rewritten_as_latin1(self, temp_project_dir):
+        test_file = temp_project_dir / "doc.md"
+        content = "# Caf\xe9\n\nSee [a](old.md).\n"
+        test_file.write_bytes(content.encode("latin-1"))
+
+        stats = self._update(temp_project_dir, test_file, content)
+
+        assert stats["files_updated"] == 1
+        assert test_file.read_bytes() == content.replace("old.md", "new.md").encode("latin-1")
+
+    def test_utf16_file_keeps_encoding_and_bom(self, temp_project_dir):
+        test_file = temp_project_dir / "doc.md"
+        content = "# Doc\n\nSee [a](old.md).\n"
+        test_file.write_bytes(content.encode("utf-16"))
+
+        stats = self._update(temp_project_dir, test_file, content)
+
+        assert stats["files_updated"] == 1
+        assert test_file.read_bytes() == content.replace("old.md", "new.md").encode("utf-16")
+
+    def test_journal_entry_records_encoding(self, temp_project_dir):
+        test_file = temp_project_dir / "doc.md"
+        original = "\xe9 [a](old.md)\n"
+        test_file.write_bytes(original.replace("old", "new").encode("latin-1"))
+        journal = UpdateJournal(str(temp_project_dir / "journal.jsonl"))
+        entry = UpdateJournal.make_entry(
+            str(test_file), original, original.replace("old", "new"), "latin-1"
+        )
+
+        assert entry["encoding"] == "latin-1"
+        assert journal.restore(entry, forward=False) == "applied"
+        assert test_file.read_bytes() == original.encode("latin-1")
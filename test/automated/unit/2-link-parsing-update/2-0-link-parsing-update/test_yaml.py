@@ -7,6 +7,7 @@ Implements YP test cases from comprehensive test documentation.
 
 import pytest
 
+from linkwatcher.link_types import LinkType
 from linkwatcher.parsers.yaml_parser import YamlParser
 
 pytestmark = [
@@ -629,3 +630,35 @@ class TestYamlParserCompoundStrings:
         assert all(
             "generic" not in lt for lt in link_types
         ), f"Should not fall back to GenericParser; got link_types: {link_types}"
+
+
+class TestYamlParserNodePositions:
+    """Scalars are located by their composed start marks, not a text search."""
+
+    def test_value_position_ignores_earlier_mentions(self):
+        """A mapping key spelling the same path must not capture the value's position."""
+        parser = YamlParser()
+        content = "config/app.yaml: enabled\nsource: config/app.yaml\n"
+        refs = [
+            r for r in parser.parse_content(content, "c.yaml") if r.link_target == "config/app.yaml"
+        ]
+        assert [(r.line_number, r.column_start, r.column_end) for r in refs] == [(2, 8, 23)]
+
+    def test_quoted_value_column_skips_the_quote(self):
+        parser = YamlParser()
+        refs = parser.parse_content("a:\n  - 'docs/guide.md'\n  - \"src/app\"\n", "c.yaml")
+        assert [(r.line_number, r.column_start, r.link_target) for r in refs] == [
+            (2, 5, "docs/guide.md"),
+            (3, 5, "src/app"),
+        ]
+
+    def test_aliased_value_is_reported_once(self):
+        parser = YamlParser()
+        content = "base: &b docs/base.md\ncopy: *b\n"
+        refs = parser.parse_content(content, "c.yaml")
+        assert [(r.line_number, r.link_target) for r in refs] == [(1, "docs/base.md")]
+
+    def test_custom_tags_fall_back_to_generic_parsing(self):
+        parser = YamlParser()
+        refs = parser.parse_content('template: !Include "templates/base.yaml"\n', "c.yaml")
+        assert [r.link_type for r in refs] == [LinkType.GENERIC_QUOTED]
@@ -128,9 +128,7 @@ def main():
                 f"  PASS: Directory routed to pending_dir_moves "
                 f"({pending.total_expected} files buffered)"
             )
-            # Clean up timer
-            if pending.max_timer:
-                pending.max_timer.cancel()
+            handler._dir_move_detector.stop()
         else:
             # After deleting the assessment file above, only the directory
             # itself would be checked. If no files remain, it goes to